@@ -5,11 +5,13 @@ from django.contrib.auth import views as auth_views
 
 from users.models import User
 from users.admin import CustomUserAdmin
-from management.models import Center, Shipper, Courier, Product, SalesChannel
+from management.models import Center, Shipper, Courier, Product, SalesChannel, ChannelSkuMapping
+from management.admin import ChannelSkuMappingAdmin
 # [수정] stock.models에서 더 이상 사용하지 않는 WarehouseLayout를 import 목록에서 삭제합니다.
-from stock.models import StockMovement, Location
-from orders.models import Order, OrderItem
-from orders.admin import OrderAdmin
+from stock.models import StockMovement, StockBalance, Location
+from stock.admin import StockMovementAdmin
+from orders.models import Order, OrderItem, OrderImportJob, OrderErrorDetail, DailyOrderStat
+from orders.admin import OrderAdmin, OrderErrorDetailAdmin
 
 class WMSAdminSite(admin.AdminSite):
     def get_urls(self):
@@ -26,9 +28,14 @@ wms_admin_site.register(Shipper)
 wms_admin_site.register(Courier)
 wms_admin_site.register(Product)
 wms_admin_site.register(SalesChannel)
+wms_admin_site.register(ChannelSkuMapping, ChannelSkuMappingAdmin)
 wms_admin_site.register(Order, OrderAdmin)
+wms_admin_site.register(OrderImportJob)
+wms_admin_site.register(OrderErrorDetail, OrderErrorDetailAdmin)
+wms_admin_site.register(DailyOrderStat)
 
 # Stock 앱 모델들을 등록합니다.
-wms_admin_site.register(StockMovement)
+wms_admin_site.register(StockMovement, StockMovementAdmin)
 wms_admin_site.register(Location) 
+wms_admin_site.register(StockBalance)
 # [삭제] WarehouseLayout 등록 코드를 삭제합니다.
\ No newline at end of file
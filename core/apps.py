@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
-    verbose_name = '코어' # 관리자 페이지에 표시될 이름
\ No newline at end of file
+    verbose_name = '코어' # 관리자 페이지에 표시될 이름
+
+    def ready(self):
+        # [추가] 센터 변경 시 공통 참조 데이터 캐시 무효화
+        from core import signals  # noqa: F401
@@ -0,0 +1,155 @@
+# core/cache.py
+"""
+하위 시스템별 캐시 이름공간 (filters, products, dashboards, stock)
+
+- 실제 저장소는 settings.CACHES['default'] (WMS_CACHE_BACKEND 환경 변수로 locmem/file/redis 선택)
+- 키는 '이름공간:버전:키' 형태입니다. bump()는 버전만 바꾸어 이름공간 전체를 한 번에 무효화하며,
+  캐시를 공유하는 모든 워커에 바로 반영됩니다. (옛 버전의 키는 시간 제한이 지나면 사라짐)
+- 시간 제한은 이름공간마다 settings.CACHE_NAMESPACE_TIMEOUTS(초)를 따릅니다.
+- get()/get_or_set()의 적중/실패 횟수를 셉니다. 프로세스 안에서 모았다가 STATS_FLUSH_EVERY 번마다
+  공유 캐시의 카운터에 더하므로 cache_stats 명령과 /api/cache-stats/ 에서 모든 워커의 합계를 볼 수 있습니다.
+
+사용 예:
+    from core.cache import dashboards_cache
+    data = dashboards_cache.get_or_set(f'order_chart:{start}:{end}', build_chart)
+    dashboards_cache.bump()   # 집계가 바뀌면 대시보드 캐시 전체 무효화
+"""
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+NAMESPACES = ('filters', 'products', 'dashboards', 'stock')
+
+_MISSING = object()
+
+
+class CacheNamespace:
+    """이름공간 하나의 버전 관리와 적중/실패 카운터"""
+
+    STATS_FLUSH_EVERY = 50
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._pending = {'hits': 0, 'misses': 0}
+
+    # --- 키와 버전 ---
+
+    def _version(self) -> str:
+        version_key = f"{self.name}:version"
+        version = cache.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            # 다른 프로세스가 먼저 정한 버전이 있으면 그것을 따릅니다.
+            if not cache.add(version_key, version, None):
+                version = cache.get(version_key, version)
+        return version
+
+    def key(self, key: str) -> str:
+        return f"{self.name}:{self._version()}:{key}"
+
+    def _timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            return settings.CACHE_NAMESPACE_TIMEOUTS.get(self.name, 300)
+        return timeout
+
+    # --- 조회/저장 ---
+
+    def get(self, key: str, default=None, count: bool = True):
+        """
+        Args:
+            count: False면 적중/실패 횟수에 넣지 않습니다. (버전 도장처럼 매번 읽는 내부 값)
+        """
+        value = cache.get(self.key(key), _MISSING)
+        if count:
+            self.record(value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value, timeout=DEFAULT_TIMEOUT):
+        """timeout=None 이면 만료되지 않습니다. (bump() 전까지 유지)"""
+        cache.set(self.key(key), value, self._timeout(timeout))
+
+    def add(self, key: str, value, timeout=DEFAULT_TIMEOUT) -> bool:
+        """키가 없을 때만 저장합니다. (저장했으면 True)"""
+        return cache.add(self.key(key), value, self._timeout(timeout))
+
+    def get_or_set(self, key: str, build, timeout=DEFAULT_TIMEOUT):
+        """캐시에 없으면 build()의 결과를 저장하고 반환합니다. (None은 캐시하지 않음)"""
+        full_key = self.key(key)
+        value = cache.get(full_key, _MISSING)
+        self.record(value is not _MISSING)
+        if value is _MISSING or value is None:
+            value = build()
+            if value is not None:
+                cache.set(full_key, value, self._timeout(timeout))
+        return value
+
+    def delete(self, key: str):
+        cache.delete(self.key(key))
+
+    def bump(self):
+        """이름공간의 모든 키를 무효화합니다."""
+        cache.set(f"{self.name}:version", uuid.uuid4().hex, None)
+
+    # --- 적중/실패 카운터 ---
+
+    def record(self, hit: bool):
+        """적중/실패를 기록합니다. (캐시를 직접 다루는 코드에서 자체 적중 여부를 기록할 때도 사용)"""
+        with self._lock:
+            self._pending['hits' if hit else 'misses'] += 1
+            if self._pending['hits'] + self._pending['misses'] < self.STATS_FLUSH_EVERY:
+                return
+            pending, self._pending = self._pending, {'hits': 0, 'misses': 0}
+        self._flush(pending)
+
+    def _flush(self, pending: dict):
+        for field, delta in pending.items():
+            if not delta:
+                continue
+            stats_key = f"{self.name}:stats:{field}"
+            try:
+                cache.incr(stats_key, delta)
+            except ValueError:
+                # 카운터가 아직 없거나 만료된 경우
+                if not cache.add(stats_key, delta, None):
+                    cache.incr(stats_key, delta)
+
+    def flush_stats(self):
+        """이 프로세스에서 모은 횟수를 공유 카운터에 바로 반영합니다."""
+        with self._lock:
+            pending, self._pending = self._pending, {'hits': 0, 'misses': 0}
+        self._flush(pending)
+
+    def stats(self) -> dict:
+        """모든 워커의 적중/실패 합계 {'hits', 'misses', 'hit_rate'}"""
+        self.flush_stats()
+        hits = cache.get(f"{self.name}:stats:hits", 0)
+        misses = cache.get(f"{self.name}:stats:misses", 0)
+        total = hits + misses
+        return {'hits': hits, 'misses': misses, 'hit_rate': round(hits / total * 100, 1) if total else None}
+
+    def reset_stats(self):
+        with self._lock:
+            self._pending = {'hits': 0, 'misses': 0}
+        cache.delete_many([f"{self.name}:stats:hits", f"{self.name}:stats:misses"])
+
+
+namespaces = {name: CacheNamespace(name) for name in NAMESPACES}
+
+filters_cache = namespaces['filters']
+products_cache = namespaces['products']
+dashboards_cache = namespaces['dashboards']
+stock_cache = namespaces['stock']
+
+
+def bump_on_commit(namespace: CacheNamespace):
+    """
+    지금 무효화하고 커밋 후 한 번 더 무효화합니다.
+    (커밋 전에 다른 요청이 옛 데이터로 다시 채운 캐시를 버리기 위함)
+    """
+    namespace.bump()
+    transaction.on_commit(namespace.bump)
@@ -0,0 +1,49 @@
+# core/lookups.py
+"""
+요청마다 필요한 작은 참조 데이터(센터/화주사 목록)의 캐시
+
+QuerySet 대신 평가된 (id, name) 튜플만 캐시에 저장하므로 캐시에서 꺼낸 뒤 DB를 다시 조회하지 않습니다.
+값은 core.cache 의 'filters' 이름공간에 저장하고, 원본이 바뀌면 core.signals 에서 이름공간 버전을 바꿉니다.
+캐시를 공유하는 다른 프로세스도 다음 조회 때 새 버전의 키를 읽으므로 즉시 반영되며,
+시그널이 없는 일괄 변경(QuerySet.update 등)은 CACHE_NAMESPACE_TIMEOUTS['filters'](초)이 지나면 반영됩니다.
+"""
+from typing import NamedTuple, Optional, Tuple
+
+from management.models import Center, Shipper
+from .cache import filters_cache
+
+
+class LookupItem(NamedTuple):
+    """필터 목록의 한 항목 (템플릿에서 item.id / item.name 으로 사용)"""
+    id: int
+    name: str
+
+
+def center_choices() -> Tuple[LookupItem, ...]:
+    """전체 센터 목록 (등록 순서)"""
+    return filters_cache.get_or_set('centers', lambda: tuple(
+        LookupItem(*row) for row in Center.objects.order_by('id').values_list('id', 'name')
+    ))
+
+
+def center_names() -> frozenset:
+    """등록된 센터 이름 집합 (캐시에 있으면 DB를 조회하지 않음)"""
+    return frozenset(center.name for center in center_choices())
+
+
+def shipper_choices(center_name: Optional[str] = '') -> Tuple[LookupItem, ...]:
+    """화주사 목록 (center_name이 있으면 그 센터 소속만, 없는 센터면 빈 목록)"""
+    center_id = None
+    if center_name:
+        center_id = next((center.id for center in center_choices() if center.name == center_name), None)
+        if center_id is None:
+            return ()
+
+    def build():
+        shippers = Shipper.objects.order_by('id')
+        if center_id is not None:
+            shippers = shippers.filter(center_id=center_id)
+        return tuple(LookupItem(*row) for row in shippers.values_list('id', 'name'))
+
+    # 센터 이름에는 공백 등 캐시 키에 쓸 수 없는 문자가 있을 수 있으므로 id로 구분합니다.
+    return filters_cache.get_or_set(f"shippers:{center_id or 'all'}", build)
@@ -0,0 +1,44 @@
+"""
+Django Management Command: 캐시 이름공간별 적중/실패 현황 확인 및 무효화
+
+사용법:
+    python manage.py cache_stats                     # 이름공간별 적중/실패 횟수와 적중률
+    python manage.py cache_stats --reset             # 출력 후 카운터 초기화
+    python manage.py cache_stats --clear dashboards  # 해당 이름공간의 캐시 전체 무효화 (여러 개 지정 가능)
+
+설명:
+    file/redis 캐시(WMS_CACHE_BACKEND)를 쓰면 모든 워커의 합계가 보입니다.
+    locmem 캐시는 프로세스마다 따로이므로 이 명령을 실행한 프로세스의 값만 보입니다.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.cache import NAMESPACES, namespaces
+
+
+class Command(BaseCommand):
+    help = '캐시 이름공간별 적중/실패 현황을 출력하거나 이름공간 캐시를 무효화합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='출력 후 적중/실패 카운터를 초기화합니다.')
+        parser.add_argument('--clear', nargs='+', choices=NAMESPACES, metavar='NAMESPACE',
+                            help=f"해당 이름공간의 캐시를 무효화합니다. ({', '.join(NAMESPACES)})")
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            for name in options['clear']:
+                namespaces[name].bump()
+            self.stdout.write(self.style.SUCCESS(f"🧹 캐시 무효화 완료: {', '.join(options['clear'])}"))
+            return
+
+        self.stdout.write(f"캐시 저장소: {settings.CACHES['default']['BACKEND']} ({settings.CACHES['default'].get('LOCATION', '')})")
+        for name in NAMESPACES:
+            stats = namespaces[name].stats()
+            hit_rate = '-' if stats['hit_rate'] is None else f"{stats['hit_rate']}%"
+            self.stdout.write(f"{name:<12} 적중 {stats['hits']:>8}  실패 {stats['misses']:>8}  적중률 {hit_rate}")
+            if options['reset']:
+                namespaces[name].reset_stats()
+
+        message = '✅ 카운터를 초기화했습니다.' if options['reset'] else '✅ 캐시 현황 출력 완료'
+        self.stdout.write(self.style.SUCCESS(message))
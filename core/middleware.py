@@ -1,34 +1,51 @@
 # core/middleware.py
-from management.models import Center # management 앱의 모델을 가져옴
+from core.lookups import center_names # [수정] 센터 존재 확인은 캐시된 센터 이름 집합으로 처리
 
 class FilterPersistenceMiddleware:
     """
     HTTP 요청/응답 과정에서 필터 값을 세션에 저장하여 유지하는 미들웨어.
     사용자가 센터 필터를 변경하면, 화주사 필터를 초기화합니다.
     또한, 세션에 저장된 센터가 DB에 존재하지 않으면 세션 값을 초기화합니다.
+
+    [수정] 확인한 필터 값은 request.selected_center / request.selected_shipper 에 담아 두므로
+    뷰와 context processor는 세션이나 DB를 다시 읽지 않고 사용할 수 있습니다.
+    센터 이름은 core.lookups 캐시에서 확인하므로 평소에는 필터 처리에 DB 조회가 없습니다.
     """
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        selected_center = request.session.get('selected_center')
+        session = request.session
+        selected_center = session.get('selected_center')
+        # 캐시 조회는 요청마다 한 번만 하고 아래에서 다시 사용합니다.
+        known_centers = center_names()
 
-        if selected_center and not Center.objects.filter(name=selected_center).exists():
-            request.session['selected_center'] = ''
-            request.session['selected_shipper'] = ''
+        if selected_center and selected_center not in known_centers:
+            self._store(session, 'selected_center', '')
+            self._store(session, 'selected_shipper', '')
 
         if 'center_filter' in request.GET:
             newly_selected_center = request.GET.get('center_filter')
-            
+
             # 선택된 센터가 변경되면 화주사 필터도 초기화
-            if request.session.get('selected_center') != newly_selected_center:
-                request.session['selected_shipper'] = ''
+            if session.get('selected_center') != newly_selected_center:
+                self._store(session, 'selected_shipper', '')
 
-            request.session['selected_center'] = newly_selected_center
+            self._store(session, 'selected_center', newly_selected_center)
 
         # GET 파라미터에 shipper_filter가 있으면 세션에 저장
         if 'shipper_filter' in request.GET:
-            request.session['selected_shipper'] = request.GET.get('shipper_filter')
+            self._store(session, 'selected_shipper', request.GET.get('shipper_filter'))
+
+        selected_center = session.get('selected_center') or ''
+        request.selected_center = selected_center if selected_center in known_centers else ''
+        request.selected_shipper = session.get('selected_shipper') or ''
 
         response = self.get_response(request)
-        return response
\ No newline at end of file
+        return response
+
+    @staticmethod
+    def _store(session, key, value):
+        # 값이 같으면 세션을 수정하지 않아 요청마다 세션이 다시 저장되지 않도록 합니다.
+        if session.get(key) != value:
+            session[key] = value
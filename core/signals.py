@@ -0,0 +1,18 @@
+# core/signals.py
+"""
+공통 참조 데이터 캐시(core.lookups)를 원본 데이터 변경에 맞춰 무효화하는 시그널 (CoreConfig.ready()에서 등록)
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from management.models import Center, Shipper
+from .cache import bump_on_commit, filters_cache
+
+
+@receiver(post_save, sender=Center)
+@receiver(post_delete, sender=Center)
+@receiver(post_save, sender=Shipper)
+@receiver(post_delete, sender=Shipper)
+def invalidate_filters_on_change(sender, **kwargs):
+    # 센터/화주사 목록은 작으므로 어느 쪽이 바뀌어도 'filters' 이름공간 전체를 무효화합니다.
+    bump_on_commit(filters_cache)
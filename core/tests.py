@@ -0,0 +1,172 @@
+import importlib.util
+import os
+import runpy
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+import wms_project.settings
+
+from management.models import Center, Shipper
+from .context_processors import filters
+from .lookups import LookupItem, center_names
+from .middleware import FilterPersistenceMiddleware
+
+
+class FilterPersistenceMiddlewareTests(TestCase):
+    """
+    세션의 센터 필터는 캐시된 센터 이름 집합으로 확인하고, 없는 센터는 화주사 필터와 함께 초기화합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Center.objects.create(name='필터센터', address='주소')
+
+    def setUp(self):
+        cache.clear()
+        self.middleware = FilterPersistenceMiddleware(lambda request: HttpResponse())
+
+    def _request(self, session, **params):
+        request = RequestFactory().get('/', params)
+        request.session = session
+        self.middleware(request)
+        return request
+
+    def test_unknown_center_is_dropped_with_shipper(self):
+        session = {'selected_center': '없는센터', 'selected_shipper': '화주'}
+        request = self._request(session)
+        self.assertEqual((request.selected_center, request.selected_shipper), ('', ''))
+        self.assertEqual(session, {'selected_center': '', 'selected_shipper': ''})
+
+    def test_known_center_is_checked_from_cache(self):
+        self._request({}, center_filter='필터센터')
+        session = {'selected_center': '필터센터', 'selected_shipper': '화주'}
+        with self.assertNumQueries(0):
+            request = self._request(session)
+        self.assertEqual((request.selected_center, request.selected_shipper), ('필터센터', '화주'))
+
+    def test_center_names_are_read_once_per_request(self):
+        session = {'selected_center': '필터센터'}
+        with mock.patch('core.middleware.center_names', wraps=center_names) as names:
+            request = self._request(session, center_filter='필터센터')
+        names.assert_called_once()
+        self.assertEqual(request.selected_center, '필터센터')
+
+    def test_changing_center_resets_shipper(self):
+        session = {'selected_center': '', 'selected_shipper': '화주'}
+        request = self._request(session, center_filter='필터센터')
+        self.assertEqual((request.selected_center, request.selected_shipper), ('필터센터', ''))
+
+
+class FiltersContextProcessorTests(TestCase):
+    """
+    필터 목록은 평가된 (id, name) 튜플로 캐시하고, 센터/화주사가 바뀌면 커밋 후 바로 새 목록을 보여 줍니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.center = Center.objects.create(name='목록센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=cls.center, name='목록화주')
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get('/')
+        self.request.session = {}
+        self.request.selected_center = '목록센터'
+        self.request.selected_shipper = ''
+
+    def _shippers(self):
+        return tuple(filters(self.request)['shippers'])
+
+    def test_lists_are_cached_as_tuples(self):
+        self.assertEqual(self._shippers(), (LookupItem(self.shipper.pk, '목록화주'),))
+        with self.assertNumQueries(0):
+            context = filters(self.request)
+            self.assertEqual(tuple(context['centers']), (LookupItem(self.center.pk, '목록센터'),))
+            self.assertEqual(len(self._shippers()), 1)
+
+    def test_new_shipper_shows_up_after_commit(self):
+        self._shippers()
+        with self.captureOnCommitCallbacks(execute=True):
+            added = Shipper.objects.create(center=self.center, name='추가화주')
+        self.assertEqual([item.name for item in self._shippers()], ['목록화주', '추가화주'])
+        with self.captureOnCommitCallbacks(execute=True):
+            added.delete()
+        self.assertEqual([item.name for item in self._shippers()], ['목록화주'])
+
+
+class DatabaseProfileTests(SimpleTestCase):
+    """
+    WMS_DB_ENGINE 환경 변수에 따라 SQLite(WAL, IMMEDIATE) 또는 PostgreSQL 연결 설정을 만듭니다.
+    """
+
+    def _databases(self, **env):
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(wms_project.settings.__file__)['DATABASES']['default']
+
+    def test_sqlite_profile_uses_wal_and_immediate_transactions(self):
+        database = self._databases(WMS_DB_ENGINE='sqlite', WMS_SQLITE_BUSY_TIMEOUT='5')
+        self.assertEqual(database['ENGINE'], 'django.db.backends.sqlite3')
+        self.assertEqual(database['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertEqual(database['OPTIONS']['timeout'], 5)
+        self.assertIn('journal_mode=WAL', database['OPTIONS']['init_command'])
+
+    def test_postgres_profile_reads_connection_from_env(self):
+        database = self._databases(WMS_DB_ENGINE='postgres', WMS_DB_NAME='wms_prod', WMS_DB_HOST='db', WMS_DB_CONN_MAX_AGE='30')
+        self.assertEqual(database['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual((database['NAME'], database['HOST'], database['CONN_MAX_AGE']), ('wms_prod', 'db', 30))
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self._databases(WMS_DB_ENGINE='mysql')
+
+
+@unittest.skipIf(os.name == 'nt', 'gunicorn은 Windows를 지원하지 않음')
+class GunicornSchedulerElectionTests(SimpleTestCase):
+    """
+    gunicorn.conf.py: 스케줄러 파일 잠금을 먼저 잡은 워커 하나만 스케줄러를 실행하고, 그 워커가 끝나면 다음 워커가 이어받습니다.
+    """
+
+    def setUp(self):
+        lock_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(lock_dir.cleanup)
+        self.lock_path = os.path.join(lock_dir.name, 'scheduler.lock')
+        # 실제 스케줄러 스레드는 띄우지 않고 어느 워커가 시작/중지를 호출했는지만 확인합니다.
+        self.start_scheduler, self.stop_scheduler = mock.Mock(), mock.Mock()
+        scheduler = SimpleNamespace(start_scheduler=self.start_scheduler, stop_scheduler=self.stop_scheduler)
+        patcher = mock.patch.dict(sys.modules, {'orders.scheduler': scheduler})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _worker(self):
+        # 워커 프로세스마다 설정 모듈을 따로 불러오는 것과 같도록 매번 새로 불러옵니다.
+        spec = importlib.util.spec_from_file_location('gunicorn_conf', os.path.join(settings.BASE_DIR, 'gunicorn.conf.py'))
+        conf = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(conf)
+        conf.SCHEDULER_LOCK_PATH = self.lock_path
+        worker = SimpleNamespace(pid=os.getpid(), log=mock.Mock())
+        conf.post_worker_init(worker)
+        self.addCleanup(lambda: conf._scheduler_lock and conf._scheduler_lock.close())
+        return conf, worker
+
+    def test_only_one_worker_runs_scheduler_until_it_exits(self):
+        first, first_worker = self._worker()
+        self._worker()
+        self.assertEqual(self.start_scheduler.call_count, 1)
+
+        first.worker_exit(None, first_worker)
+        first._scheduler_lock.close()  # 워커 프로세스 종료로 잠금이 풀림
+        first._scheduler_lock = None
+        self.stop_scheduler.assert_called_once()
+
+        self._worker()
+        self.assertEqual(self.start_scheduler.call_count, 2)
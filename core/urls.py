@@ -7,4 +7,6 @@ app_name = 'core'
 urlpatterns = [
     # 대시보드 URL: 웹사이트의 루트 경로('')에 해당합니다.
     path('', views.dashboard, name='dashboard'),
+    # [추가] 운영자용 캐시 적중/실패 현황
+    path('api/cache-stats/', views.cache_stats_api, name='cache_stats_api'),
 ]
\ No newline at end of file
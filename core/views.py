@@ -1,6 +1,11 @@
 # core/views.py
+from django.conf import settings
 from django.shortcuts import render
+from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.contrib.admin.views.decorators import staff_member_required
+
+from .cache import NAMESPACES, namespaces
 
 @login_required
 def dashboard(request):
@@ -12,4 +17,14 @@ def dashboard(request):
         'page_title': '홈',
         'active_menu': 'dashboard' # 현재 메뉴 활성화를 위한 값 (사용하지 않을 경우 삭제 가능)
     }
-    return render(request, 'core/dashboard.html', context)
\ No newline at end of file
+    return render(request, 'core/dashboard.html', context)
+
+@staff_member_required(login_url='wms_admin:login')
+def cache_stats_api(request):
+    """
+    [신규] 운영자용 캐시 이름공간별 적중/실패 현황 API (스태프 계정만)
+    """
+    return JsonResponse({
+        'backend': settings.CACHES['default']['BACKEND'],
+        'namespaces': {name: namespaces[name].stats() for name in NAMESPACES},
+    })
@@ -0,0 +1,74 @@
+"""
+gunicorn 설정 (Linux/Mac 운영 서버용, Windows는 run_wifi.py가 waitress로 실행)
+
+실행:
+    python run_wifi.py                 # 접속 주소 안내 + 이 설정으로 gunicorn 실행
+    gunicorn -c gunicorn.conf.py       # 직접 실행
+
+환경 변수:
+    WMS_PORT     접속 포트 (기본 8000)
+    WMS_WORKERS  워커 프로세스 수 (기본 CPU 코어 수 x 2 + 1)
+    WMS_THREADS  워커당 요청 처리 스레드 수 (기본 4)
+    WMS_PRELOAD  1이면 마스터에서 앱을 한 번 불러온 뒤 워커를 만듭니다. (기본 1: 워커 시작이 빠르고 메모리 공유)
+
+재시작:
+    kill -HUP <마스터 pid>
+        새 워커를 띄운 뒤 기존 워커는 처리 중인 요청을 마치고(graceful_timeout) 종료합니다.
+        WMS_PRELOAD=1이면 코드는 마스터가 불러 둔 것을 그대로 쓰므로, 코드를 바꾼 뒤에는
+        WMS_PRELOAD=0으로 실행하거나 서버를 다시 시작하세요.
+"""
+import fcntl
+import multiprocessing
+import os
+import tempfile
+
+wsgi_app = 'wms_project.wsgi:application'
+bind = f"0.0.0.0:{os.environ.get('WMS_PORT', '8000')}"
+
+# 요청 대부분이 DB 대기이므로 프로세스 x 스레드(gthread)로 동시 처리 수를 늘립니다.
+workers = int(os.environ.get('WMS_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('WMS_THREADS', '4'))
+preload_app = os.environ.get('WMS_PRELOAD', '1') == '1'
+
+# 요청 제한 시간(초): 대용량 엑셀은 백그라운드 작업으로 넘어가지만 송장 출고 등 긴 쓰기 트랜잭션을 고려합니다.
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+# 메모리 누수에 대비해 일정 요청 수마다 워커를 교체합니다. (동시에 교체되지 않도록 무작위 편차)
+max_requests = 2000
+max_requests_jitter = 200
+
+accesslog = '-'
+errorlog = '-'
+
+# 주문 수집/엑셀 업로드 스케줄러는 워커 하나에서만 실행해야 합니다. (여러 개면 같은 주문을 중복 수집)
+# 파일 잠금을 먼저 잡은 워커가 스케줄러를 실행하고, 그 워커가 교체되면 잠금이 풀려 다음에 시작하는 워커가 이어받습니다.
+SCHEDULER_LOCK_PATH = os.path.join(tempfile.gettempdir(), 'wms-scheduler.lock')
+_scheduler_lock = None
+
+
+def post_fork(server, worker):
+    # preload 시 마스터에서 열린 DB 연결을 워커들이 함께 쓰지 않도록 닫습니다.
+    from django.db import connections
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    global _scheduler_lock
+    lock = open(SCHEDULER_LOCK_PATH, 'w')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return
+    _scheduler_lock = lock  # 워커가 끝날 때까지 잠금을 유지합니다.
+    from orders.scheduler import start_scheduler
+    start_scheduler()
+    worker.log.info("주문 수집 스케줄러를 이 워커(pid %s)에서 실행합니다.", worker.pid)
+
+
+def worker_exit(server, worker):
+    if _scheduler_lock is not None:
+        from orders.scheduler import stop_scheduler
+        stop_scheduler()
@@ -1,6 +1,6 @@
 # management/admin.py
 from django.contrib import admin
-from .models import Center, Shipper, Courier, Product, SalesChannel
+from .models import Center, Shipper, Courier, Product, SalesChannel, ChannelSkuMapping
 
 # 이 파일은 비워두거나, 아래처럼 주석 처리합니다.
 # 실제 모델 등록은 wms_project/urls.py의 커스텀 AdminSite에서 직접 처리합니다.
@@ -8,4 +8,28 @@ from .models import Center, Shipper, Courier, Product, SalesChannel
 # admin.site.register(Shipper)
 # admin.site.register(Courier)
 # admin.site.register(Product)
-# admin.site.register(SalesChannel)
\ No newline at end of file
+# admin.site.register(SalesChannel)
+
+
+class ChannelSkuMappingAdmin(admin.ModelAdmin):
+    """
+    판매 채널 상품코드 매핑 관리
+    자동 매칭이 제안한 항목은 '확인 여부'로 걸러 검토하고, 맞는 항목만 확인하면 주문 처리에 적용됩니다.
+    """
+    list_display = ('external_code', 'channel', 'shipper', 'product', 'is_auto', 'is_confirmed', 'created_at')
+    list_filter = ('is_confirmed', 'is_auto', 'channel', 'shipper')
+    search_fields = ('external_code', 'product__name', 'product__barcode')
+    raw_id_fields = ('product',)
+    list_select_related = ('channel', 'shipper', 'product')
+    actions = ['confirm_mappings']
+
+    @admin.action(description='선택한 매핑 확인 (주문 처리에 적용)')
+    def confirm_mappings(self, request, queryset):
+        # 저장 시그널로 화주사별 상품 색인이 무효화되도록 건별로 저장합니다.
+        mappings = list(queryset.filter(is_confirmed=False))
+        for mapping in mappings:
+            mapping.is_confirmed = True
+            mapping.save(update_fields=['is_confirmed'])
+        self.message_user(
+            request, f'{len(mappings)}개 매핑을 확인했습니다. match_channel_skus 명령을 다시 실행하면 오류 주문이 재처리됩니다.'
+        )
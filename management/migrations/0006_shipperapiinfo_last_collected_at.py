@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0005_expand_shopping_mall_channels'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shipperapiinfo',
+            name='last_collected_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='마지막 수집 시각'),
+        ),
+    ]
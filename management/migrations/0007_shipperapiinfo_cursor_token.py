@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0006_shipperapiinfo_last_collected_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shipperapiinfo',
+            name='cursor_token',
+            field=models.CharField(blank=True, default='', max_length=500, verbose_name='수집 페이지 토큰'),
+        ),
+        migrations.AddField(
+            model_name='shipperapiinfo',
+            name='cursor_window_end',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='페이지 토큰 구간 끝 시각'),
+        ),
+    ]
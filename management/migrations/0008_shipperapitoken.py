@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0007_shipperapiinfo_cursor_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShipperApiToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_token', models.TextField(blank=True, verbose_name='액세스 토큰')),
+                ('expires_at', models.DateTimeField(blank=True, null=True, verbose_name='만료 시각')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='발급 시각')),
+                ('credential_fingerprint', models.CharField(blank=True, default='', max_length=64, verbose_name='인증 정보 지문')),
+                ('api_info', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='token', to='management.shipperapiinfo', verbose_name='화주사 API 정보')),
+            ],
+            options={
+                'verbose_name': '화주사 API 토큰',
+                'verbose_name_plural': '화주사 API 토큰',
+            },
+        ),
+    ]
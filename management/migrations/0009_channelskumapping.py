@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0008_shipperapitoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChannelSkuMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('external_code', models.CharField(max_length=100, verbose_name='채널 상품코드')),
+                ('is_auto', models.BooleanField(default=False, verbose_name='자동 매칭 여부')),
+                ('is_confirmed', models.BooleanField(default=True, verbose_name='확인 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일')),
+                ('channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sku_mappings', to='management.saleschannel', verbose_name='판매 채널')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sku_mappings', to='management.product', verbose_name='상품')),
+                ('shipper', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sku_mappings', to='management.shipper', verbose_name='화주사')),
+            ],
+            options={
+                'verbose_name': '채널 상품코드 매핑',
+                'verbose_name_plural': '채널 상품코드 매핑',
+                'constraints': [models.UniqueConstraint(fields=('shipper', 'channel', 'external_code'), name='unique_channel_sku_per_shipper')],
+            },
+        ),
+    ]
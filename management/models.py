@@ -56,6 +56,13 @@ class ShipperApiInfo(models.Model):
     extra_info = models.TextField(blank=True, default='{}', verbose_name='추가 정보(JSON)')
     
     is_active = models.BooleanField(default=True, verbose_name='활성화 여부')
+
+    # [추가] 증분 수집 커서: 저장(커밋)이 끝난 마지막 조회 구간의 끝 시각. 다음 수집은 이 시각부터 이어서 조회합니다.
+    last_collected_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 수집 시각')
+    # [추가] 조회 구간 중간에 수집이 멈춘 경우 이어서 조회할 페이지 토큰과 그 구간의 끝 시각
+    cursor_token = models.CharField(max_length=500, blank=True, default='', verbose_name='수집 페이지 토큰')
+    cursor_window_end = models.DateTimeField(null=True, blank=True, verbose_name='페이지 토큰 구간 끝 시각')
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -68,6 +75,26 @@ class ShipperApiInfo(models.Model):
         return f"{self.shipper.name} - {self.get_channel_type_display()}"
 
 
+class ShipperApiToken(models.Model):
+    """
+    [신규] 쇼핑몰 API 인증 토큰 캐시
+    access_key/secret_key로 발급받은 단기 토큰을 저장하여, 프로세스가 재시작되어도 만료 전까지 재사용합니다.
+    """
+    api_info = models.OneToOneField(ShipperApiInfo, on_delete=models.CASCADE, related_name='token', verbose_name='화주사 API 정보')
+    access_token = models.TextField(blank=True, verbose_name='액세스 토큰')
+    expires_at = models.DateTimeField(null=True, blank=True, verbose_name='만료 시각')
+    # [추가] 토큰을 발급받은 access_key/secret_key의 지문. 키를 바꾸면 지문이 달라져 저장된 토큰을 쓰지 않습니다.
+    credential_fingerprint = models.CharField(max_length=64, blank=True, default='', verbose_name='인증 정보 지문')
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name='발급 시각')
+
+    class Meta:
+        verbose_name = '화주사 API 토큰'
+        verbose_name_plural = '화주사 API 토큰'
+
+    def __str__(self):
+        return f"{self.api_info} (만료: {self.expires_at:%Y-%m-%d %H:%M})" if self.expires_at else str(self.api_info)
+
+
 class Courier(models.Model):
     """
     택배사 정보를 담는 모델
@@ -131,4 +158,36 @@ class SalesChannel(models.Model):
         verbose_name_plural = '판매 채널'
         
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+
+class ChannelSkuMapping(models.Model):
+    """
+    [신규] 판매 채널 상품코드 -> 상품 매핑
+    쇼핑몰이 보내는 상품코드(예: GM-PRD-1234)가 바코드/상품명과 다를 때 어떤 상품인지 지정합니다.
+    주문 수집/엑셀 업로드에서 바코드/상품명보다 먼저 적용됩니다.
+    자동 매칭(match_channel_skus)이 제안한 매핑은 확인 전(is_confirmed=False)으로 저장되며,
+    관리자 화면에서 확인하기 전까지는 주문 처리에 적용되지 않습니다.
+    """
+    channel = models.ForeignKey(SalesChannel, on_delete=models.CASCADE, related_name='sku_mappings', verbose_name='판매 채널')
+    shipper = models.ForeignKey(Shipper, on_delete=models.CASCADE, related_name='sku_mappings', verbose_name='화주사')
+    external_code = models.CharField(max_length=100, verbose_name='채널 상품코드')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='sku_mappings', verbose_name='상품')
+    is_auto = models.BooleanField(default=False, verbose_name='자동 매칭 여부')
+    is_confirmed = models.BooleanField(default=True, verbose_name='확인 여부')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록일')
+
+    class Meta:
+        verbose_name = '채널 상품코드 매핑'
+        verbose_name_plural = '채널 상품코드 매핑'
+        constraints = [
+            models.UniqueConstraint(fields=['shipper', 'channel', 'external_code'], name='unique_channel_sku_per_shipper'),
+        ]
+
+    def __str__(self):
+        return f'[{self.channel.name}] {self.external_code} -> {self.product.name}'
+
+    def clean(self):
+        from django.core.exceptions import ValidationError
+        if self.product_id and self.shipper_id and self.product.shipper_id != self.shipper_id:
+            raise ValidationError({'product': '화주사의 상품만 매핑할 수 있습니다.'})
\ No newline at end of file
@@ -1,6 +1,6 @@
 # orders/admin.py
 from django.contrib import admin
-from .models import Order, OrderItem
+from .models import Order, OrderItem, OrderErrorDetail
 
 class OrderItemInline(admin.TabularInline):
     """
@@ -18,5 +18,15 @@ class OrderAdmin(admin.ModelAdmin):
     list_filter = ('order_status', 'shipper', 'channel')
     search_fields = ('order_no', 'recipient_name')
 
+class OrderErrorDetailAdmin(admin.ModelAdmin):
+    """
+    [추가] 오류 주문의 오류 내용을 오류 코드/상품별로 조회하기 위한 설정
+    """
+    list_display = ('order', 'error_code', 'product_identifier', 'error_message', 'created_at')
+    list_filter = ('error_code',)
+    search_fields = ('product_identifier', 'order__order_no')
+    raw_id_fields = ('order',)
+    list_select_related = ('order', 'order__shipper')
+
 # wms_admin_site에 등록하기 위해 주석 처리 (프로젝트 admin.py에서 직접 등록)
 # admin.site.register(Order, OrderAdmin)
\ No newline at end of file
@@ -1,5 +1,6 @@
 # orders/api_clients/__init__.py
-from .base import BaseApiClient
+from .base import BaseApiClient, OrderPage
+from .transport import HttpTransport, TransportError, get_transport
 from .coupang import CoupangClient
 from .naver import NaverClient
 from .elevenst import ElevenSTClient
@@ -11,6 +12,10 @@ from .interpark import InterparkClient
 
 __all__ = [
     'BaseApiClient',
+    'OrderPage',
+    'HttpTransport',
+    'TransportError',
+    'get_transport',
     'CoupangClient',
     'NaverClient',
     'ElevenSTClient',
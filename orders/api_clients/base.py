@@ -1,26 +1,121 @@
 # orders/api_clients/base.py
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from abc import ABC
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+from .token_cache import credential_fingerprint, token_cache
+from .transport import HttpTransport, TransportResponse, get_transport
+
+
+class OrderPage(NamedTuple):
+    """
+    주문 조회 결과 한 페이지
+
+    orders: 정규화된 주문 목록 (fetch_orders 반환 형식과 동일)
+    next_token: 다음 페이지를 이어서 조회할 때 넘길 토큰 (마지막 페이지면 None)
+    """
+    orders: List[Dict[str, Any]]
+    next_token: Optional[str] = None
+
 
 class BaseApiClient(ABC):
     """
     모든 쇼핑몰 API 클라이언트의 기본 추상 클래스
+
+    하위 클래스는 fetch_orders(전체 목록 반환) 또는 fetch_order_pages(페이지 단위 반환) 중
+    하나 이상을 구현해야 합니다. 쇼핑몰 API가 페이지 조회를 지원하면 fetch_order_pages를 구현하여
+    수집기가 첫 페이지부터 바로 저장을 시작하고, 대량 조회에서도 메모리에 한 페이지씩만 올리도록 합니다.
     """
+
+    # 실제 API 연동 시 하위 클래스에서 지정합니다.
+    BASE_URL = ''
+    # 쇼핑몰 전체(모든 화주사 합산) / 인증 정보(access key)별 초당 최대 요청 수 (None이면 제한 없음)
+    CHANNEL_RATE_LIMIT: Optional[float] = None
+    CREDENTIAL_RATE_LIMIT: Optional[float] = None
+    # access_key/secret_key를 단기 토큰으로 교환해야 하는 쇼핑몰이면 True로 두고 issue_token을 구현합니다.
+    requires_token = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.fetch_orders is BaseApiClient.fetch_orders and cls.fetch_order_pages is BaseApiClient.fetch_order_pages:
+            raise TypeError(f"{cls.__name__}: fetch_orders 또는 fetch_order_pages 중 하나는 구현해야 합니다.")
     
-    def __init__(self, access_key: str, secret_key: str, extra_info: Dict[str, Any] = None):
+    def __init__(self, access_key: str, secret_key: str, extra_info: Dict[str, Any] = None,
+                 transport: Optional[HttpTransport] = None, api_info=None):
         """
         Args:
             access_key: API Access Key / Client ID
             secret_key: API Secret Key / Client Secret
             extra_info: 추가 인증 정보 (Vendor ID 등)
+            transport: HTTP 전송 객체 (기본: 프로세스 공용 연결 풀/속도 제한/재시도)
+            api_info: 이 클라이언트를 만든 ShipperApiInfo (인증 토큰을 DB에 캐시할 때 키로 사용)
         """
         self.access_key = access_key
         self.secret_key = secret_key
         self.extra_info = extra_info or {}
+        self.transport = transport or get_transport()
+        self.api_info = api_info
+
+    def issue_token(self) -> Tuple[str, int]:
+        """
+        인증 API를 호출하여 새 토큰을 발급받습니다. (requires_token인 클라이언트에서 구현)
+
+        Returns:
+            (액세스 토큰, 유효 시간(초))
+        """
+        raise NotImplementedError(f"{type(self).__name__}는 토큰 발급을 지원하지 않습니다.")
+
+    def get_access_token(self) -> str:
+        """
+        캐시된 토큰을 반환합니다. 없거나 곧 만료되면 issue_token()으로 한 번만 재발급합니다.
+        """
+        return token_cache.get(
+            self.issue_token,
+            api_info_id=getattr(self.api_info, 'pk', None),
+            key=(type(self).__name__, self.access_key),
+            fingerprint=credential_fingerprint(self.access_key, self.secret_key),
+        )
+
+    def invalidate_access_token(self):
+        token_cache.invalidate(
+            api_info_id=getattr(self.api_info, 'pk', None),
+            key=(type(self).__name__, self.access_key),
+            fingerprint=credential_fingerprint(self.access_key, self.secret_key),
+        )
+
+    def request(self, method: str, path: str, **kwargs) -> TransportResponse:
+        """
+        공용 전송 계층으로 쇼핑몰 API를 호출합니다.
+        쇼핑몰 전체와 인증 정보별 속도 제한이 함께 적용되고, 429/5xx 응답은 자동으로 재시도됩니다.
+
+        Args:
+            method: HTTP 메서드
+            path: BASE_URL 뒤에 붙일 경로 (또는 전체 URL)
+            **kwargs: HttpTransport.request의 params, headers, json_body, data
+        """
+        url = path if path.startswith(('http://', 'https://')) else f"{self.BASE_URL.rstrip('/')}/{path.lstrip('/')}"
+        if not self.requires_token:
+            return self.transport.request(method, url, rate_limits=self._rate_limits(), **kwargs)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers['Authorization'] = f'Bearer {self.get_access_token()}'
+        response = self.transport.request(method, url, headers=headers, rate_limits=self._rate_limits(), **kwargs)
+        if response.status == 401:
+            # 만료 전에 폐기된 토큰이면 한 번만 재발급 받아 다시 요청합니다.
+            self.invalidate_access_token()
+            headers['Authorization'] = f'Bearer {self.get_access_token()}'
+            response = self.transport.request(method, url, headers=headers, rate_limits=self._rate_limits(), **kwargs)
+        return response
+
+    def _rate_limits(self) -> list:
+        channel = type(self).__name__
+        limits = []
+        if self.CHANNEL_RATE_LIMIT:
+            limits.append((f'channel:{channel}', self.CHANNEL_RATE_LIMIT))
+        if self.CREDENTIAL_RATE_LIMIT:
+            limits.append((f'credential:{channel}:{self.access_key}', self.CREDENTIAL_RATE_LIMIT))
+        return limits
     
-    @abstractmethod
     def fetch_orders(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
         """
         지정된 기간의 주문을 조회합니다.
@@ -50,7 +145,26 @@ class BaseApiClient(ABC):
                 }
             ]
         """
-        pass
+        # 기본 구현: 모든 페이지를 이어 붙여 반환 (fetch_order_pages만 구현한 클라이언트용)
+        orders = []
+        for page in self.fetch_order_pages(start_date, end_date):
+            orders.extend(page.orders)
+        return orders
+
+    def fetch_order_pages(self, start_date: datetime, end_date: datetime, page_token: Optional[str] = None) -> Iterator[OrderPage]:
+        """
+        지정된 기간의 주문을 페이지 단위로 조회합니다.
+
+        Args:
+            start_date: 조회 시작 시간
+            end_date: 조회 종료 시간
+            page_token: 이전 조회가 중단된 페이지의 next_token (처음부터 조회하면 None)
+
+        Yields:
+            OrderPage(주문 목록, 다음 페이지 토큰)
+        """
+        # 기본 구현: 페이지 조회를 지원하지 않는 클라이언트는 fetch_orders 결과를 한 페이지로 반환
+        yield OrderPage(self.fetch_orders(start_date, end_date), None)
     
     def validate_credentials(self) -> bool:
         """
@@ -1,6 +1,6 @@
 # orders/api_clients/elevenst.py
 from .base import BaseApiClient
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from django.utils import timezone
 import random
@@ -10,7 +10,15 @@ import uuid
 class ElevenSTClient(BaseApiClient):
     """11번가 API 클라이언트 (Mock 구현)"""
     
+    # 인증 키를 단기 액세스 토큰으로 교환해서 사용
+    requires_token = True
+    
+    def issue_token(self) -> Tuple[str, int]:
+        """11번가 API 토큰 발급 (Mock)"""
+        return f'11ST-TOKEN-{uuid.uuid4().hex}', 60 * 60
+    
     def fetch_orders(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+        self.get_access_token()  # 캐시된 토큰 사용 (만료 임박 시에만 재발급)
         mock_orders = []
         num_orders = random.randint(0, 2)
         
@@ -1,6 +1,6 @@
 # orders/api_clients/naver.py
-from .base import BaseApiClient
-from typing import List, Dict, Any
+from .base import BaseApiClient, OrderPage
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timedelta
 from django.utils import timezone
 import random
@@ -10,8 +10,49 @@ import uuid
 class NaverClient(BaseApiClient):
     """네이버 스마트스토어 API 클라이언트 (Mock 구현)"""
     
-    def fetch_orders(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """네이버 스마트스토어 주문 조회 (Mock 데이터 반환)"""
+    # 커머스 API는 Client ID/Secret을 OAuth2 토큰(유효 3시간)으로 교환해서 사용
+    requires_token = True
+    # [추가] Mock 응답의 페이지 수 (페이지 이어받기 경로가 실제로 실행되도록 2페이지 이상)
+    MOCK_PAGE_COUNT = 2
+    
+    def issue_token(self) -> Tuple[str, int]:
+        """
+        네이버 커머스 API 토큰 발급 (Mock)
+        
+        실제 구현 시:
+        - POST /external/v1/oauth2/token (client_id, timestamp, client_secret_sign, grant_type=client_credentials)
+        """
+        return f'NAVER-TOKEN-{uuid.uuid4().hex}', 3 * 60 * 60
+    
+    def fetch_order_pages(self, start_date: datetime, end_date: datetime, page_token: Optional[str] = None) -> Iterator[OrderPage]:
+        """
+        [수정] 네이버 스마트스토어 주문 조회 (페이지 단위)
+        응답에 다음 페이지 위치(moreSequence)가 있으면 그 값을 다음 페이지 토큰으로 넘기고 이어서 조회합니다.
+        수집이 중간에 멈추면 수집기가 마지막으로 저장한 페이지의 토큰부터 다시 조회합니다.
+        """
+        while True:
+            orders, page_token = self._request_page(start_date, end_date, page_token)
+            yield OrderPage(orders, page_token)
+            if not page_token:
+                return
+
+    def _request_page(self, start_date: datetime, end_date: datetime,
+                      more_sequence: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        주문 한 페이지 조회 (Mock 데이터 반환)
+
+        실제 구현 시:
+        - GET /external/v1/pay-order/seller/product-orders/last-changed-statuses
+          (lastChangedFrom, lastChangedTo, moreSequence, limitCount)
+        - 응답의 more.moreSequence를 다음 페이지 토큰으로 반환 (마지막 페이지면 None)
+
+        Returns:
+            (주문 목록, 다음 페이지 토큰)
+        """
+        self.get_access_token()  # 캐시된 토큰 사용 (만료 임박 시에만 재발급)
+        # Mock의 moreSequence는 페이지 번호 문자열입니다. (첫 페이지는 토큰 없음)
+        page_no = int(more_sequence) if more_sequence and more_sequence.isdigit() else 0
+        next_sequence = str(page_no + 1) if page_no + 1 < self.MOCK_PAGE_COUNT else None
         mock_orders = []
         num_orders = random.randint(0, 2)
         
@@ -39,5 +80,5 @@ class NaverClient(BaseApiClient):
                 ]
             })
         
-        print(f"🔹 네이버 Mock API: {num_orders}건의 주문 생성 (오늘 날짜: {now.date()})")
-        return mock_orders
+        print(f"🔹 네이버 Mock API: {page_no + 1}페이지 {num_orders}건의 주문 생성 (오늘 날짜: {now.date()})")
+        return mock_orders, next_sequence
@@ -0,0 +1,114 @@
+# orders/api_clients/token_cache.py
+"""
+쇼핑몰 API 인증 토큰 캐시
+
+- 메모리: 프로세스 안에서는 DB 조회 없이 토큰을 재사용합니다.
+- DB(ShipperApiToken): 프로세스가 재시작되거나 여러 프로세스가 떠 있어도 만료 전까지 같은 토큰을 씁니다.
+- 단일 갱신(single-flight): 같은 API 정보의 토큰이 만료되면 한 스레드/프로세스만 재발급하고 나머지는 그 결과를 씁니다.
+  (프로세스 안에서는 키별 Lock, 프로세스 사이에서는 토큰 행의 select_for_update)
+- [추가] 캐시 키와 저장된 토큰에 인증 정보 지문(credential_fingerprint)을 함께 두어,
+  access_key/secret_key를 바꾸면 이전 키로 발급된 토큰을 쓰지 않고 바로 새로 발급합니다.
+"""
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+# 발급 함수: () -> (토큰, 유효 시간(초))
+TokenIssuer = Callable[[], Tuple[str, int]]
+
+
+def credential_fingerprint(access_key: str, secret_key: str) -> str:
+    """인증 정보의 지문 (키 원문 대신 해시만 캐시 키와 DB에 남깁니다)"""
+    return hashlib.sha256(f'{access_key}\0{secret_key}'.encode()).hexdigest()
+
+
+class TokenCache:
+    def __init__(self):
+        self._tokens: Dict[object, Tuple[str, datetime]] = {}
+        self._locks: Dict[object, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, issue: TokenIssuer, api_info_id: Optional[int] = None, key: object = None, fingerprint: str = '') -> str:
+        """
+        유효한 토큰을 반환하고, 없거나 곧 만료되면 issue()로 새로 발급합니다.
+
+        Args:
+            issue: 토큰 발급 함수 (실제 인증 API 호출)
+            api_info_id: ShipperApiInfo id (있으면 DB에도 저장하여 재시작 후에도 재사용)
+            key: api_info_id가 없을 때 쓸 메모리 캐시 키
+            fingerprint: 인증 정보 지문 (credential_fingerprint). 저장된 토큰의 지문과 다르면 새로 발급합니다.
+        """
+        cache_key = self._cache_key(api_info_id, key, fingerprint)
+        token = self._valid_memory_token(cache_key)
+        if token:
+            return token
+
+        with self._lock_for(cache_key):
+            # 기다리는 동안 다른 스레드가 이미 갱신했을 수 있습니다.
+            token = self._valid_memory_token(cache_key)
+            if token:
+                return token
+            if api_info_id:
+                token, expires_at = self._get_or_issue_persistent(api_info_id, issue, fingerprint)
+            else:
+                token, expires_at = self._issue(issue)
+            self._tokens[cache_key] = (token, expires_at)
+            return token
+
+    def invalidate(self, api_info_id: Optional[int] = None, key: object = None, fingerprint: str = ''):
+        """토큰이 거부(401)된 경우 캐시를 비워 다음 요청에서 새로 발급받게 합니다."""
+        self._tokens.pop(self._cache_key(api_info_id, key, fingerprint), None)
+        if api_info_id:
+            from management.models import ShipperApiToken
+            ShipperApiToken.objects.filter(api_info_id=api_info_id).update(expires_at=None)
+
+    def clear(self):
+        """메모리 캐시만 비웁니다. (DB에 저장된 토큰은 유지)"""
+        self._tokens.clear()
+
+    @staticmethod
+    def _cache_key(api_info_id, key, fingerprint):
+        return ('api_info', api_info_id, fingerprint) if api_info_id else (key, fingerprint)
+
+    def _lock_for(self, cache_key) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(cache_key, threading.Lock())
+
+    def _valid_memory_token(self, cache_key) -> Optional[str]:
+        cached = self._tokens.get(cache_key)
+        if cached and self._is_fresh(cached[1]):
+            return cached[0]
+        return None
+
+    @staticmethod
+    def _is_fresh(expires_at: Optional[datetime]) -> bool:
+        # 만료 직전 토큰으로 요청하다 실패하지 않도록 ORDER_API_TOKEN_REFRESH_SKEW(초) 앞당겨 갱신합니다.
+        skew = timedelta(seconds=settings.ORDER_API_TOKEN_REFRESH_SKEW)
+        return expires_at is not None and expires_at - skew > timezone.now()
+
+    @staticmethod
+    def _issue(issue: TokenIssuer) -> Tuple[str, datetime]:
+        token, expires_in = issue()
+        return token, timezone.now() + timedelta(seconds=expires_in)
+
+    def _get_or_issue_persistent(self, api_info_id: int, issue: TokenIssuer, fingerprint: str) -> Tuple[str, datetime]:
+        from management.models import ShipperApiToken
+
+        ShipperApiToken.objects.get_or_create(api_info_id=api_info_id)
+        with transaction.atomic():
+            # 다른 프로세스가 갱신 중이면 끝날 때까지 기다린 뒤 그 토큰을 사용합니다.
+            row = ShipperApiToken.objects.select_for_update().get(api_info_id=api_info_id)
+            if row.access_token and row.credential_fingerprint == fingerprint and self._is_fresh(row.expires_at):
+                return row.access_token, row.expires_at
+            row.access_token, row.expires_at = self._issue(issue)
+            row.credential_fingerprint = fingerprint
+            row.save(update_fields=['access_token', 'expires_at', 'credential_fingerprint', 'refreshed_at'])
+            return row.access_token, row.expires_at
+
+
+token_cache = TokenCache()
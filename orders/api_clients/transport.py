@@ -0,0 +1,280 @@
+# orders/api_clients/transport.py
+"""
+쇼핑몰 API 클라이언트가 공유하는 HTTP 전송 계층
+
+- 호스트별 연결 풀: keep-alive 연결을 재사용하여 요청마다 TCP/TLS 핸드셰이크를 하지 않습니다.
+- 토큰 버킷 속도 제한: 쇼핑몰(채널) 전체와 인증 정보(access key)별로 초당 요청 수를 제한합니다.
+- 재시도: 429/5xx 응답과 연결 오류는 지수 백오프 + 지터로 재시도하며, Retry-After 헤더를 따릅니다.
+
+외부 패키지 없이 표준 라이브러리(http.client)만 사용합니다.
+"""
+import http.client
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# 응답을 받은 뒤에도 다시 보내도 안전한 메서드 (POST 등은 연결 단계 실패만 재시도)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+
+class TransportError(Exception):
+    """재시도 후에도 성공 응답을 받지 못한 경우 발생하는 예외"""
+
+    def __init__(self, message: str, status: Optional[int] = None, body: bytes = b''):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class TransportResponse:
+    """HTTP 응답 (본문은 모두 읽어 둔 상태)"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode('utf-8')) if self.body else None
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 모이는 토큰 버킷
+    acquire()는 토큰이 생길 때까지 기다립니다. (여러 스레드에서 동시에 호출해도 안전)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 가져갑니다. 기다린 시간(초)을 반환합니다."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class ConnectionPool:
+    """
+    (scheme, host, port)별 유휴 keep-alive 연결 풀
+    사용 중인 연결은 풀에 없으므로 한 연결을 두 스레드가 동시에 쓰지 않습니다.
+    """
+
+    def __init__(self, max_idle_per_host: int = 4, timeout: float = 30):
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self._idle = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, host: str, port: Optional[int]) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Returns:
+            (연결, 재사용 여부)
+        """
+        key = (scheme, host, port)
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop(), True
+        return self.connect(scheme, host, port), False
+
+    def connect(self, scheme: str, host: str, port: Optional[int]) -> http.client.HTTPConnection:
+        """풀을 거치지 않고 새 연결을 만듭니다."""
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout)
+
+    def release(self, scheme: str, host: str, port: Optional[int], conn: http.client.HTTPConnection):
+        key = (scheme, host, port)
+        with self._lock:
+            if len(self._idle[key]) < self.max_idle_per_host:
+                self._idle[key].append(conn)
+                return
+        conn.close()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, defaultdict(list)
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class HttpTransport:
+    """
+    연결 풀, 속도 제한, 재시도를 묶은 HTTP 전송 객체
+    프로세스에서 하나(get_transport())를 만들어 모든 쇼핑몰 클라이언트가 공유합니다.
+    """
+
+    def __init__(self, max_idle_per_host: int = 4, timeout: float = 30, max_retries: int = 3,
+                 backoff_base: float = 0.5, backoff_max: float = 30):
+        self.pool = ConnectionPool(max_idle_per_host=max_idle_per_host, timeout=timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._buckets = {}
+        self._buckets_lock = threading.Lock()
+
+    def bucket(self, key: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+        """키(예: 'channel:CoupangClient')별 토큰 버킷을 반환합니다. 처음 요청될 때 만들어집니다."""
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            return bucket
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None, json_body: Any = None, data: Optional[bytes] = None,
+                rate_limits: Iterable[Tuple[str, float]] = ()) -> TransportResponse:
+        """
+        HTTP 요청을 보내고 응답을 반환합니다.
+
+        Args:
+            method: HTTP 메서드
+            url: 전체 URL
+            params: 쿼리 문자열 파라미터
+            headers: 요청 헤더
+            json_body: JSON으로 보낼 본문 (data와 함께 쓰지 않음)
+            data: 그대로 보낼 본문
+            rate_limits: [(버킷 키, 초당 요청 수), ...] 요청마다(재시도 포함) 모든 버킷에서 토큰을 하나씩 가져갑니다.
+
+        Raises:
+            TransportError: 재시도 후에도 429/5xx 이거나 연결에 실패한 경우
+        """
+        method = method.upper()
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        query = parts.query
+        if params:
+            query = f"{query}&{urlencode(params, doseq=True)}" if query else urlencode(params, doseq=True)
+        if query:
+            path = f"{path}?{query}"
+
+        headers = dict(headers or {})
+        if json_body is not None:
+            data = json.dumps(json_body, ensure_ascii=False).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        rate_limits = list(rate_limits)
+
+        attempt = 0
+        while True:
+            for key, rate in rate_limits:
+                self.bucket(key, rate).acquire()
+
+            try:
+                response = self._send(parts.scheme, parts.hostname, parts.port, method, path, data, headers)
+            except (OSError, http.client.HTTPException) as e:
+                # 요청이 서버에 전달됐을 수 있는 오류는 멱등 메서드만 재시도합니다.
+                sent_safely = method in IDEMPOTENT_METHODS or isinstance(e, ConnectionRefusedError)
+                if attempt >= self.max_retries or not sent_safely:
+                    raise TransportError(f'{method} {url} 연결 실패: {e}') from e
+                delay = self._backoff(attempt)
+                logger.warning(f"API 연결 오류, {delay:.1f}초 후 재시도 ({method} {url}): {e}")
+            else:
+                retryable = response.status in RETRY_STATUS_CODES and (
+                    method in IDEMPOTENT_METHODS or response.status == 429
+                )
+                if not retryable:
+                    return response
+                if attempt >= self.max_retries:
+                    raise TransportError(
+                        f'{method} {url} 응답 오류 (HTTP {response.status})', status=response.status, body=response.body
+                    )
+                delay = max(self._backoff(attempt), self._retry_after(response) or 0)
+                logger.warning(f"API 응답 HTTP {response.status}, {delay:.1f}초 후 재시도 ({method} {url})")
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(self, scheme, host, port, method, path, data, headers) -> TransportResponse:
+        conn, reused = self.pool.acquire(scheme, host, port)
+        try:
+            raw = self._exchange(conn, method, path, data, headers)
+        except (ConnectionError, http.client.BadStatusLine):
+            if not reused:
+                raise
+            # 서버가 이미 닫은 유휴 연결이었으므로 새 연결로 한 번 더 보냅니다. (재시도 횟수에 포함하지 않음)
+            conn = self.pool.connect(scheme, host, port)
+            raw = self._exchange(conn, method, path, data, headers)
+
+        response = TransportResponse(raw.status, {k.lower(): v for k, v in raw.getheaders()}, raw.body)
+        if raw.will_close:
+            conn.close()
+        else:
+            self.pool.release(scheme, host, port, conn)
+        return response
+
+    @staticmethod
+    def _exchange(conn, method, path, data, headers) -> http.client.HTTPResponse:
+        """요청을 보내고 본문까지 모두 읽은 응답을 반환합니다. 실패하면 연결을 닫습니다."""
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            raw = conn.getresponse()
+            raw.body = raw.read()
+        except Exception:
+            conn.close()
+            raise
+        return raw
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 상한 안에서 무작위로 고른 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _retry_after(self, response: TransportResponse) -> Optional[float]:
+        value = response.headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(self.backoff_max, max(0.0, seconds))
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """프로세스에서 공유하는 HttpTransport를 반환합니다. (설정값은 처음 만들 때 한 번 읽습니다)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                from django.conf import settings
+                _transport = HttpTransport(
+                    max_idle_per_host=settings.ORDER_API_POOL_MAX_IDLE_PER_HOST,
+                    timeout=settings.ORDER_API_TIMEOUT,
+                    max_retries=settings.ORDER_API_MAX_RETRIES,
+                    backoff_base=settings.ORDER_API_RETRY_BACKOFF,
+                    backoff_max=settings.ORDER_API_RETRY_BACKOFF_MAX,
+                )
+    return _transport
@@ -20,10 +20,13 @@ class OrdersConfig(AppConfig):
     def ready(self):
         """
         Django 앱이 준비되었을 때 호출됩니다.
-        여기서 주문 수집 스케줄러를 시작합니다.
+        여기서 캐시 무효화 시그널을 등록하고 주문 수집 스케줄러를 시작합니다.
         """
+        # [추가] 상품 변경 시 상품 해석기 색인 무효화 (실행 방식과 관계없이 항상 등록)
+        from orders import signals  # noqa: F401
+
         # runserver로 실행할 때만 스케줄러 시작 (migration 등에서는 실행하지 않음)
         import sys
         if 'runserver' in sys.argv:
             from orders.scheduler import start_scheduler
-            start_scheduler()
\ No newline at end of file
+            start_scheduler()
@@ -0,0 +1,45 @@
+"""
+Django Management Command: 미등록 상품 오류 주문 일괄 재처리
+
+사용법:
+    python manage.py match_channel_skus                  # 오류 주문 재처리 + 매핑 제안 저장
+    python manage.py match_channel_skus --dry-run        # 저장하지 않고 결과만 확인
+    python manage.py match_channel_skus --no-auto-map    # 매핑을 제안하지 않고 재처리만
+    python manage.py match_channel_skus --shipper 화주사명
+
+설명:
+    쇼핑몰 상품코드가 바코드/상품명과 달라 '미등록 상품' 오류로 남은 주문을
+    확인된 채널 상품코드 매핑(ChannelSkuMapping)으로 다시 해석하여 PENDING 주문으로 되돌립니다.
+    해석되지 않은 상품코드는 매핑을 제안(확인 전)만 하며, 관리자 화면에서 확인한 뒤 다시 실행하면 재처리됩니다.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from management.models import Shipper
+from orders.services import ErrorOrderRematcher
+
+
+class Command(BaseCommand):
+    help = '미등록 상품 오류 주문을 채널 상품코드 매핑으로 일괄 재처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 처리 결과만 출력합니다.')
+        parser.add_argument('--no-auto-map', action='store_true', help='채널 상품코드 매핑을 제안하지 않습니다.')
+        parser.add_argument('--shipper', help='이 화주사의 오류 주문만 처리합니다. (화주사명)')
+
+    def handle(self, *args, **options):
+        shipper_id = None
+        if options['shipper']:
+            shipper_id = Shipper.objects.filter(name=options['shipper']).values_list('pk', flat=True).first()
+            if shipper_id is None:
+                raise CommandError(f"화주사를 찾을 수 없습니다: {options['shipper']}")
+
+        rematcher = ErrorOrderRematcher(auto_map=not options['no_auto_map'], dry_run=options['dry_run'])
+        stats = rematcher.run(shipper_id=shipper_id)
+
+        prefix = '🔍 [미리보기] ' if options['dry_run'] else '✅ '
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}오류 주문 {stats['scanned']}건 확인: 재처리 {stats['matched_orders']}건, "
+            f"매핑 제안 {stats['proposed_mappings']}건(관리자 화면에서 확인 필요), 미해결 {stats['unresolved_orders']}건, "
+            f"주문번호 중복 {stats['conflict_orders']}건, 상품 외 오류 {stats['skipped_orders']}건"
+        ))
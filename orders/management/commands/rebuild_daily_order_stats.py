@@ -0,0 +1,83 @@
+"""
+Django Management Command: 일자별 주문 집계(DailyOrderStat) 재작성 / 검증
+
+사용법:
+    python manage.py rebuild_daily_order_stats                                   # 전체 주문을 다시 집계
+    python manage.py rebuild_daily_order_stats --start 2025-01-01 --end 2025-01-31  # 기간만 다시 집계
+    python manage.py rebuild_daily_order_stats --verify                          # 재작성하지 않고 불일치만 보고
+
+설명:
+    주문 대시보드/차트는 DailyOrderStat만 읽습니다. 주문 저장 경로에서는 자동으로 갱신되지만,
+    관리자 화면에서 주문 상품을 직접 고쳤거나 DB를 직접 수정한 경우 이 명령으로 맞춰줍니다.
+"""
+
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from orders.models import DailyOrderStat
+
+
+class Command(BaseCommand):
+    help = '주문 테이블을 다시 합산하여 일자별 주문 집계(DailyOrderStat)를 재작성하거나 검증합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='이 날짜부터 다시 집계합니다. (YYYY-MM-DD)')
+        parser.add_argument('--end', help='이 날짜까지 다시 집계합니다. (YYYY-MM-DD, 생략하면 시작일과 같음)')
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='집계 테이블을 수정하지 않고 주문 테이블과 다른 항목만 출력합니다.',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            self._verify()
+            return
+
+        if options['end'] and not options['start']:
+            raise CommandError('--end는 --start와 함께 지정해야 합니다.')
+        if not options['start']:
+            count = DailyOrderStat.rebuild()
+            self.stdout.write(self.style.SUCCESS(f'✅ 일자별 주문 집계 재작성 완료: {count}개 (일자/화주사/채널/상태) 항목'))
+            return
+
+        try:
+            start = datetime.strptime(options['start'], '%Y-%m-%d').date()
+            end = datetime.strptime(options['end'], '%Y-%m-%d').date() if options['end'] else start
+        except ValueError:
+            raise CommandError('날짜는 YYYY-MM-DD 형식으로 입력하세요.')
+        if end < start:
+            raise CommandError('--end는 --start보다 빠를 수 없습니다.')
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        count = DailyOrderStat.refresh_days(days)
+        self.stdout.write(self.style.SUCCESS(f'✅ {start} ~ {end} 집계 재작성 완료: {count}개 항목'))
+
+    def _verify(self):
+        expected = {key: tuple(value) for key, value in DailyOrderStat.order_totals().items() if value[0]}
+        actual = {}
+        for day, shipper_id, channel_id, status, count, quantity in DailyOrderStat.objects.values_list(
+            'date', 'shipper_id', 'channel_id', 'order_status', 'order_count', 'item_quantity'
+        ):
+            previous = actual.get((day, shipper_id, channel_id, status), (0, 0))
+            actual[(day, shipper_id, channel_id, status)] = (previous[0] + count, previous[1] + quantity)
+
+        mismatches = sorted(
+            ((key, expected.get(key, (0, 0)), actual.get(key, (0, 0)))
+             for key in expected.keys() | actual.keys()
+             if expected.get(key, (0, 0)) != actual.get(key, (0, 0))),
+            key=lambda mismatch: (mismatch[0][0], mismatch[0][1] or 0, mismatch[0][2] or 0, mismatch[0][3])
+        )
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS(f'✅ 일자별 주문 집계가 주문 테이블과 일치합니다. ({len(expected)}개 항목)'))
+            return
+
+        for (day, shipper_id, channel_id, status), (order_count, order_qty), (stat_count, stat_qty) in mismatches:
+            self.stdout.write(
+                f'{day} / 화주사 {shipper_id or "-"} / 채널 {channel_id or "-"} / {status}: '
+                f'주문 {order_count}건 {order_qty}개, 집계 {stat_count}건 {stat_qty}개'
+            )
+        self.stdout.write(self.style.WARNING(
+            f'✋ 불일치 {len(mismatches)}건. `python manage.py rebuild_daily_order_stats`로 재작성하세요.'
+        ))
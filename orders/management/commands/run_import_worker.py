@@ -0,0 +1,51 @@
+"""
+Django Management Command: 주문 엑셀 업로드 작업 처리 워커
+
+사용법:
+    python manage.py run_import_worker            # 대기열을 계속 확인하며 작업 처리
+    python manage.py run_import_worker --once     # 현재 대기 중인 작업만 처리하고 종료
+
+설명:
+    주문 관리 화면에서 대용량 엑셀을 업로드하면 OrderImportJob 으로 등록만 되고,
+    실제 주문 생성은 이 워커(또는 runserver의 스케줄러)가 처리합니다.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from orders.services import process_pending_import_jobs
+
+
+class Command(BaseCommand):
+    help = '대기 중인 주문 엑셀 업로드 작업(OrderImportJob)을 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 한 번만 처리하고 종료합니다.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=settings.ORDER_IMPORT_POLL_INTERVAL,
+            help='대기열을 확인하는 주기(초)',
+        )
+
+    def handle(self, *args, **options):
+        if options['once']:
+            count = process_pending_import_jobs()
+            self.stdout.write(self.style.SUCCESS(f'✅ 업로드 작업 {count}건 처리 완료'))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f'🚀 업로드 작업 워커 시작 ({options["interval"]}초 주기)'))
+        try:
+            while True:
+                count = process_pending_import_jobs()
+                if count:
+                    self.stdout.write(self.style.SUCCESS(f'✅ 업로드 작업 {count}건 처리 완료'))
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write('⏹️  업로드 작업 워커 종료')
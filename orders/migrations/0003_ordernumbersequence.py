@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_apicollectionlog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderNumberSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True, verbose_name='일자')),
+                ('last_value', models.PositiveIntegerField(default=0, verbose_name='마지막 순번')),
+            ],
+            options={
+                'verbose_name': '주문번호 순번',
+                'verbose_name_plural': '주문번호 순번',
+            },
+        ),
+    ]
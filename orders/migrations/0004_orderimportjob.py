@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_ordernumbersequence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(upload_to='order_imports/', verbose_name='업로드 파일')),
+                ('original_filename', models.CharField(blank=True, max_length=255, verbose_name='원본 파일명')),
+                ('handle_duplicates', models.BooleanField(default=False, verbose_name='중복 주문 포함')),
+                ('status', models.CharField(choices=[('QUEUED', '대기'), ('RUNNING', '처리중'), ('DONE', '완료'), ('FAILED', '실패')], default='QUEUED', max_length=20, verbose_name='상태')),
+                ('total_rows', models.PositiveIntegerField(default=0, verbose_name='전체 행 수')),
+                ('processed_rows', models.PositiveIntegerField(default=0, verbose_name='처리한 행 수')),
+                ('success_count', models.PositiveIntegerField(default=0, verbose_name='성공 건수')),
+                ('error_count', models.PositiveIntegerField(default=0, verbose_name='실패 건수')),
+                ('skipped_count', models.PositiveIntegerField(default=0, verbose_name='중복 제외 건수')),
+                ('message', models.TextField(blank=True, verbose_name='메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록 시각')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작 시각')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='종료 시각')),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 처리 신호')),
+                ('result_notified', models.BooleanField(default=False, verbose_name='결과 알림 여부')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='등록자')),
+            ],
+            options={
+                'verbose_name': '주문 업로드 작업',
+                'verbose_name_plural': '주문 업로드 작업',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='orders_orde_status_dcd7fb_idx')],
+            },
+        ),
+    ]
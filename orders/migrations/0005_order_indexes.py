@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:08
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+ORDER_NO_MAX_LENGTH = 100
+
+
+def rename_duplicate_order_nos(apps, schema_editor):
+    """
+    유니크 제약을 추가하기 전에, 같은 화주사/판매채널 안에서 주문번호가 겹치는 기존 주문을 정리합니다.
+    가장 먼저 등록된 주문은 그대로 두고 나머지는 '주문번호-DUP{id}' 로 바꿉니다.
+    (주문번호 최대 길이 100자를 넘지 않도록 접미사가 들어갈 만큼 앞부분만 남깁니다)
+    """
+    Order = apps.get_model('orders', 'Order')
+    active_orders = Order.objects.exclude(order_status='ERROR').filter(
+        shipper__isnull=False, channel__isnull=False, order_no__isnull=False
+    )
+    duplicates = active_orders.values('shipper_id', 'channel_id', 'order_no').annotate(
+        first_id=Min('id'), row_count=Count('id')
+    ).filter(row_count__gt=1).order_by()
+
+    renamed = []
+    for dup in duplicates:
+        for order in active_orders.filter(
+            shipper_id=dup['shipper_id'], channel_id=dup['channel_id'], order_no=dup['order_no']
+        ).exclude(id=dup['first_id']):
+            suffix = f"-DUP{order.id}"
+            order.order_no = order.order_no[:ORDER_NO_MAX_LENGTH - len(suffix)] + suffix
+            renamed.append(order)
+    Order.objects.bulk_update(renamed, ['order_no'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0005_expand_shopping_mall_channels'),
+        ('orders', '0004_orderimportjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['order_date'], name='order_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['order_status', 'order_date'], name='order_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['order_no'], name='order_no_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['shipper', 'recipient_name', 'address', 'recipient_phone'], name='order_duplicate_key_idx'),
+        ),
+        migrations.RunPython(rename_duplicate_order_nos, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(condition=models.Q(('order_status', 'ERROR'), _negated=True), fields=('shipper', 'channel', 'order_no'), name='unique_order_no_per_shipper_channel'),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:28
+
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 마이그레이션 시점의 오류 메시지(':' 앞부분) -> 오류 코드 (OrderErrorDetail.MESSAGE_CODES와 동일)
+MESSAGE_CODES = {
+    '미등록 상품': 'UNKNOWN_PRODUCT',
+    '상품이 여러 개 일치함': 'AMBIGUOUS_PRODUCT',
+    '미등록 화주사': 'UNKNOWN_SHIPPER',
+    '주문번호 중복': 'DUPLICATE_ORDER_NO',
+    '수량 오류': 'INVALID_QUANTITY',
+    '화주사 정보 누락': 'MISSING_FIELD',
+    '상품 정보 누락': 'MISSING_FIELD',
+    '판매채널 누락': 'MISSING_FIELD',
+    '시스템 오류': 'SYSTEM',
+}
+BATCH_SIZE = 500
+
+
+def _classify(message):
+    codes = {MESSAGE_CODES.get(part.split(':')[0].strip(), 'OTHER') for part in message.split(', ') if part.strip()}
+    if len(codes) == 1:
+        return codes.pop()
+    return 'MULTIPLE' if codes else 'OTHER'
+
+
+def _build_detail(OrderErrorDetail, order):
+    try:
+        details = json.loads(order.error_message or '')
+    except (TypeError, ValueError):
+        details = None
+    if not isinstance(details, dict):
+        # JSON이 아닌 오류 메시지는 메시지만 옮깁니다.
+        details = {'error_message': order.error_message or ''}
+
+    message = str(details.get('error_message') or '')
+    raw_data = details.get('original_data') or {}
+    if not isinstance(raw_data, dict):
+        raw_data = {}
+    product_identifier = raw_data.get('product_identifier')
+    if not product_identifier and ': ' in message:
+        # 쇼핑몰 수집 주문은 '미등록 상품: 코드' 형태로 오류 상품을 기록했습니다.
+        product_identifier = message.split(': ', 1)[1]
+    quantity = str(raw_data.get('quantity', '')).strip()
+    return message, OrderErrorDetail(
+        order_id=order.pk,
+        error_code=_classify(message),
+        error_message=message,
+        error_fields=sorted(set(details.get('error_fields') or [])),
+        shipper_name=str(raw_data.get('shipper_name') or '')[:100],
+        channel_name=str(raw_data.get('channel_name') or '')[:100],
+        product_identifier=str(product_identifier or '')[:200],
+        quantity=int(quantity) if quantity.isdigit() else None,
+        raw_data=raw_data,
+    )
+
+
+def move_error_json_to_details(apps, schema_editor):
+    """
+    Order.error_message에 JSON 문자열로 저장된 오류 내용을 OrderErrorDetail로 옮기고,
+    error_message에는 사람이 읽는 오류 메시지만 남깁니다.
+    """
+    Order = apps.get_model('orders', 'Order')
+    OrderErrorDetail = apps.get_model('orders', 'OrderErrorDetail')
+    error_orders = Order.objects.filter(order_status='ERROR').only('id', 'error_message').order_by('id')
+
+    last_id = 0
+    while True:
+        batch = list(error_orders.filter(id__gt=last_id)[:BATCH_SIZE])
+        if not batch:
+            break
+        last_id = batch[-1].id
+        details = []
+        for order in batch:
+            order.error_message, detail = _build_detail(OrderErrorDetail, order)
+            details.append(detail)
+        OrderErrorDetail.objects.bulk_create(details)
+        Order.objects.bulk_update(batch, ['error_message'])
+
+
+def restore_error_json(apps, schema_editor):
+    Order = apps.get_model('orders', 'Order')
+    OrderErrorDetail = apps.get_model('orders', 'OrderErrorDetail')
+    orders = []
+    for detail in OrderErrorDetail.objects.only('order_id', 'error_message', 'error_fields', 'raw_data').iterator():
+        orders.append(Order(id=detail.order_id, error_message=json.dumps({
+            'error_message': detail.error_message,
+            'error_fields': detail.error_fields,
+            'original_data': detail.raw_data,
+        }, ensure_ascii=False)))
+    Order.objects.bulk_update(orders, ['error_message'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_order_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderErrorDetail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('error_code', models.CharField(choices=[('UNKNOWN_PRODUCT', '미등록 상품'), ('AMBIGUOUS_PRODUCT', '상품 여러 개 일치'), ('UNKNOWN_SHIPPER', '미등록 화주사'), ('DUPLICATE_ORDER_NO', '주문번호 중복'), ('INVALID_QUANTITY', '수량 오류'), ('MISSING_FIELD', '필수 정보 누락'), ('SYSTEM', '시스템 오류'), ('MULTIPLE', '복합 오류'), ('OTHER', '기타')], default='OTHER', max_length=30, verbose_name='오류 코드')),
+                ('error_message', models.TextField(blank=True, verbose_name='오류 메시지')),
+                ('error_fields', models.JSONField(blank=True, default=list, verbose_name='오류 필드')),
+                ('shipper_name', models.CharField(blank=True, max_length=100, verbose_name='입력 화주사명')),
+                ('channel_name', models.CharField(blank=True, max_length=100, verbose_name='입력 판매채널명')),
+                ('product_identifier', models.CharField(blank=True, max_length=200, verbose_name='입력 상품(바코드/상품명)')),
+                ('quantity', models.IntegerField(blank=True, null=True, verbose_name='입력 수량')),
+                ('raw_data', models.JSONField(blank=True, default=dict, verbose_name='입력 원본')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')),
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='error_detail', to='orders.order', verbose_name='주문')),
+            ],
+            options={
+                'verbose_name': '주문 오류 상세',
+                'verbose_name_plural': '주문 오류 상세',
+                'indexes': [models.Index(fields=['error_code'], name='order_error_code_idx'), models.Index(fields=['product_identifier', 'error_code'], name='order_error_product_idx')],
+            },
+        ),
+        migrations.RunPython(move_error_json_to_details, restore_error_json),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:35
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def build_daily_order_stats(apps, schema_editor):
+    """기존 주문 전체를 일자/화주사/판매채널/상태별로 집계합니다. (DailyOrderStat.rebuild()와 동일)"""
+    Order = apps.get_model('orders', 'Order')
+    OrderItem = apps.get_model('orders', 'OrderItem')
+    DailyOrderStat = apps.get_model('orders', 'DailyOrderStat')
+
+    totals = defaultdict(lambda: [0, 0])
+    order_rows = Order.objects.values_list(
+        TruncDate('order_date'), 'shipper_id', 'channel_id', 'order_status'
+    ).annotate(count=Count('id')).order_by()
+    for day, shipper_id, channel_id, status, count in order_rows:
+        totals[(day, shipper_id, channel_id, status)][0] = count
+    item_rows = OrderItem.objects.values_list(
+        TruncDate('order__order_date'), 'order__shipper_id', 'order__channel_id', 'order__order_status'
+    ).annotate(quantity=Sum('quantity')).order_by()
+    for day, shipper_id, channel_id, status, quantity in item_rows:
+        totals[(day, shipper_id, channel_id, status)][1] = quantity or 0
+
+    DailyOrderStat.objects.bulk_create([
+        DailyOrderStat(date=day, shipper_id=shipper_id, channel_id=channel_id, order_status=status,
+                       order_count=count, item_quantity=quantity)
+        for (day, shipper_id, channel_id, status), (count, quantity) in totals.items()
+        if count
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0009_channelskumapping'),
+        ('orders', '0006_ordererrordetail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyOrderStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='일자')),
+                ('order_status', models.CharField(choices=[('PENDING', '주문접수'), ('PROCESSING', '처리중'), ('SHIPPED', '출고완료'), ('DELIVERED', '배송완료'), ('CANCELED', '주문취소'), ('ERROR', '오류')], max_length=20, verbose_name='주문 상태')),
+                ('order_count', models.PositiveIntegerField(default=0, verbose_name='주문 수')),
+                ('item_quantity', models.PositiveIntegerField(default=0, verbose_name='상품 수량')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='집계 시각')),
+                ('channel', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='management.saleschannel', verbose_name='판매 채널')),
+                ('shipper', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='management.shipper', verbose_name='화주사')),
+            ],
+            options={
+                'verbose_name': '일자별 주문 집계',
+                'verbose_name_plural': '일자별 주문 집계',
+                'indexes': [models.Index(fields=['date', 'order_status'], name='daily_order_stat_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'shipper', 'channel', 'order_status'), name='unique_daily_order_stat')],
+            },
+        ),
+        migrations.RunPython(build_daily_order_stats, migrations.RunPython.noop),
+    ]
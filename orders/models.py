@@ -1,7 +1,15 @@
 # orders/models.py
-from django.db import models
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest, TruncDate
 from django.utils import timezone
 
+from core.cache import bump_on_commit, dashboards_cache
+
 class Order(models.Model):
     """
     주문 정보를 담는 모델
@@ -35,6 +43,25 @@ class Order(models.Model):
     class Meta:
         verbose_name = '주문'
         verbose_name_plural = '주문'
+        indexes = [
+            # 일자별 주문 목록/대시보드 (order_date 범위 조회)
+            models.Index(fields=['order_date'], name='order_date_idx'),
+            # 일자별 성공/오류 목록, 상태별 추이 차트
+            models.Index(fields=['order_status', 'order_date'], name='order_status_date_idx'),
+            # 수집 시 주문번호 중복 확인, 자동 주문번호 시작값 조회
+            models.Index(fields=['order_no'], name='order_no_idx'),
+            # 엑셀 업로드 시 중복 주문(같은 화주사/수취인/주소/연락처) 확인
+            models.Index(fields=['shipper', 'recipient_name', 'address', 'recipient_phone'], name='order_duplicate_key_idx'),
+        ]
+        constraints = [
+            # 같은 화주사/판매채널 안에서 주문번호는 한 번만 등록됩니다.
+            # 오류 주문은 수정 후 재등록되기 전까지 같은 주문번호로 남아 있을 수 있으므로 제외합니다.
+            models.UniqueConstraint(
+                fields=['shipper', 'channel', 'order_no'],
+                condition=~models.Q(order_status='ERROR'),
+                name='unique_order_no_per_shipper_channel',
+            ),
+        ]
 
     def __str__(self):
         return f"주문 {self.order_no} ({self.shipper.name if self.shipper else 'N/A'})"
@@ -42,21 +69,102 @@ class Order(models.Model):
     def save(self, *args, **kwargs):
         # 주문번호가 없을 경우, 오늘 날짜 기반으로 자동 생성 (YYYYMMDD-XXXX)
         if not self.order_no:
-            today = timezone.now().date()
-            today_str = today.strftime('%Y%m%d')
-            # 오늘 날짜로 생성된 마지막 주문을 찾습니다.
-            last_order = Order.objects.filter(order_no__regex=r'^{}-\d+$'.format(today_str)).order_by('order_no').last()
-            
-            new_seq = 1
-            if last_order:
-                last_seq_str = last_order.order_no.split('-')[1]
-                if last_seq_str.isdigit():
-                    new_seq = int(last_seq_str) + 1
-            
-            # 새 주문번호를 생성합니다.
-            self.order_no = f"{today_str}-{str(new_seq).zfill(4)}"
+            self.order_no = OrderNumberSequence.reserve()[0]
             
         super().save(*args, **kwargs)
+        # [추가] mark_error()로 준비한 오류 상세를 함께 저장
+        if '_error_detail' in self.__dict__:
+            Order.save_error_details([self], replace=True)
+            del self._error_detail
+
+    def mark_error(self, errors: list, error_fields: list, raw_data: dict, product_identifier: str = None):
+        """
+        [추가] 주문을 오류 상태로 만들고, 저장할 때 함께 기록할 오류 상세(OrderErrorDetail)를 준비합니다.
+        bulk_create로 저장한 경우에는 저장 후 save_error_details()를 호출해야 합니다.
+        """
+        self.order_status = 'ERROR'
+        self.error_message = ", ".join(sorted(set(errors)))
+        self._error_detail = OrderErrorDetail.build(errors, error_fields, raw_data, product_identifier)
+        return self
+
+    @classmethod
+    def save_error_details(cls, orders, replace: bool = False):
+        """
+        [추가] mark_error()로 준비한 오류 상세를 한 번의 bulk_create로 저장합니다.
+
+        Args:
+            replace: 이미 오류 상세가 있을 수 있는 주문(재시도/재저장)이면 True (기존 상세를 지우고 새로 저장)
+        """
+        details = []
+        for order in orders:
+            detail = order.__dict__.get('_error_detail')
+            if detail is not None and order.pk:
+                # 롤백 후 다시 저장하는 경우를 위해 항상 새 행으로 저장합니다.
+                detail.pk = None
+                detail._state.adding = True
+                detail.order = order
+                details.append(detail)
+        if replace and details:
+            OrderErrorDetail.objects.filter(order_id__in=[d.order_id for d in details]).delete()
+        OrderErrorDetail.objects.bulk_create(details)
+
+    @classmethod
+    def assign_order_numbers(cls, orders):
+        """
+        주문번호가 비어 있는 주문들에 한 번의 블록 예약으로 번호를 채웁니다.
+        bulk_create는 save()를 거치지 않으므로 저장 전에 이 메서드를 호출해야 합니다.
+        """
+        unnumbered = [order for order in orders if not order.order_no]
+        if unnumbered:
+            for order, order_no in zip(unnumbered, OrderNumberSequence.reserve(len(unnumbered))):
+                order.order_no = order_no
+        return orders
+
+
+class OrderNumberSequence(models.Model):
+    """
+    일자별 자동 주문번호(YYYYMMDD-XXXX)의 마지막 순번을 보관하는 카운터
+    """
+    date = models.DateField(unique=True, verbose_name='일자')
+    last_value = models.PositiveIntegerField(default=0, verbose_name='마지막 순번')
+
+    class Meta:
+        verbose_name = '주문번호 순번'
+        verbose_name_plural = '주문번호 순번'
+
+    def __str__(self):
+        return f"{self.date:%Y%m%d} - {self.last_value}"
+
+    @classmethod
+    def reserve(cls, count=1, day=None):
+        """
+        지정한 날짜(기본: 오늘)의 주문번호를 count개 연속으로 예약하여 반환합니다.
+
+        카운터 행 하나를 UPDATE ... SET last_value = last_value + count 로 증가시키므로
+        주문 수와 관계없이 일정한 비용이 들고, 동시에 호출되어도 같은 번호가 나오지 않습니다.
+        """
+        day = day or timezone.now().date()
+        with transaction.atomic():
+            sequence, _ = cls.objects.get_or_create(
+                date=day,
+                defaults={'last_value': lambda: cls._last_value_from_orders(day)}
+            )
+            cls.objects.filter(pk=sequence.pk).update(last_value=F('last_value') + count)
+            sequence.refresh_from_db(fields=['last_value'])
+
+        first_seq = sequence.last_value - count + 1
+        day_str = day.strftime('%Y%m%d')
+        return [f"{day_str}-{str(seq).zfill(4)}" for seq in range(first_seq, sequence.last_value + 1)]
+
+    @staticmethod
+    def _last_value_from_orders(day):
+        """
+        카운터가 처음 만들어질 때 한 번만 호출되어, 이미 저장된 같은 날짜의 자동 주문번호와
+        겹치지 않도록 시작 순번을 맞춥니다.
+        """
+        day_str = day.strftime('%Y%m%d')
+        order_nos = Order.objects.filter(order_no__regex=r'^{}-\d+$'.format(day_str)).values_list('order_no', flat=True)
+        return max((int(order_no.split('-')[1]) for order_no in order_nos), default=0)
 
 class OrderItem(models.Model):
     """
@@ -74,6 +182,343 @@ class OrderItem(models.Model):
         return f"{self.product.name} - {self.quantity}개"
 
 
+class OrderErrorDetail(models.Model):
+    """
+    [신규] 오류 주문의 오류 내용 (오류 코드, 오류 필드, 입력값, 입력 원본)
+    목록 화면에 필요한 입력값은 별도 컬럼으로 저장하여 원본(raw_data)을 읽지 않고 보여 줄 수 있고,
+    오류 코드/상품 식별자로 '상품 X의 미등록 오류 전체' 같은 조회를 인덱스로 처리합니다.
+    """
+    CODE_CHOICES = [
+        ('UNKNOWN_PRODUCT', '미등록 상품'),
+        ('AMBIGUOUS_PRODUCT', '상품 여러 개 일치'),
+        ('UNKNOWN_SHIPPER', '미등록 화주사'),
+        ('DUPLICATE_ORDER_NO', '주문번호 중복'),
+        ('INVALID_QUANTITY', '수량 오류'),
+        ('MISSING_FIELD', '필수 정보 누락'),
+        ('SYSTEM', '시스템 오류'),
+        ('MULTIPLE', '복합 오류'),
+        ('OTHER', '기타'),
+    ]
+    # 오류 메시지(':' 앞부분) -> 오류 코드
+    MESSAGE_CODES = {
+        '미등록 상품': 'UNKNOWN_PRODUCT',
+        '상품이 여러 개 일치함': 'AMBIGUOUS_PRODUCT',
+        '미등록 화주사': 'UNKNOWN_SHIPPER',
+        '주문번호 중복': 'DUPLICATE_ORDER_NO',
+        '수량 오류': 'INVALID_QUANTITY',
+        '화주사 정보 누락': 'MISSING_FIELD',
+        '상품 정보 누락': 'MISSING_FIELD',
+        '판매채널 누락': 'MISSING_FIELD',
+        '시스템 오류': 'SYSTEM',
+    }
+
+    order = models.OneToOneField(Order, on_delete=models.CASCADE, related_name='error_detail', verbose_name='주문')
+    error_code = models.CharField(max_length=30, choices=CODE_CHOICES, default='OTHER', verbose_name='오류 코드')
+    error_message = models.TextField(blank=True, verbose_name='오류 메시지')
+    error_fields = models.JSONField(default=list, blank=True, verbose_name='오류 필드')
+
+    # 오류 목록에서 보여 주고 수정할 입력값
+    shipper_name = models.CharField(max_length=100, blank=True, verbose_name='입력 화주사명')
+    channel_name = models.CharField(max_length=100, blank=True, verbose_name='입력 판매채널명')
+    product_identifier = models.CharField(max_length=200, blank=True, verbose_name='입력 상품(바코드/상품명)')
+    quantity = models.IntegerField(null=True, blank=True, verbose_name='입력 수량')
+
+    raw_data = models.JSONField(default=dict, blank=True, verbose_name='입력 원본')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')
+
+    class Meta:
+        verbose_name = '주문 오류 상세'
+        verbose_name_plural = '주문 오류 상세'
+        indexes = [
+            models.Index(fields=['error_code'], name='order_error_code_idx'),
+            models.Index(fields=['product_identifier', 'error_code'], name='order_error_product_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_error_code_display()}: {self.error_message}"
+
+    @classmethod
+    def classify(cls, errors: list) -> str:
+        """오류 메시지 목록의 오류 코드 (서로 다른 종류가 섞이면 MULTIPLE)"""
+        codes = {cls.MESSAGE_CODES.get(str(error).split(':')[0].strip(), 'OTHER') for error in errors}
+        if len(codes) == 1:
+            return codes.pop()
+        return 'MULTIPLE' if codes else 'OTHER'
+
+    @classmethod
+    def build(cls, errors: list, error_fields: list, raw_data: dict, product_identifier: str = None) -> 'OrderErrorDetail':
+        """
+        저장 전 오류 상세를 만듭니다.
+
+        Args:
+            raw_data: 입력 원본 (엑셀 행/화면 입력 딕셔너리 또는 쇼핑몰 API 주문 데이터)
+            product_identifier: 오류가 난 상품 식별자 (없으면 raw_data의 product_identifier)
+        """
+        raw_data = raw_data or {}
+        quantity = str(raw_data.get('quantity', '')).strip()
+        return cls(
+            error_code=cls.classify(errors),
+            error_message=", ".join(sorted(set(errors))),
+            error_fields=sorted(set(error_fields)),
+            shipper_name=str(raw_data.get('shipper_name') or '')[:100],
+            channel_name=str(raw_data.get('channel_name') or '')[:100],
+            product_identifier=str(product_identifier or raw_data.get('product_identifier') or '')[:200],
+            quantity=int(quantity) if quantity.isdigit() else None,
+            raw_data=raw_data,
+        )
+
+
+
+# delete_orders()가 집계에서 미리 뺀 주문 id (삭제 시그널에서 다시 빼지 않도록, 스레드별)
+_bulk_deleted_orders = threading.local()
+# [추가] PostgreSQL에서 일자별 주문 집계 재작성(rebuild_daily_order_stats)을 직렬화하는 advisory lock 번호
+DAILY_ORDER_STAT_LOCK_KEY = 202001
+
+
+class DailyOrderStat(models.Model):
+    """
+    [신규] 일자별 주문 집계 (일자 x 화주사 x 판매채널 x 주문 상태별 주문 수/상품 수량)
+
+    주문 대시보드와 차트는 Order를 매번 GROUP BY 하지 않고 이 테이블의 몇십 행만 읽습니다.
+    주문이 생성/변경/삭제되면 바뀐 주문만큼의 증감(주문 수, 상품 수량)을 같은 트랜잭션 안에서 해당 행에 더합니다.
+    (건별 저장/삭제는 orders.signals, 일괄 저장은 snapshot()/orders_changed()를 직접 호출)
+    Order를 다시 합산하는 것은 rebuild_daily_order_stats 명령(rebuild/refresh_days)뿐이며,
+    관리자 화면 등에서 시그널 없이 직접 고친 경우 이 명령으로 맞춥니다.
+    일자는 주문일시(order_date)의 현재 시간대 기준 날짜입니다.
+    """
+    date = models.DateField(verbose_name='일자')
+    # 화주사/판매채널이 삭제되면 주문과 마찬가지로 비워 두고 합계는 유지합니다.
+    shipper = models.ForeignKey('management.Shipper', on_delete=models.SET_NULL, null=True, blank=True, verbose_name='화주사')
+    channel = models.ForeignKey('management.SalesChannel', on_delete=models.SET_NULL, null=True, blank=True, verbose_name='판매 채널')
+    order_status = models.CharField(max_length=20, choices=Order.ORDER_STATUS_CHOICES, verbose_name='주문 상태')
+    order_count = models.PositiveIntegerField(default=0, verbose_name='주문 수')
+    item_quantity = models.PositiveIntegerField(default=0, verbose_name='상품 수량')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='집계 시각')
+
+    class Meta:
+        verbose_name = '일자별 주문 집계'
+        verbose_name_plural = '일자별 주문 집계'
+        indexes = [
+            models.Index(fields=['date', 'order_status'], name='daily_order_stat_date_idx'),
+        ]
+        constraints = [
+            # [추가] 한 일자/화주사/판매채널/상태 조합은 한 행만 존재합니다. (동시에 갱신되어 같은 날짜가 두 번 들어가지 않도록)
+            models.UniqueConstraint(
+                fields=['date', 'shipper', 'channel', 'order_status'],
+                name='unique_daily_order_stat',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.get_order_status_display()}: {self.order_count}건"
+
+    @staticmethod
+    def day_of(order_date):
+        """주문일시가 속한 날짜 (현재 시간대 기준)"""
+        return timezone.localtime(order_date).date() if order_date else None
+
+    @classmethod
+    def key_of(cls, order) -> tuple:
+        """주문이 더해지는 집계 행의 키 (일자, 화주사 id, 판매채널 id, 상태)"""
+        return (cls.day_of(order.order_date), order.shipper_id, order.channel_id, order.order_status)
+
+    @staticmethod
+    def item_quantities(order_ids) -> dict:
+        """주문별 상품 수량 합계 {주문 id: 수량}"""
+        order_ids = list(order_ids)
+        quantities = {}
+        for i in range(0, len(order_ids), 500):
+            quantities.update(
+                OrderItem.objects.filter(order_id__in=order_ids[i:i + 500]).values_list('order_id').annotate(
+                    quantity=Sum('quantity')
+                ).order_by()
+            )
+        return quantities
+
+    @classmethod
+    def snapshot(cls, orders) -> dict:
+        """
+        일괄 변경 전 주문들의 {주문 id: (집계 키, 상품 수량)}
+        변경(bulk_update, QuerySet.update, 주문 상품 교체 등)을 마친 뒤 orders_changed(orders, before=...)로 넘깁니다.
+        """
+        orders = [order for order in orders if order.pk]
+        quantities = cls.item_quantities(order.pk for order in orders)
+        return {order.pk: (cls.key_of(order), quantities.get(order.pk, 0)) for order in orders}
+
+    @classmethod
+    def orders_changed(cls, orders, before=None):
+        """
+        시그널 없이 생성/변경한 주문들을 집계에 반영합니다. (주문 상품까지 저장한 뒤, 같은 트랜잭션 안에서 호출)
+
+        Args:
+            before: 변경 전 snapshot() 결과 (없는 주문은 새로 생성된 주문으로 보고 더하기만 함)
+        """
+        before = before or {}
+        orders = [order for order in orders if order.pk]
+        quantities = cls.item_quantities(order.pk for order in orders)
+        deltas = defaultdict(lambda: [0, 0])
+        for order in orders:
+            key, quantity = cls.key_of(order), quantities.get(order.pk, 0)
+            previous = before.get(order.pk)
+            if previous is not None:
+                deltas[previous[0]][0] -= 1
+                deltas[previous[0]][1] -= previous[1]
+            deltas[key][0] += 1
+            deltas[key][1] += quantity
+            # 같은 객체를 나중에 save()하면 시그널이 이 키를 기준으로 증감합니다.
+            order._stat_key = key
+        cls.apply_deltas(deltas)
+
+    @classmethod
+    def delete_orders(cls, orders) -> int:
+        """
+        주문 QuerySet을 삭제하면서 집계에서 한 번에 뺍니다. 삭제한 주문 수를 반환합니다.
+        (QuerySet.delete()만 호출하면 삭제 시그널이 주문마다 상품 수량을 조회하므로 여러 건을 지울 때 사용)
+        """
+        with transaction.atomic():
+            before = cls.snapshot(orders.select_for_update().only('order_date', 'shipper_id', 'channel_id', 'order_status'))
+            if not before:
+                return 0
+            deltas = defaultdict(lambda: [0, 0])
+            for key, quantity in before.values():
+                deltas[key][0] -= 1
+                deltas[key][1] -= quantity
+            cls.apply_deltas(deltas)
+            _bulk_deleted_orders.ids = set(before)
+            try:
+                Order.objects.filter(pk__in=list(before)).delete()
+            finally:
+                _bulk_deleted_orders.ids = set()
+        return len(before)
+
+    @staticmethod
+    def deleted_in_bulk(order) -> bool:
+        """delete_orders()로 삭제 중이라 집계에서 이미 뺀 주문인지"""
+        return order.pk in getattr(_bulk_deleted_orders, 'ids', ())
+
+    @classmethod
+    def apply_deltas(cls, deltas: dict):
+        """
+        {(일자, 화주사 id, 판매채널 id, 상태): (주문 수 증감, 상품 수량 증감)}을 집계 행에 더합니다.
+        행마다 UPDATE 한 문장(F 표현식)이라 동시에 반영되어도 합계를 잃지 않으며, 롤백되면 함께 취소됩니다.
+        """
+        changed = False
+        for key, (count, quantity) in deltas.items():
+            if key[0] is not None and (count or quantity):
+                cls._apply_delta(key, count, quantity)
+                changed = True
+        if changed:
+            # 집계에서 만든 대시보드/차트 캐시 무효화
+            bump_on_commit(dashboards_cache)
+
+    @classmethod
+    def _apply_delta(cls, key, count, quantity):
+        day, shipper_id, channel_id, status = key
+        rows = cls.objects.filter(date=day, shipper_id=shipper_id, channel_id=channel_id, order_status=status)
+        while True:
+            # 화주사/판매채널이 비어 있는 키는 유니크 제약이 NULL을 구분하지 않으므로 행이 둘일 수 있어 한 행에만 더합니다.
+            pk = rows.values_list('pk', flat=True).first()
+            if pk is None:
+                if count <= 0:
+                    return  # 뺄 행이 없으면 집계가 이미 어긋난 것이므로 rebuild_daily_order_stats로 맞춥니다.
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(date=day, shipper_id=shipper_id, channel_id=channel_id, order_status=status,
+                                           order_count=count, item_quantity=max(quantity, 0))
+                    return
+                except IntegrityError:
+                    continue  # 다른 요청이 먼저 만든 행에 더합니다.
+            if cls.objects.filter(pk=pk).update(
+                order_count=Greatest(F('order_count') + count, 0),
+                item_quantity=Greatest(F('item_quantity') + quantity, 0),
+            ):
+                # 주문이 모두 빠진 행은 지워 rebuild 결과(주문이 있는 조합만)와 같게 유지합니다.
+                cls.objects.filter(pk=pk, order_count=0).delete()
+                return
+            # 방금 다른 요청이 0건이 된 행을 지웠으면 다시 찾습니다.
+
+    @classmethod
+    def order_totals(cls, days=None) -> dict:
+        """
+        Order/OrderItem을 다시 합산하여 {(일자, 화주사 id, 판매채널 id, 상태): [주문 수, 상품 수량]}을 반환합니다.
+        (days가 있으면 해당 날짜만, 날짜마다 order_date 범위 조건이라 인덱스를 사용)
+        """
+        orders = Order.objects.all()
+        items = OrderItem.objects.all()
+        if days is not None:
+            day_ranges = Q()
+            for day in days:
+                start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+                day_ranges |= Q(order_date__gte=start, order_date__lt=start + timedelta(days=1))
+            orders = orders.filter(day_ranges)
+            items = items.filter(order__in=Order.objects.filter(day_ranges))
+
+        totals = defaultdict(lambda: [0, 0])
+        order_rows = orders.values_list(
+            TruncDate('order_date'), 'shipper_id', 'channel_id', 'order_status'
+        ).annotate(count=Count('id')).order_by()
+        for day, shipper_id, channel_id, status, count in order_rows:
+            totals[(day, shipper_id, channel_id, status)][0] = count
+        item_rows = items.values_list(
+            TruncDate('order__order_date'), 'order__shipper_id', 'order__channel_id', 'order__order_status'
+        ).annotate(quantity=Sum('quantity')).order_by()
+        for day, shipper_id, channel_id, status, quantity in item_rows:
+            totals[(day, shipper_id, channel_id, status)][1] = quantity or 0
+        return dict(totals)
+
+    @classmethod
+    def refresh_days(cls, days) -> int:
+        """지정한 날짜들의 집계를 Order에서 다시 계산하여 교체합니다."""
+        days = sorted(set(days))
+        if not days:
+            return 0
+        return cls._replace(lambda: cls.order_totals(days), cls.objects.filter(date__in=days))
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """전체 주문을 다시 합산하여 집계 테이블을 재작성합니다."""
+        return cls._replace(cls.order_totals, cls.objects.all())
+
+    @classmethod
+    def _replace(cls, build_totals, stale) -> int:
+        # 재작성 명령이 동시에 실행되어도 행이 중복되지 않도록 한 번에 하나씩 실행하고, 잠금을 잡은 뒤에 Order에서 다시 집계합니다.
+        with transaction.atomic():
+            cls._lock_refresh()
+            # SQLite는 삭제로 쓰기 잠금을 먼저 잡아야 그 뒤의 집계가 다른 쓰기와 겹치지 않습니다.
+            stale.delete()
+            totals = build_totals()
+            cls.objects.bulk_create([
+                cls(date=day, shipper_id=shipper_id, channel_id=channel_id, order_status=status,
+                    order_count=count, item_quantity=quantity)
+                for (day, shipper_id, channel_id, status), (count, quantity) in totals.items()
+                if count
+            ], batch_size=500)
+            # 집계에서 만든 대시보드/차트 캐시 무효화
+            bump_on_commit(dashboards_cache)
+        return len(totals)
+
+    @staticmethod
+    def _lock_refresh():
+        """집계 재작성 잠금 (트랜잭션이 끝나면 해제)"""
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [DAILY_ORDER_STAT_LOCK_KEY])
+        # SQLite는 쓰기 트랜잭션이 데이터베이스 전체에서 하나씩만 실행되므로 별도 잠금이 필요 없습니다.
+
+    @classmethod
+    def status_counts(cls, start_date, end_date=None) -> dict:
+        """기간의 상태별 주문 수 {상태: 주문 수} ('dashboards' 캐시 사용)"""
+        end_date = end_date or start_date
+
+        def build():
+            rows = cls.objects.filter(date__range=(start_date, end_date)).values_list('order_status').annotate(
+                count=Sum('order_count')
+            ).order_by()
+            return dict(rows)
+
+        return dict(dashboards_cache.get_or_set(f"order_status_counts:{start_date}:{end_date}", build))
+
+
 class ApiCollectionLog(models.Model):
     """
     API 주문 수집 로그
@@ -128,3 +573,71 @@ class ApiCollectionLog(models.Model):
     
     def __str__(self):
         return f"{self.shipper.name} - {self.channel_type} ({self.collected_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class OrderImportJob(models.Model):
+    """
+    대용량 주문 엑셀 업로드를 백그라운드에서 처리하기 위한 작업 큐 (DB 기반)
+    """
+    STATUS_CHOICES = [
+        ('QUEUED', '대기'),
+        ('RUNNING', '처리중'),
+        ('DONE', '완료'),
+        ('FAILED', '실패'),
+    ]
+
+    file = models.FileField(upload_to='order_imports/', verbose_name='업로드 파일')
+    original_filename = models.CharField(max_length=255, blank=True, verbose_name='원본 파일명')
+    handle_duplicates = models.BooleanField(default=False, verbose_name='중복 주문 포함')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='QUEUED', verbose_name='상태')
+
+    total_rows = models.PositiveIntegerField(default=0, verbose_name='전체 행 수')
+    processed_rows = models.PositiveIntegerField(default=0, verbose_name='처리한 행 수')
+    success_count = models.PositiveIntegerField(default=0, verbose_name='성공 건수')
+    error_count = models.PositiveIntegerField(default=0, verbose_name='실패 건수')
+    skipped_count = models.PositiveIntegerField(default=0, verbose_name='중복 제외 건수')
+    message = models.TextField(blank=True, verbose_name='메시지')
+
+    created_by = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True, verbose_name='등록자')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='등록 시각')
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name='시작 시각')
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name='종료 시각')
+    # [추가] 처리 중인 워커가 청크를 저장할 때마다 갱신합니다. 오래 갱신되지 않은 RUNNING 작업은 다른 워커가 이어서 처리합니다.
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 처리 신호')
+    # [추가] 완료/실패 메시지를 화면에 한 번만 표시하기 위한 표시
+    result_notified = models.BooleanField(default=False, verbose_name='결과 알림 여부')
+
+    class Meta:
+        verbose_name = '주문 업로드 작업'
+        verbose_name_plural = '주문 업로드 작업'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.original_filename} ({self.get_status_display()})"
+
+    @property
+    def progress_percent(self):
+        if self.status == 'DONE':
+            return 100
+        if not self.total_rows:
+            return 0
+        return min(100, int(self.processed_rows * 100 / self.total_rows))
+
+    def to_progress_dict(self):
+        """진행 상황 조회 API에서 반환할 딕셔너리"""
+        return {
+            'job_id': self.pk,
+            'status': self.status,
+            'status_display': self.get_status_display(),
+            'filename': self.original_filename,
+            'total_rows': self.total_rows,
+            'processed_rows': self.processed_rows,
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'skipped_count': self.skipped_count,
+            'percent': self.progress_percent,
+            'message': self.message,
+        }
@@ -31,6 +31,17 @@ def start_scheduler():
         name='쇼핑몰 주문 자동 수집 (30분)',
         replace_existing=True
     )
+
+    # [추가] 대용량 주문 엑셀 업로드 작업 처리
+    scheduler.add_job(
+        process_import_jobs_job,
+        trigger=IntervalTrigger(seconds=settings.ORDER_IMPORT_POLL_INTERVAL),
+        id='process_order_import_jobs',
+        name='주문 엑셀 업로드 작업 처리',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
     
     scheduler.start()
     print("✅ 주문 수집 스케줄러 시작: 30분마다 실행")
@@ -60,3 +71,18 @@ def collect_orders_job():
     except Exception as e:
         print(f"❌ 주문 수집 오류: {str(e)}")
         logger.error(f"주문 수집 오류: {str(e)}", exc_info=True)
+
+
+def process_import_jobs_job():
+    """
+    스케줄러에서 호출되는 주문 엑셀 업로드 작업 처리
+    """
+    from orders.services import process_pending_import_jobs
+
+    try:
+        count = process_pending_import_jobs()
+        if count:
+            print(f"✅ 주문 업로드 작업 {count}건 처리 완료")
+    except Exception as e:
+        print(f"❌ 주문 업로드 작업 처리 오류: {str(e)}")
+        logger.error(f"주문 업로드 작업 처리 오류: {str(e)}", exc_info=True)
@@ -1,4 +1,13 @@
 # orders/services/__init__.py
 from .order_collector import OrderCollectorService
+from .order_ingestor import CollectedOrderIngestor
+from .excel_importer import OrderExcelImporter
+from .import_jobs import enqueue_import, process_pending_import_jobs
+from .product_resolver import ProductResolver, product_resolver
+from .sku_matcher import ErrorOrderRematcher
+from .error_retry import ErrorOrderRetrier
 
-__all__ = ['OrderCollectorService']
+__all__ = [
+    'OrderCollectorService', 'CollectedOrderIngestor', 'OrderExcelImporter', 'enqueue_import', 'process_pending_import_jobs',
+    'ProductResolver', 'product_resolver', 'ErrorOrderRematcher', 'ErrorOrderRetrier',
+]
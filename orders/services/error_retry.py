@@ -0,0 +1,162 @@
+# orders/services/error_retry.py
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from orders.models import DailyOrderStat, Order, OrderItem
+from .excel_importer import OrderExcelImporter
+
+
+class ErrorOrderRetrier(OrderExcelImporter):
+    """
+    오류 목록 화면에서 수정한 오류 주문들을 한 번에 다시 등록하는 재시도 엔진
+
+    엑셀 가져오기와 같은 검증 규칙과 메모리 색인을 쓰며, 조회/저장을 모두 집합 단위로 처리합니다.
+    - 화주사/판매채널/사용 중인 주문번호는 몇 번의 IN 쿼리, 상품은 ProductResolver 색인으로 확인
+    - 성공한 행은 Order/OrderItem bulk_create, 대체된 오류 주문은 한 번의 DELETE ... WHERE id IN
+    - 실패한 행의 오류 주문은 bulk_update 한 번으로 최신 오류/수정 내용을 반영
+    """
+
+    FIELDS = ('order_no', 'shipper_name', 'channel_name', 'recipient_name', 'recipient_phone', 'address', 'product_identifier')
+
+    def __init__(self):
+        # 재시도는 사용자가 직접 고친 주문이므로 수취인 중복 검사는 하지 않습니다.
+        super().__init__(handle_duplicates=True)
+
+    def retry(self, updates: list) -> list:
+        """
+        Args:
+            updates: [{'unique_id': 'db-<오류 주문 id>', 'data': {주문 필드...}}, ...]
+
+        Returns:
+            입력 순서대로 {'unique_id', 'status': 'success'} 또는
+            {'unique_id', 'status': 'error', 'error_message', 'error_fields'}
+        """
+        results = [None] * len(updates)
+        rows = []  # (입력 위치, unique_id, 오류 주문 id, 주문 데이터)
+        for position, item in enumerate(updates):
+            unique_id = item.get('unique_id')
+            if not unique_id:
+                results[position] = {'unique_id': 'unknown', 'status': 'error', 'error_message': 'ID 누락'}
+                continue
+            rows.append((position, unique_id, self._error_order_id(unique_id), self._normalize(item.get('data') or {})))
+
+        self._load_lookups([order_data for _, _, _, order_data in rows])
+
+        now = timezone.now()
+        built, failures = [], []
+        for position, unique_id, error_order_id, order_data in rows:
+            channel = self.channels.get(order_data['channel_name'])
+            shipper, product_id, errors, error_fields = self._validate(order_data, channel)
+            if not errors and order_data['order_no']:
+                order_no_key = (shipper.pk, channel.pk, order_data['order_no'])
+                if order_no_key in self.used_order_nos:
+                    errors, error_fields = ["주문번호 중복"], ['order_no']
+                else:
+                    self.used_order_nos.add(order_no_key)
+            if errors:
+                failures.append((position, unique_id, error_order_id, order_data, errors, error_fields))
+                continue
+            order = Order(
+                order_no=order_data['order_no'], shipper=shipper, channel=channel,
+                recipient_name=order_data['recipient_name'] or '', recipient_phone=order_data['recipient_phone'],
+                address=order_data['address'], order_date=now, order_status='PENDING'
+            )
+            built.append((position, unique_id, error_order_id, order_data, order, product_id))
+
+        for position, unique_id, error_order_id, order_data, error in self._save(built):
+            failures.append((position, unique_id, error_order_id, order_data, [error], ['order_no']))
+
+        succeeded = {position for position, *_ in built} - {position for position, *_ in failures}
+        replaced_ids = [error_order_id for position, _, error_order_id, *_ in built if position in succeeded and error_order_id]
+        if replaced_ids:
+            DailyOrderStat.delete_orders(Order.objects.filter(id__in=replaced_ids, order_status='ERROR'))
+        for position, unique_id, *_ in built:
+            if position in succeeded:
+                results[position] = {'unique_id': unique_id, 'status': 'success'}
+
+        self._update_error_orders(failures, now)
+        for position, unique_id, _, _, errors, error_fields in failures:
+            results[position] = {
+                'unique_id': unique_id, 'status': 'error',
+                'error_message': ", ".join(sorted(set(errors))), 'error_fields': sorted(set(error_fields)),
+            }
+        return results
+
+    @classmethod
+    def _normalize(cls, data: dict) -> dict:
+        """화면에서 받은 값을 엑셀 행과 같은 형태(앞뒤 공백 제거, 수량은 정수)로 맞춥니다."""
+        order_data = {field: str(data[field]).strip() if data.get(field) not in (None, '') else None for field in cls.FIELDS}
+        order_data['recipient_phone'] = order_data['recipient_phone'] or ''
+        order_data['address'] = order_data['address'] or ''
+        quantity = str(data.get('quantity') or '').strip()
+        order_data['quantity'] = int(quantity) if quantity.isdigit() else 0
+        return order_data
+
+    @staticmethod
+    def _error_order_id(unique_id: str) -> Optional[int]:
+        id_type, _, id_value = str(unique_id).partition('-')
+        return int(id_value) if id_type == 'db' and id_value.isdigit() else None
+
+    def _save(self, built: list) -> list:
+        """
+        재등록할 주문을 일괄 저장합니다. 동시에 같은 주문번호가 등록되어 유니크 제약에 걸리면
+        건별 저장으로 전환하여 걸린 행만 실패로 돌려줍니다.
+
+        Returns:
+            [(입력 위치, unique_id, 오류 주문 id, 주문 데이터, 오류 메시지), ...]
+        """
+        if not built:
+            return []
+        try:
+            with transaction.atomic():
+                self._save_orders(built)
+            return []
+        except IntegrityError:
+            pass
+
+        failed = []
+        for entry in built:
+            order = entry[4]
+            order.pk = None
+            order._state.adding = True
+            if not entry[3]['order_no']:
+                order.order_no = None
+            try:
+                with transaction.atomic():
+                    self._save_orders([entry])
+            except IntegrityError:
+                failed.append(entry[:4] + ("주문번호 중복",))
+        return failed
+
+    @staticmethod
+    def _save_orders(built: list):
+        orders = [entry[4] for entry in built]
+        Order.assign_order_numbers(orders)
+        Order.objects.bulk_create(orders)
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, product_id=product_id, quantity=order_data['quantity'])
+            for _, _, _, order_data, order, product_id in built
+        ])
+        DailyOrderStat.orders_changed(orders)
+
+    @staticmethod
+    def _update_error_orders(failures: list, now):
+        """실패한 행의 오류 주문에 새 오류 내용과 수정한 수취인 정보를 반영합니다."""
+        by_id = {entry[2]: entry for entry in failures if entry[2]}
+        if not by_id:
+            return
+        error_orders = list(Order.objects.filter(id__in=by_id, order_status='ERROR'))
+        before = DailyOrderStat.snapshot(error_orders)
+        for error_order in error_orders:
+            _, _, _, order_data, errors, error_fields = by_id[error_order.id]
+            error_order.mark_error(errors, error_fields, order_data)
+            error_order.order_date = now
+            error_order.recipient_name = order_data['recipient_name'] or ''
+            error_order.recipient_phone = order_data['recipient_phone']
+            error_order.address = order_data['address']
+        Order.objects.bulk_update(error_orders, ['error_message', 'order_date', 'recipient_name', 'recipient_phone', 'address'])
+        Order.save_error_details(error_orders, replace=True)
+        # 오류 주문은 재시도한 날짜로 옮겨지므로 이전 일자의 집계에서 빼고 새 일자에 더합니다.
+        DailyOrderStat.orders_changed(error_orders, before=before)
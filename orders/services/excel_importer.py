@@ -0,0 +1,267 @@
+# orders/services/excel_importer.py
+import logging
+from itertools import islice
+
+import openpyxl
+from django.db import transaction
+from django.utils import timezone
+
+from management.models import Shipper, SalesChannel
+from orders.models import DailyOrderStat, Order, OrderItem
+from .product_resolver import product_resolver
+from .utils import chunked
+
+logger = logging.getLogger(__name__)
+
+
+class OrderExcelImporter:
+    """
+    주문 업로드 엑셀 파일을 읽어 주문을 일괄 생성하는 가져오기 엔진
+
+    1. 시트를 읽기 전용(read_only) 모드로 한 행씩 읽어 가벼운 딕셔너리로 변환합니다.
+    2. 첫 번째 순회에서는 파일에 등장하는 화주사/판매채널/중복 후보 키만 모아 몇 번의 집합 쿼리로 미리 조회하고,
+       상품은 화주사별로 캐시된 상품 색인(ProductResolver)을 가져옵니다.
+    3. 두 번째 순회에서 CHUNK_SIZE 행씩 읽으며 메모리의 색인으로만 검증하고, 성공/오류 주문을 bulk_create 합니다.
+       [수정] 시트 전체를 리스트로 만들지 않으므로 메모리에는 조회 키 집합과 청크 하나만 남습니다.
+
+    엑셀 열 순서: 주문번호, 화주사, 판매채널, 수취인, 연락처, 주소, 상품명(바코드), 수량
+    """
+
+    COLUMN_COUNT = 8
+    # 한 번에 bulk_create 할 행 수
+    CHUNK_SIZE = 1000
+    # IN 조회 시 한 번에 넘길 값의 수 (SQLite 파라미터 개수 제한 고려)
+    LOOKUP_BATCH_SIZE = 400
+
+    def __init__(self, handle_duplicates: bool = False):
+        """
+        Args:
+            handle_duplicates: True면 중복(같은 화주사/수취인/주소/연락처) 주문도 그대로 등록합니다.
+        """
+        self.handle_duplicates = handle_duplicates
+        self.shippers = {}
+        self.channels = {}
+        self.products = {}
+        self.existing_duplicate_keys = set()
+        self.used_order_nos = set()
+
+    def import_file(self, excel_file, progress_callback=None, start_row=0, stats=None) -> dict:
+        """
+        엑셀 파일을 가져옵니다. 각 청크는 별도의 트랜잭션으로 저장됩니다.
+
+        Args:
+            excel_file: 엑셀 파일 경로 또는 파일 객체
+            progress_callback: 청크를 저장할 때마다 (처리한 행 수, 전체 행 수, 집계) 로 호출되는 함수.
+                청크와 같은 트랜잭션 안에서 호출되므로, 여기서 기록한 진행 상황은 저장된 행과 항상 일치합니다.
+                예외를 던지면 그 청크는 저장되지 않습니다.
+            start_row: [추가] 이미 저장된 앞부분 행 수 (중단된 작업을 이어서 처리할 때)
+            stats: [추가] 이어서 처리할 때 앞부분의 집계
+
+        Returns:
+            {'success_count', 'error_count', 'skipped_count'}
+        """
+        # 1차 순회: 조회 키만 모아 참조 데이터를 준비하고 전체 행 수를 셉니다.
+        total_rows = start_row + self._load_lookups(islice(self.read_rows(excel_file), start_row, None))
+
+        stats = dict(stats or {'success_count': 0, 'error_count': 0, 'skipped_count': 0})
+        processed_in_this_file = set()
+        processed_rows = start_row
+        # 2차 순회: 청크 단위로 읽으면서 바로 검증/저장합니다.
+        for chunk in chunked(islice(self.read_rows(excel_file), start_row, None), self.CHUNK_SIZE):
+            with transaction.atomic():
+                self._import_chunk(chunk, processed_in_this_file, stats)
+                processed_rows += len(chunk)
+                if progress_callback:
+                    progress_callback(processed_rows, total_rows, stats)
+        return stats
+
+    @staticmethod
+    def count_rows(excel_file) -> int:
+        """
+        시트의 데이터 행 수(헤더 제외)를 시트 크기 정보로 빠르게 추정합니다.
+        빈 행도 포함되므로 실제 주문 수보다 조금 클 수 있습니다.
+        """
+        wb = openpyxl.load_workbook(excel_file, read_only=True)
+        try:
+            max_row = wb.active.max_row
+        finally:
+            wb.close()
+        if hasattr(excel_file, 'seek'):
+            excel_file.seek(0)
+        return max(0, (max_row or 1) - 1)
+
+    @classmethod
+    def read_rows(cls, excel_file):
+        """
+        첫 번째 시트의 데이터 행(2행부터)을 주문 데이터 딕셔너리로 하나씩 반환합니다.
+        파일 객체는 처음으로 되감은 뒤 읽으므로 같은 파일을 여러 번 순회할 수 있습니다.
+        """
+        if hasattr(excel_file, 'seek'):
+            excel_file.seek(0)
+        wb = openpyxl.load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            sheet = wb.active
+            for row in sheet.iter_rows(min_row=2, values_only=True):
+                if not any(row):
+                    continue
+                row = tuple(row[:cls.COLUMN_COUNT]) + (None,) * (cls.COLUMN_COUNT - len(row))
+                yield cls._parse_row(row)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _parse_row(row: tuple) -> dict:
+        return {
+            'order_no': str(row[0]).strip() if row[0] else None, 'shipper_name': str(row[1]).strip() if row[1] else None,
+            'channel_name': str(row[2]).strip() if row[2] else None, 'recipient_name': str(row[3]).strip() if row[3] else None,
+            'recipient_phone': str(row[4]).strip() if row[4] else '', 'address': str(row[5]).strip() if row[5] else '',
+            'product_identifier': str(row[6]).strip() if row[6] else None, 'quantity': int(row[7]) if row[7] and str(row[7]).isdigit() else 0,
+        }
+
+    def _load_lookups(self, rows) -> int:
+        """
+        파일 전체에서 참조하는 화주사/판매채널/상품 색인/기존 중복 주문을 한꺼번에 준비합니다.
+        rows는 한 번만 순회하며 조회 키만 모으므로 제너레이터를 넘겨도 됩니다.
+
+        Returns:
+            순회한 행 수
+        """
+        shipper_names, channel_names, recipient_names, order_nos = set(), set(), set(), set()
+        row_count = 0
+        for r in rows:
+            row_count += 1
+            if r['shipper_name']:
+                shipper_names.add(r['shipper_name'])
+            if r['channel_name']:
+                channel_names.add(r['channel_name'])
+            recipient_names.add(r['recipient_name'] or '')
+            if r['order_no']:
+                order_nos.add(r['order_no'])
+
+        for batch in chunked(shipper_names, self.LOOKUP_BATCH_SIZE):
+            self.shippers.update((s.name, s) for s in Shipper.objects.filter(name__in=batch))
+
+        self.channels = self._get_or_create_channels(list(channel_names))
+
+        shipper_ids = [s.pk for s in self.shippers.values()]
+        self.products = {shipper_id: product_resolver.index_for(shipper_id) for shipper_id in shipper_ids}
+
+        if not self.handle_duplicates and shipper_ids:
+            for batch in chunked(recipient_names, self.LOOKUP_BATCH_SIZE):
+                self.existing_duplicate_keys.update(
+                    Order.objects.filter(shipper_id__in=shipper_ids, recipient_name__in=batch).values_list(
+                        'shipper_id', 'recipient_name', 'address', 'recipient_phone'
+                    )
+                )
+
+        # 같은 화주사/판매채널 안에서 이미 사용 중인 주문번호 (오류 주문 제외, 유니크 제약과 동일한 기준)
+        if shipper_ids:
+            for batch in chunked(order_nos, self.LOOKUP_BATCH_SIZE):
+                self.used_order_nos.update(
+                    Order.objects.filter(shipper_id__in=shipper_ids, order_no__in=batch).exclude(
+                        order_status='ERROR'
+                    ).values_list('shipper_id', 'channel_id', 'order_no')
+                )
+        return row_count
+
+    def _get_or_create_channels(self, channel_names: list) -> dict:
+        channels = {}
+        for batch in chunked(channel_names, self.LOOKUP_BATCH_SIZE):
+            channels.update((c.name, c) for c in SalesChannel.objects.filter(name__in=batch))
+        missing = [name for name in channel_names if name not in channels]
+        if missing:
+            SalesChannel.objects.bulk_create([SalesChannel(name=name) for name in missing], ignore_conflicts=True)
+            for batch in chunked(missing, self.LOOKUP_BATCH_SIZE):
+                channels.update((c.name, c) for c in SalesChannel.objects.filter(name__in=batch))
+        return channels
+
+    def _validate(self, order_data: dict, channel=None):
+        """
+        행 하나를 메모리 색인으로 검증합니다. (판매채널이 있으면 채널 상품코드 매핑도 적용)
+
+        Returns:
+            (화주사, 상품 id, 오류 목록, 오류 필드 목록)
+        """
+        errors, error_fields = [], []
+        shipper = None
+        product_id = None
+
+        if not order_data['shipper_name']: errors.append("화주사 정보 누락"); error_fields.append('shipper_name')
+        else:
+            shipper = self.shippers.get(order_data['shipper_name'])
+            if shipper is None: errors.append("미등록 화주사"); error_fields.append('shipper_name')
+
+        if not order_data['product_identifier']: errors.append("상품 정보 누락"); error_fields.append('product_identifier')
+        elif shipper:
+            product_id, reason = self.products[shipper.pk].resolve(order_data['product_identifier'], channel.pk if channel else None)
+            if product_id is None: errors.append(reason); error_fields.append('product_identifier')
+
+        if not order_data['quantity'] or order_data['quantity'] <= 0: errors.append("수량 오류"); error_fields.append('quantity')
+        if not order_data['channel_name']: errors.append("판매채널 누락"); error_fields.append('channel_name')
+        return shipper, product_id, errors, error_fields
+
+    def _import_chunk(self, chunk: list, processed_in_this_file: set, stats: dict):
+        now = timezone.now()
+        new_orders, item_products = [], []
+
+        for order_data in chunk:
+            channel = self.channels.get(order_data['channel_name'])
+            shipper, product_id, errors, error_fields = self._validate(order_data, channel)
+
+            if errors:
+                new_orders.append(self._build_error_order(order_data, shipper, channel, errors, error_fields, now))
+                item_products.append(None)
+                stats['error_count'] += 1
+                continue
+
+            recipient_name = order_data['recipient_name'] or ''
+            if not self.handle_duplicates:
+                if (shipper.pk, recipient_name, order_data['address'], order_data['recipient_phone']) in self.existing_duplicate_keys:
+                    stats['skipped_count'] += 1
+                    continue
+                file_dup_key = (order_data['shipper_name'], order_data['recipient_name'], order_data['address'], order_data['recipient_phone'])
+                if file_dup_key in processed_in_this_file:
+                    stats['skipped_count'] += 1
+                    continue
+                processed_in_this_file.add(file_dup_key)
+
+            # 같은 화주사/판매채널에 이미 있는 주문번호는 유니크 제약에 걸리므로 오류 주문으로 남깁니다.
+            if order_data['order_no']:
+                order_no_key = (shipper.pk, channel.pk, order_data['order_no'])
+                if order_no_key in self.used_order_nos:
+                    new_orders.append(self._build_error_order(order_data, shipper, channel, ["주문번호 중복"], ['order_no'], now))
+                    item_products.append(None)
+                    stats['error_count'] += 1
+                    continue
+                self.used_order_nos.add(order_no_key)
+
+            new_orders.append(Order(
+                order_no=order_data['order_no'], shipper=shipper, channel=channel,
+                recipient_name=recipient_name, recipient_phone=order_data['recipient_phone'],
+                address=order_data['address'], order_date=now, order_status='PENDING'
+            ))
+            item_products.append((product_id, order_data['quantity']))
+            stats['success_count'] += 1
+
+        # 주문번호가 없는 행은 한 번의 블록 예약으로 자동 주문번호를 받습니다.
+        Order.assign_order_numbers(new_orders)
+        Order.objects.bulk_create(new_orders)
+        Order.save_error_details(new_orders)
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, product_id=item[0], quantity=item[1])
+            for order, item in zip(new_orders, item_products)
+            if item is not None
+        ])
+        DailyOrderStat.orders_changed(new_orders)
+
+    @staticmethod
+    def _build_error_order(order_data: dict, shipper, channel, errors: list, error_fields: list, now) -> Order:
+        return Order(
+            order_no=order_data.get('order_no'),
+            shipper=shipper,  # shipper가 없는 경우 None
+            channel=channel,  # channel이 없는 경우 None
+            recipient_name=order_data.get('recipient_name') or '',
+            recipient_phone=order_data.get('recipient_phone', ''),
+            address=order_data.get('address', ''),
+            order_date=now,
+        ).mark_error(errors, error_fields, order_data)
@@ -0,0 +1,127 @@
+# orders/services/import_jobs.py
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from orders.models import OrderImportJob
+from .excel_importer import OrderExcelImporter
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJobLost(Exception):
+    """처리 신호가 끊긴 사이 다른 워커가 작업을 이어받은 경우 (이 워커는 더 저장하지 않고 멈춤)"""
+
+
+def enqueue_import(uploaded_file, handle_duplicates: bool = False, user=None, total_rows: int = 0) -> OrderImportJob:
+    """
+    업로드된 엑셀 파일을 저장하고 백그라운드 처리 대기열(QUEUED)에 등록합니다.
+    """
+    return OrderImportJob.objects.create(
+        file=uploaded_file,
+        original_filename=getattr(uploaded_file, 'name', '') or '',
+        handle_duplicates=handle_duplicates,
+        total_rows=total_rows,
+        created_by=user if user is not None and user.is_authenticated else None,
+    )
+
+
+def claim_next_job():
+    """
+    가장 오래된 대기 작업 하나를 RUNNING 상태로 선점합니다.
+    상태 조건부 UPDATE로 선점하므로 여러 워커가 동시에 돌아도 같은 작업을 두 번 처리하지 않습니다.
+
+    [수정] 처리 신호(heartbeat_at)가 ORDER_IMPORT_STALE_TIMEOUT 동안 없는 RUNNING 작업은 처리하던 워커가
+    중단된 것(워커 교체/강제 종료 등)으로 보고 다시 선점합니다. 이때는 읽어 둔 처리 신호 값이 그대로일 때만
+    선점하므로 여러 워커가 같은 작업을 동시에 이어받지 않습니다.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.ORDER_IMPORT_STALE_TIMEOUT)
+    candidates = OrderImportJob.objects.filter(
+        Q(status='QUEUED') | Q(status='RUNNING', heartbeat_at__lt=stale_before)
+    ).order_by('created_at', 'pk').values_list('pk', 'status', 'heartbeat_at')[:5]
+    for job_id, status, heartbeat_at in candidates:
+        changes = {'status': 'RUNNING', 'heartbeat_at': now}
+        if status == 'QUEUED':
+            changes['started_at'] = now
+        claimed = OrderImportJob.objects.filter(pk=job_id, status=status, heartbeat_at=heartbeat_at).update(**changes)
+        if claimed:
+            if status == 'RUNNING':
+                logger.warning(f"중단된 주문 업로드 작업을 이어서 처리합니다 (#{job_id}, 마지막 처리 신호 {heartbeat_at})")
+            return OrderImportJob.objects.get(pk=job_id)
+    return None
+
+
+def run_job(job: OrderImportJob) -> OrderImportJob:
+    """
+    선점한 작업을 실행합니다. 청크를 저장할 때마다 진행 상황을 작업 행에 기록합니다.
+
+    [수정] 진행 상황은 청크와 같은 트랜잭션에서 기록하므로 processed_rows까지는 정확히 저장되어 있습니다.
+    중단 후 다시 선점한 작업은 그 다음 행부터 이어서 처리합니다.
+    기록할 때마다 처리 신호를 갱신하며, 그 사이 다른 워커가 작업을 이어받았으면 청크를 저장하지 않고 멈춥니다.
+    """
+    heartbeat = {'at': job.heartbeat_at}
+
+    def mine():
+        return OrderImportJob.objects.filter(pk=job.pk, status='RUNNING', heartbeat_at=heartbeat['at'])
+
+    def on_progress(processed_rows, total_rows, stats):
+        now = timezone.now()
+        updated = mine().update(
+            processed_rows=processed_rows,
+            total_rows=total_rows,
+            success_count=stats['success_count'],
+            error_count=stats['error_count'],
+            skipped_count=stats['skipped_count'],
+            heartbeat_at=now,
+        )
+        if not updated:
+            raise ImportJobLost(job.pk)
+        heartbeat['at'] = now
+
+    importer = OrderExcelImporter(handle_duplicates=job.handle_duplicates)
+    resumed_stats = {
+        'success_count': job.success_count, 'error_count': job.error_count, 'skipped_count': job.skipped_count,
+    }
+    try:
+        with job.file.open('rb') as excel_file:
+            stats = importer.import_file(
+                excel_file, progress_callback=on_progress, start_row=job.processed_rows, stats=resumed_stats
+            )
+    except ImportJobLost:
+        logger.warning(f"다른 워커가 이어받은 주문 업로드 작업의 처리를 멈춥니다 (#{job.pk})")
+    except Exception as e:
+        logger.error(f"주문 업로드 작업 실패 (#{job.pk}): {str(e)}", exc_info=True)
+        mine().update(status='FAILED', message=f'처리 중 오류 발생: {str(e)}', finished_at=timezone.now())
+    else:
+        mine().update(
+            status='DONE',
+            success_count=stats['success_count'],
+            error_count=stats['error_count'],
+            skipped_count=stats['skipped_count'],
+            message=f"엑셀 처리가 완료되었습니다. 성공: {stats['success_count']}건, 실패: {stats['error_count']}건",
+            finished_at=timezone.now(),
+        )
+    job.refresh_from_db()
+    return job
+
+
+def process_pending_import_jobs(max_jobs=None) -> int:
+    """
+    대기 중인 업로드 작업을 순서대로 처리하고, 처리한 작업 수를 반환합니다.
+
+    Args:
+        max_jobs: 한 번에 처리할 최대 작업 수 (None이면 대기열이 빌 때까지)
+    """
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        job = claim_next_job()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
@@ -1,24 +1,136 @@
 # orders/services/order_collector.py
 import json
 import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from django.db import transaction, models
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
 from django.utils import timezone
 
-from management.models import ShipperApiInfo, Shipper, SalesChannel, Product
-from orders.models import Order, OrderItem, ApiCollectionLog
+from management.models import ShipperApiInfo, Shipper, SalesChannel
+from orders.models import ApiCollectionLog
 from orders.api_clients import (
     CoupangClient, NaverClient, ElevenSTClient,
     GmarketClient, AuctionClient, WemakepriceClient,
     TmonClient, InterparkClient
 )
+from .order_ingestor import CollectedOrderIngestor
 
 logger = logging.getLogger(__name__)
 
 
+class ChannelOrderStore:
+    """
+    한 채널(ShipperApiInfo)의 조회 페이지를 도착하는 대로 저장하고 결과를 집계하는 저장 단계 상태
+
+    - 페이지를 저장할 때마다 다음 페이지 토큰을 커서(cursor_token)에 기록합니다.
+    - 조회 구간이 끝나면 커서(last_collected_at)를 구간 끝으로 옮기고 페이지 토큰을 비웁니다.
+    - 커서는 저장이 커밋된 뒤에만 이동하며 뒤로 돌아가지 않습니다.
+    """
+
+    def __init__(self, api_info: ShipperApiInfo):
+        self.api_info = api_info
+        self.ingestor = None
+        self.page_count = 0
+        self.api_total_count = 0
+        self.success_count = 0
+        self.error_count = 0
+        self.duplicate_count = 0
+        self.error_messages = []
+        self.error = None  # 저장 중 발생한 예외
+
+    # 저장은 CollectedOrderIngestor가 청크 단위 트랜잭션으로 처리하므로 여기서는 transaction.atomic을 쓰지 않음
+    def add_page(self, page, window_end: datetime):
+        """조회된 페이지 하나를 저장합니다. 실패하면 예외를 self.error에 보관합니다."""
+        try:
+            if self.ingestor is None:
+                # 판매 채널 객체 가져오기 또는 생성
+                sales_channel, _ = SalesChannel.objects.get_or_create(name=self.api_info.get_channel_type_display())
+                self.ingestor = CollectedOrderIngestor(self.api_info.shipper, sales_channel)
+
+            stats = self.ingestor.ingest(page.orders)
+            self.page_count += 1
+            self.api_total_count += len(page.orders)
+            self.success_count += stats['success_count']
+            self.error_count += stats['error_count']
+            self.duplicate_count += stats['duplicate_count']
+            self.error_messages.extend(stats['error_messages'])
+
+            if page.next_token:
+                self._update_cursor(cursor_token=page.next_token, cursor_window_end=window_end)
+        except Exception as e:
+            self.error = e
+
+    def complete_window(self, window_end: datetime):
+        """조회 구간의 모든 페이지가 저장되었으므로 커서를 구간 끝으로 옮깁니다."""
+        try:
+            self._update_cursor(
+                forward_only=True, last_collected_at=window_end, cursor_token='', cursor_window_end=None
+            )
+        except Exception as e:
+            self.error = e
+
+    def _update_cursor(self, forward_only: bool = False, **fields):
+        api_info = self.api_info
+        for name, value in fields.items():
+            setattr(api_info, name, value)
+
+        def save():
+            targets = ShipperApiInfo.objects.filter(pk=api_info.pk)
+            if forward_only:
+                targets = targets.filter(
+                    Q(last_collected_at__isnull=True) | Q(last_collected_at__lt=fields['last_collected_at'])
+                )
+            targets.update(**fields)
+
+        transaction.on_commit(save)
+
+    def finish(self) -> dict:
+        """
+        수집 로그를 기록하고 채널의 수집 결과 딕셔너리를 반환합니다.
+        """
+        api_info = self.api_info
+
+        # 수집 로그 기록
+        log_status = 'SUCCESS' if self.error_count == 0 else ('PARTIAL' if self.success_count > 0 else 'FAILED')
+        ApiCollectionLog.objects.create(
+            shipper=api_info.shipper,
+            channel_type=api_info.channel_type,
+            status=log_status,
+            total_count=self.api_total_count,
+            success_count=self.success_count,
+            error_count=self.error_count,
+            error_message='; '.join(self.error_messages[:5]) if self.error_messages else ''  # 처음 5개만
+        )
+
+        return {
+            'shipper': api_info.shipper.name,
+            'channel': api_info.get_channel_type_display(),
+            'status': 'success',
+            'collected_count': self.success_count + self.error_count,  # [수정] 실제 생성된 주문 수 (중복 제외)
+            'success_count': self.success_count,
+            'error_count': self.error_count,
+            'duplicate_count': self.duplicate_count,  # [추가] 중복 건수
+            'api_total_count': self.api_total_count  # [추가] API에서 받아온 전체 건수
+        }
+
+
 class OrderCollectorService:
     """
     쇼핑몰 API로부터 주문을 수집하는 서비스
+
+    수집은 두 단계로 나뉘며 두 단계가 동시에 진행됩니다.
+    1. 조회 단계: 모든 채널의 API를 스레드 풀에서 동시에 페이지 단위로 호출합니다. (DB 접근 없음)
+    2. 저장 단계: 도착한 페이지를 호출한 스레드에서 순서대로 DB에 저장합니다.
+    따라서 한 사이클의 소요 시간은 모든 채널의 합이 아니라 가장 느린 채널에 가깝고,
+    마지막 페이지를 받기 전에 저장이 시작되며 메모리에는 큐에 쌓인 몇 페이지만 올라갑니다.
+
+    조회 구간은 채널(ShipperApiInfo)별 커서(last_collected_at)부터 현재까지이며,
+    ORDER_COLLECTOR_WINDOW_MINUTES 크기의 구간으로 나누어 오래된 구간부터 조회합니다.
+    커서는 구간의 주문이 모두 커밋된 뒤에만 앞으로 이동하므로, 실패하거나 밀린 구간은 다음 수집에서 이어서 조회됩니다.
     """
     
     # 쇼핑몰 타입과 API 클라이언트 매핑
@@ -54,35 +166,20 @@ class OrderCollectorService:
         api_infos = ShipperApiInfo.objects.filter(
             shipper=shipper,
             is_active=True
-        )
+        ).select_related('shipper')
         
         if channel_type:
             api_infos = api_infos.filter(channel_type=channel_type)
         
-        if not api_infos.exists():
+        api_infos = list(api_infos)
+        if not api_infos:
             return {'status': 'error', 'message': '활성화된 API 정보가 없습니다.'}
         
-        total_collected = 0
-        total_success = 0
-        total_error = 0
-        total_duplicate = 0
-        results = []
-        
-        for api_info in api_infos:
-            result = cls._collect_from_channel(shipper, api_info)
-            results.append(result)
-            total_collected += result.get('collected_count', 0) # 신규 생성 (성공+오류)
-            total_success += result.get('success_count', 0)
-            total_error += result.get('error_count', 0)
-            total_duplicate += result.get('duplicate_count', 0)
-        
-        # [수정] 심플하고 명확한 메시지 (전체 처리 기준)
-        total_total = total_collected + total_duplicate
-        message = f"총 {total_total}건 처리 (신규 성공: {total_success}, 신규 오류: {total_error}, 중복: {total_duplicate})"
+        results = cls._collect_from_channels(api_infos)
         
         return {
             'status': 'success',
-            'message': message,
+            'message': cls._build_summary_message(results),
             'results': results
         }
     
@@ -94,39 +191,15 @@ class OrderCollectorService:
         Returns:
             수집 결과 딕셔너리
         """
-        api_infos = ShipperApiInfo.objects.filter(is_active=True).select_related('shipper')
+        api_infos = list(ShipperApiInfo.objects.filter(is_active=True).select_related('shipper'))
         
-        if not api_infos.exists():
+        if not api_infos:
             logger.info("활성화된 API 정보가 없습니다.")
             return {'status': 'info', 'message': '활성화된 API 정보가 없습니다.'}
         
-        total_collected = 0
-        total_success = 0
-        total_error = 0
-        total_duplicate = 0
-        results = []
-        
-        for api_info in api_infos:
-            try:
-                result = cls._collect_from_channel(api_info.shipper, api_info)
-                results.append(result)
-                total_collected += result.get('collected_count', 0) # 신규 생성 (성공+오류)
-                total_success += result.get('success_count', 0)
-                total_error += result.get('error_count', 0)
-                total_duplicate += result.get('duplicate_count', 0)
-            except Exception as e:
-                logger.error(f"주문 수집 오류 ({api_info}): {str(e)}")
-                results.append({
-                    'shipper': api_info.shipper.name,
-                    'channel': api_info.get_channel_type_display(),
-                    'status': 'error',
-                    'message': str(e)
-                })
-        
-        # [수정] 심플하고 명확한 메시지 (전체 처리 기준)
-        total_total = total_collected + total_duplicate
-        message = f"총 {total_total}건 처리 (신규 성공: {total_success}, 신규 오류: {total_error}, 중복: {total_duplicate})"
+        results = cls._collect_from_channels(api_infos)
         
+        message = cls._build_summary_message(results)
         logger.info(message)
         return {
             'status': 'success',
@@ -134,217 +207,260 @@ class OrderCollectorService:
             'results': results
         }
     
+    @staticmethod
+    def _build_summary_message(results: list) -> str:
+        """채널별 수집 결과를 합산하여 요약 메시지를 만듭니다."""
+        total_collected = sum(r.get('collected_count', 0) for r in results)  # 신규 생성 (성공+오류)
+        total_success = sum(r.get('success_count', 0) for r in results)
+        total_error = sum(r.get('error_count', 0) for r in results)
+        total_duplicate = sum(r.get('duplicate_count', 0) for r in results)
+        
+        # [수정] 심플하고 명확한 메시지 (전체 처리 기준)
+        total_total = total_collected + total_duplicate
+        return f"총 {total_total}건 처리 (신규 성공: {total_success}, 신규 오류: {total_error}, 중복: {total_duplicate})"
+    
     @classmethod
-    # [수정] transaction.atomic 제거: 개별 주문 저장 실패가 전체 롤백을 유발하지 않도록 함
-    def _collect_from_channel(cls, shipper: Shipper, api_info: ShipperApiInfo) -> dict:
+    def _collect_from_channels(cls, api_infos: list) -> list:
         """
-        특정 쇼핑몰 채널에서 주문을 수집합니다.
+        여러 채널의 주문을 동시에 조회하면서, 도착한 페이지를 하나의 저장 단계에서 순서대로 DB에 기록합니다.
         
         Args:
-            shipper: 화주사 객체
-            api_info: API 정보 객체
+            api_infos: 수집할 ShipperApiInfo 목록 (shipper가 select_related 되어 있어야 함)
         
         Returns:
-            수집 결과 딕셔너리
+            채널별 수집 결과 딕셔너리 목록 (api_infos와 같은 순서)
         """
-        channel_type = api_info.channel_type
-        channel_name = api_info.get_channel_type_display()
+        results = {}
+        fetch_jobs = []
+        now = timezone.now()
+        
+        for api_info in api_infos:
+            client = cls._build_client(api_info)
+            if client is None:
+                results[api_info.pk] = {
+                    'shipper': api_info.shipper.name,
+                    'channel': api_info.get_channel_type_display(),
+                    'status': 'error',
+                    'message': f'지원하지 않는 쇼핑몰입니다: {api_info.channel_type}'
+                }
+                continue
+            if client.requires_token:
+                # 토큰 발급/DB 캐시 조회는 조회 스레드가 아닌 여기서 미리 처리합니다. (대부분 메모리 캐시에서 바로 반환)
+                try:
+                    client.get_access_token()
+                except Exception as e:
+                    results[api_info.pk] = cls._record_channel_failure(api_info.shipper, api_info, e)
+                    continue
+            windows, page_token = cls._plan_windows(api_info, now)
+            fetch_jobs.append((api_info, client, windows, page_token))
         
-        # API 클라이언트 생성
-        client_class = cls.CLIENT_MAP.get(channel_type)
+        stores = {api_info.pk: ChannelOrderStore(api_info) for api_info, _, _, _ in fetch_jobs}
+        fetch_errors = cls._fetch_and_store(fetch_jobs, stores)
+        
+        for api_info, _, _, _ in fetch_jobs:
+            store = stores[api_info.pk]
+            fetch_error = fetch_errors.get(api_info.pk)
+            try:
+                if store.error is not None:
+                    raise store.error
+                if fetch_error is not None and not store.page_count:
+                    raise fetch_error
+                if fetch_error is not None:
+                    # 저장된 페이지까지는 커서가 이동했으므로, 실패한 지점부터 다음 수집에서 다시 조회합니다.
+                    logger.warning(f"주문 조회 일부 실패 ({api_info}): {str(fetch_error)}")
+                results[api_info.pk] = store.finish()
+            except Exception as e:
+                results[api_info.pk] = cls._record_channel_failure(api_info.shipper, api_info, e)
+        
+        return [results[api_info.pk] for api_info in api_infos]
+    
+    @classmethod
+    def _build_client(cls, api_info: ShipperApiInfo):
+        """
+        API 정보로 쇼핑몰 클라이언트를 생성합니다. 지원하지 않는 쇼핑몰이면 None을 반환합니다.
+        """
+        client_class = cls.CLIENT_MAP.get(api_info.channel_type)
         if not client_class:
-            return {
-                'shipper': shipper.name,
-                'channel': channel_name,
-                'status': 'error',
-                'message': f'지원하지 않는 쇼핑몰입니다: {channel_type}'
-            }
+            return None
         
         try:
             extra_info = json.loads(api_info.extra_info) if api_info.extra_info else {}
         except json.JSONDecodeError:
             extra_info = {}
         
-        client = client_class(
+        return client_class(
             access_key=api_info.access_key,
             secret_key=api_info.secret_key,
-            extra_info=extra_info
+            extra_info=extra_info,
+            api_info=api_info
         )
+    
+    @staticmethod
+    def _plan_windows(api_info: ShipperApiInfo, now: datetime) -> tuple:
+        """
+        채널의 커서부터 현재까지를 조회 구간 목록으로 나눕니다.
+        커서가 없으면(최초 수집) ORDER_COLLECTOR_INITIAL_LOOKBACK_MINUTES 전부터 조회합니다.
+        이전 수집이 구간 중간에서 멈췄다면 첫 구간은 저장된 페이지 토큰부터 이어서 조회합니다.
+        
+        Returns:
+            ([(구간 시작, 구간 끝), ...], 첫 구간의 페이지 토큰 또는 None)
+            구간은 오래된 것부터, 최대 ORDER_COLLECTOR_MAX_WINDOWS_PER_RUN개
+        """
+        window = timedelta(minutes=settings.ORDER_COLLECTOR_WINDOW_MINUTES)
+        start = api_info.last_collected_at or now - timedelta(minutes=settings.ORDER_COLLECTOR_INITIAL_LOOKBACK_MINUTES)
+        
+        windows = []
+        page_token = None
+        if api_info.cursor_token and api_info.cursor_window_end and api_info.cursor_window_end > start:
+            windows.append((start, api_info.cursor_window_end))
+            page_token = api_info.cursor_token
+            start = api_info.cursor_window_end
+        
+        while start < now and len(windows) < settings.ORDER_COLLECTOR_MAX_WINDOWS_PER_RUN:
+            end = min(start + window, now)
+            windows.append((start, end))
+            start = end
+        return windows, page_token
+    
+    @classmethod
+    def _fetch_and_store(cls, fetch_jobs: list, stores: dict) -> dict:
+        """
+        스레드 풀에서 채널별 fetch_order_pages를 동시에 호출하고, 받은 페이지를 도착하는 대로 저장합니다.
         
-        # 최근 30분 주문 조회
-        end_date = timezone.now()
-        start_date = end_date - timedelta(minutes=30)
+        - 조회 스레드는 페이지를 크기가 ORDER_COLLECTOR_PAGE_QUEUE_SIZE인 큐에 넣기만 합니다. (토큰 재발급 외에는 DB 접근 없음)
+          저장이 밀리면 큐가 차서 조회도 잠시 멈추므로, 대량 조회에서도 메모리에는 몇 페이지만 올라갑니다.
+        - DB 저장은 이 메서드를 호출한 스레드 하나에서만 수행합니다.
+        - 한 채널의 조회 구간이 여러 개이면 같은 조회 스레드에서 오래된 구간부터 차례로 호출합니다.
+        - 동시 호출 수는 ORDER_COLLECTOR_MAX_WORKERS로 제한되며, 한 번의 API 호출(페이지 조회)이
+          ORDER_COLLECTOR_FETCH_TIMEOUT(초) 안에 응답하지 않은 채널은 시간 초과로 처리하고 더 이상 기다리지 않습니다.
         
+        Args:
+            fetch_jobs: [(api_info, client, 조회 구간 목록, 첫 구간의 페이지 토큰), ...]
+            stores: {api_info.pk: ChannelOrderStore}
+        
+        Returns:
+            {api_info.pk: 조회 중 발생한 예외} (조회에 실패한 채널만)
+        """
+        fetch_errors = {}
+        if not fetch_jobs:
+            return fetch_errors
+        
+        timeout = settings.ORDER_COLLECTOR_FETCH_TIMEOUT
+        max_workers = max(1, min(settings.ORDER_COLLECTOR_MAX_WORKERS, len(fetch_jobs)))
+        page_queue = queue.Queue(maxsize=settings.ORDER_COLLECTOR_PAGE_QUEUE_SIZE)
+        started_at = {}  # api_info.pk -> 진행 중인 API 호출의 시작 시각 (호출 중이 아니면 None)
+        cancelled = set()  # 더 이상 결과를 받지 않는 채널
+        
+        def put(api_info, item):
+            # 저장 단계가 밀려 큐가 가득 찬 동안은 시간 초과 계산에서 제외합니다.
+            started_at[api_info.pk] = None
+            while api_info.pk not in cancelled:
+                try:
+                    page_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce(api_info, client, windows, page_token):
+            try:
+                for start_date, end_date in windows:
+                    started_at[api_info.pk] = time.monotonic()
+                    for page in client.fetch_order_pages(start_date, end_date, page_token=page_token):
+                        if not put(api_info, ('page', api_info, page, end_date)):
+                            return
+                        started_at[api_info.pk] = time.monotonic()
+                    page_token = None
+                    if not put(api_info, ('window_done', api_info, None, end_date)):
+                        return
+                put(api_info, ('done', api_info, None, None))
+            except Exception as e:
+                put(api_info, ('error', api_info, e, None))
+            finally:
+                # 긴 수집 중 토큰 재발급으로 이 스레드에서 DB 연결이 열렸다면 닫아 둡니다.
+                connections.close_all()
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='order-fetch')
+        active = {api_info.pk for api_info, _, _, _ in fetch_jobs}
         try:
-            # API에서 주문 조회
-            orders_data = client.fetch_orders(start_date, end_date)
-            
-            success_count = 0
-            error_count = 0
-            duplicate_count = 0  # [추가] 중복 건수 카운트
-            error_messages = []
+            for job in fetch_jobs:
+                executor.submit(produce, *job)
             
-            # 판매 채널 객체 가져오기 또는 생성
-            sales_channel, _ = SalesChannel.objects.get_or_create(name=channel_name)
-            
-            for order_data in orders_data:
+            while active:
                 try:
-                    # 중복 체크 - 같은 order_no가 있는지 확인
-                    existing_order = Order.objects.filter(order_no=order_data.get('order_no')).first()
-                    if existing_order:
-                        duplicate_count += 1  # [추가] 중복 카운트 증가
-                        print(f"⚠️  중복 주문번호 발견, 건너뜀: {order_data.get('order_no')}")
-                        continue
-                    
-                    # 주문 생성
-                    order = Order.objects.create(
-                        shipper=shipper,
-                        channel=sales_channel,
-                        order_no=order_data.get('order_no'),
-                        # [수정] 수집된 주문을 리스트 상단(오늘)에 무조건 노출시키기 위해 현재 시간 사용
-                        # 원본 주문일자는 필요하다면 별도 필드나 비고에 저장 고려
-                        order_date=timezone.now(),
-                        recipient_name=order_data.get('recipient_name', ''),
-                        recipient_phone=order_data.get('recipient_phone', ''),
-                        address=order_data.get('address', ''),
-                        postcode=order_data.get('postcode', ''),
-                        delivery_memo=order_data.get('delivery_memo', ''),
-                        order_status='PENDING'
-                    )
-                    
-                    print(f"✅ Order 생성 성공: ID={order.id}, 주문번호={order.order_no}, 날짜={order.order_date.strftime('%Y-%m-%d')}")
-                    
-                    # [수정] 주문 단위로 성공/실패 판단하기 위한 플래그
-                    order_has_error = False
-                    
-                    # 주문 상품 생성
-                    for item_data in order_data.get('items', []):
-                        product_identifier = item_data.get('product_identifier')
-                        quantity = item_data.get('quantity', 1)
-                        
-                        # 상품 조회 (바코드 또는 이름으로)
-                        try:
-                            product = Product.objects.filter(
-                                shipper=shipper
-                            ).filter(
-                                models.Q(barcode=product_identifier) |
-                                models.Q(name=product_identifier)
-                            ).first()
-                            
-                            if product:
-                                OrderItem.objects.create(
-                                    order=order,
-                                    product=product,
-                                    quantity=quantity
-                                )
-                                print(f"✅ OrderItem 생성 성공: 상품 {product.name}")
-                            else:
-                                # 상품을 찾을 수 없으면 오류로 처리
-                                # JSON 직렬화를 위해 datetime을 문자열로 변환
-                                serializable_data = order_data.copy()
-                                if 'order_date' in serializable_data and isinstance(serializable_data['order_date'], datetime):
-                                    serializable_data['order_date'] = serializable_data['order_date'].isoformat()
-                                
-                                order.order_status = 'ERROR'
-                                order.error_message = json.dumps({
-                                    'error_message': f'미등록 상품: {product_identifier}',
-                                    'error_fields': ['product_identifier'],
-                                    'original_data': serializable_data
-                                }, ensure_ascii=False)
-                                order.save()
-                                order_has_error = True  # [수정] 플래그 설정
-                                error_messages.append(f'미등록 상품: {product_identifier}')
-                                print(f"⚠️  상품 없음, ERROR로 변경: {product_identifier}")
-                                break  # [추가] 오류 발생 시 더 이상 상품 처리하지 않음
-                        except Exception as e:
-                            order_has_error = True  # [수정] 플래그 설정
-                            error_messages.append(f'상품 처리 오류: {str(e)}')
-                            print(f"❌ 상품 처리 오류: {str(e)}")
-                            break  # [추가] 오류 발생 시 더 이상 상품 처리하지 않음
-                    
-                    # [추가] 주문 단위로 성공/오류 카운트
-                    if order_has_error:
-                        error_count += 1
+                    kind, api_info, payload, window_end = page_queue.get(timeout=min(1.0, timeout))
+                except queue.Empty:
+                    kind = None
+                
+                if kind is not None and api_info.pk in active:
+                    store = stores[api_info.pk]
+                    if kind == 'page':
+                        store.add_page(payload, window_end)
+                    elif kind == 'window_done':
+                        store.complete_window(window_end)
                     else:
-                        success_count += 1
-                            
-                except Exception as e:
-                    # [수정] 주문 생성 중 에러 발생 시에도 DB에 'ERROR' 상태로 저장하여 누락 방지
-                    error_count += 1
-                    err_msg = str(e)
-                    error_messages.append(f'주문 생성 오류: {err_msg}')
-                    logger.error(f"주문 생성 실패 ({channel_name}): {err_msg}")
-                    print(f"❌ 주문 생성 실패: {err_msg}")
-                    
-                    try:
-                        # 최소한의 정보로 오류 주문 생성 시도
-                        # JSON 직렬화를 위해 datetime 처리
-                        serializable_data = order_data.copy()
-                        if 'order_date' in serializable_data and isinstance(serializable_data['order_date'], datetime):
-                            serializable_data['order_date'] = serializable_data['order_date'].isoformat()
-                            
-                        Order.objects.create(
-                            shipper=shipper,
-                            channel=sales_channel, # 위에서 생성/조회한 channel 재사용
-                            order_no=order_data.get('order_no'),
-                            order_date=order_data.get('order_date', timezone.now()),
-                            recipient_name=order_data.get('recipient_name', '알수없음'),
-                            recipient_phone=order_data.get('recipient_phone', ''),
-                            address=order_data.get('address', ''),
-                            order_status='ERROR',
-                            error_message=json.dumps({
-                                'error_message': f'시스템 오류: {err_msg}',
-                                'error_fields': [],
-                                'original_data': serializable_data
-                            }, ensure_ascii=False)
-                        )
-                    except Exception as create_err:
-                        # 오류 주문 저장조차 실패하면 어쩔 수 없이 로그만 남김 (매우 드문 케이스)
-                        logger.critical(f"오류 주문 저장 실패: {str(create_err)}")
-            
-            # 수집 로그 기록
-            log_status = 'SUCCESS' if error_count == 0 else ('PARTIAL' if success_count > 0 else 'FAILED')
-            ApiCollectionLog.objects.create(
-                shipper=shipper,
-                channel_type=channel_type,
-                status=log_status,
-                total_count=len(orders_data),
-                success_count=success_count,
-                error_count=error_count,
-                error_message='; '.join(error_messages[:5]) if error_messages else ''  # 처음 5개만
-            )
-            
-            # [수정] 실제 생성된 주문 수 반환 (중복 제외)
-            actual_created_count = success_count + error_count
-            
-            return {
-                'shipper': shipper.name,
-                'channel': channel_name,
-                'status': 'success',
-                'collected_count': actual_created_count,  # [수정] 실제 생성된 주문 수
-                'success_count': success_count,
-                'error_count': error_count,
-                'duplicate_count': duplicate_count,  # [추가] 중복 건수
-                'api_total_count': len(orders_data)  # [추가] API에서 받아온 전체 건수
-            }
-            
-        except Exception as e:
-            logger.error(f"API 호출 실패 ({channel_name}): {str(e)}")
-            
-            # 실패 로그 기록
-            ApiCollectionLog.objects.create(
-                shipper=shipper,
-                channel_type=channel_type,
-                status='FAILED',
-                total_count=0,
-                success_count=0,
-                error_count=0,
-                error_message=str(e)
-            )
-            
-            return {
-                'shipper': shipper.name,
-                'channel': channel_name,
-                'status': 'error',
-                'message': str(e)
-            }
+                        active.discard(api_info.pk)
+                        if kind == 'error':
+                            fetch_errors[api_info.pk] = payload
+                    if store.error is not None:
+                        # 저장에 실패한 채널은 조회도 중단합니다.
+                        active.discard(api_info.pk)
+                        cancelled.add(api_info.pk)
+                
+                # API 호출이 시작된 뒤 제한 시간을 넘긴 채널은 결과를 버리고 실패로 처리합니다.
+                now = time.monotonic()
+                for api_info, _, _, _ in fetch_jobs:
+                    begun = started_at.get(api_info.pk)
+                    if api_info.pk in active and begun is not None and now - begun > timeout:
+                        active.discard(api_info.pk)
+                        cancelled.add(api_info.pk)
+                        logger.warning(f"주문 조회 시간 초과 ({api_info}): {timeout}초")
+                        fetch_errors[api_info.pk] = TimeoutError(f'API 응답 시간 초과 ({timeout}초)')
+        finally:
+            # 시간 초과된 호출이 남아 있어도 수집 사이클은 기다리지 않고 종료합니다.
+            cancelled.update(stores)
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return fetch_errors
+    
+    @classmethod
+    def _collect_from_channel(cls, shipper: Shipper, api_info: ShipperApiInfo) -> dict:
+        """
+        특정 쇼핑몰 채널에서 주문을 수집합니다.
+        
+        Args:
+            shipper: 화주사 객체
+            api_info: API 정보 객체
+        
+        Returns:
+            수집 결과 딕셔너리
+        """
+        if api_info.shipper_id != shipper.pk:
+            api_info.shipper = shipper
+        return cls._collect_from_channels([api_info])[0]
+    
+    @classmethod
+    def _record_channel_failure(cls, shipper: Shipper, api_info: ShipperApiInfo, error: Exception) -> dict:
+        """
+        채널 수집 실패를 로그로 남기고 실패 결과 딕셔너리를 반환합니다.
+        """
+        channel_name = api_info.get_channel_type_display()
+        logger.error(f"API 호출 실패 ({channel_name}): {str(error)}")
+        
+        # 실패 로그 기록
+        ApiCollectionLog.objects.create(
+            shipper=shipper,
+            channel_type=api_info.channel_type,
+            status='FAILED',
+            total_count=0,
+            success_count=0,
+            error_count=0,
+            error_message=str(error)
+        )
+        
+        return {
+            'shipper': shipper.name,
+            'channel': channel_name,
+            'status': 'error',
+            'message': str(error)
+        }
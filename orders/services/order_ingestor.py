@@ -0,0 +1,213 @@
+# orders/services/order_ingestor.py
+import logging
+from datetime import datetime
+from django.db import transaction
+from django.utils import timezone
+
+from management.models import Shipper, SalesChannel
+from orders.models import DailyOrderStat, Order, OrderItem
+from .product_resolver import ShipperProductIndex, product_resolver
+from .utils import chunked
+
+logger = logging.getLogger(__name__)
+
+
+def _serializable(order_data: dict) -> dict:
+    """JSON 직렬화를 위해 datetime 값을 문자열로 변환한 사본을 반환합니다."""
+    serializable_data = order_data.copy()
+    if 'order_date' in serializable_data and isinstance(serializable_data['order_date'], datetime):
+        serializable_data['order_date'] = serializable_data['order_date'].isoformat()
+    return serializable_data
+
+
+class CollectedOrderIngestor:
+    """
+    쇼핑몰 API에서 조회한 주문 목록을 일괄로 저장하는 수집 단계
+
+    - 배치 전체의 주문번호 중복 여부를 몇 번의 IN 쿼리로 미리 조회합니다.
+      오류로 남아 있는 주문번호는 이번에 정상 주문이 되는 경우에만 같은 트랜잭션에서 기존 오류 주문을 지우고 새로 저장하며,
+      여전히 오류이면 중복으로 건너뜁니다. (주문번호마다 한 행만 남음)
+    - 상품 식별자(채널 상품코드/바코드/상품명)는 화주사별로 캐시된 상품 색인(ProductResolver)에서 메모리로 찾습니다.
+    - Order/OrderItem은 CHUNK_SIZE 단위 트랜잭션 안에서 bulk_create로 저장합니다.
+    """
+
+    # 한 트랜잭션에서 저장할 주문 수
+    CHUNK_SIZE = 500
+    # IN 조회 시 한 번에 넘길 값의 수 (SQLite 파라미터 개수 제한 고려)
+    LOOKUP_BATCH_SIZE = 400
+
+    def __init__(self, shipper: Shipper, sales_channel: SalesChannel):
+        self.shipper = shipper
+        self.sales_channel = sales_channel
+
+    def ingest(self, orders_data: list) -> dict:
+        """
+        주문 목록을 저장합니다.
+
+        Returns:
+            {'success_count', 'error_count', 'duplicate_count', 'error_messages'}
+        """
+        stats = {'success_count': 0, 'error_count': 0, 'duplicate_count': 0, 'error_messages': []}
+
+        existing_order_nos, error_order_nos = self._fetch_existing_order_nos(orders_data)
+        products = product_resolver.index_for(self.shipper.pk)
+
+        # 이미 저장된 주문번호와 배치 안에서 반복된 주문번호는 중복으로 건너뜁니다.
+        new_orders_data = []
+        for order_data in orders_data:
+            order_no = order_data.get('order_no')
+            if order_no and order_no in existing_order_nos:
+                stats['duplicate_count'] += 1
+                continue
+            if order_no:
+                existing_order_nos.add(order_no)
+            new_orders_data.append(order_data)
+
+        for chunk in chunked(new_orders_data, self.CHUNK_SIZE):
+            self._ingest_chunk(chunk, products, stats, error_order_nos)
+
+        logger.debug(
+            f"주문 저장 완료 ({self.shipper.name}/{self.sales_channel.name}): "
+            f"성공 {stats['success_count']}, 오류 {stats['error_count']}, 중복 {stats['duplicate_count']}"
+        )
+        return stats
+
+    def _registered_orders(self):
+        # [수정] 주문번호는 화주사/판매채널별로 유일하므로(unique_order_no_per_shipper_channel) 같은 범위에서만 찾습니다.
+        return Order.objects.filter(shipper_id=self.shipper.pk, channel_id=self.sales_channel.pk)
+
+    def _fetch_existing_order_nos(self, orders_data: list) -> tuple:
+        """
+        Returns:
+            (정상 주문으로 등록된 주문번호 집합, 오류 주문으로만 남아 있는 주문번호 집합)
+        """
+        order_nos = list({o.get('order_no') for o in orders_data if o.get('order_no')})
+        existing, errored = set(), set()
+        for batch in chunked(order_nos, self.LOOKUP_BATCH_SIZE):
+            rows = self._registered_orders().filter(order_no__in=batch).values_list('order_no', 'order_status')
+            for order_no, status in rows:
+                (errored if status == 'ERROR' else existing).add(order_no)
+        return existing, errored - existing
+
+    def _build_order(self, order_data: dict, products: ShipperProductIndex):
+        """
+        주문 데이터로 저장 전 Order 객체와 (상품 id, 수량) 목록, 오류 메시지를 만듭니다.
+        미등록 상품이나 여러 개가 일치하는 상품이 나오면 주문을 ERROR 상태로 만들고 이후 상품은 처리하지 않습니다.
+        """
+        order = Order(
+            shipper=self.shipper,
+            channel=self.sales_channel,
+            order_no=order_data.get('order_no'),
+            # [수정] 수집된 주문을 리스트 상단(오늘)에 무조건 노출시키기 위해 현재 시간 사용
+            # 원본 주문일자는 필요하다면 별도 필드나 비고에 저장 고려
+            order_date=timezone.now(),
+            recipient_name=order_data.get('recipient_name', ''),
+            recipient_phone=order_data.get('recipient_phone', ''),
+            address=order_data.get('address', ''),
+            postcode=order_data.get('postcode', ''),
+            delivery_memo=order_data.get('delivery_memo', ''),
+            order_status='PENDING'
+        )
+
+        items = []
+        error = None
+        for item_data in order_data.get('items', []):
+            product_identifier = item_data.get('product_identifier')
+            product_id, reason = products.resolve(product_identifier, self.sales_channel.pk)
+            if product_id is None:
+                error = f'{reason}: {product_identifier}'
+                order.mark_error([error], ['product_identifier'], _serializable(order_data), product_identifier)
+                break
+            items.append((product_id, item_data.get('quantity', 1)))
+        return order, items, error
+
+    def _ingest_chunk(self, chunk: list, products: ShipperProductIndex, stats: dict, error_order_nos: set):
+        built = []
+        for order_data in chunk:
+            entry = self._build_order(order_data, products)
+            if entry[2] and order_data.get('order_no') in error_order_nos:
+                # 오류로 남아 있는 주문이 아직도 오류이면 오류 주문을 하나 더 만들지 않습니다.
+                stats['duplicate_count'] += 1
+                continue
+            built.append((order_data, entry))
+        if not built:
+            return
+        chunk, built = [order_data for order_data, _ in built], [entry for _, entry in built]
+        try:
+            with transaction.atomic():
+                self._save_built_orders(built, error_order_nos)
+        except Exception as e:
+            # 일괄 저장이 실패하면 어떤 주문이 문제인지 알 수 없으므로 건별로 다시 저장합니다.
+            logger.warning(f"주문 일괄 저장 실패, 건별 저장으로 전환 ({self.sales_channel.name}): {str(e)}")
+            for order_data, entry in zip(chunk, built):
+                self._ingest_single(order_data, entry, stats, error_order_nos)
+            return
+
+        for _, _, error in built:
+            if error:
+                stats['error_count'] += 1
+                stats['error_messages'].append(error)
+            else:
+                stats['success_count'] += 1
+
+    def _save_built_orders(self, built: list, error_order_nos: set = frozenset()):
+        orders = [order for order, _, _ in built]
+        # 정상 주문으로 다시 수집된 주문번호의 기존 오류 주문은 새 주문으로 교체합니다.
+        # (일자별 집계에서도 빠지고, 오류 상세/주문 상품은 함께 삭제됨)
+        replaced = [order.order_no for order in orders if order.order_no in error_order_nos]
+        for batch in chunked(replaced, self.LOOKUP_BATCH_SIZE):
+            DailyOrderStat.delete_orders(self._registered_orders().filter(order_no__in=batch, order_status='ERROR'))
+        # 주문번호가 없는 주문은 한 번의 블록 예약으로 자동 주문번호를 받습니다.
+        Order.assign_order_numbers(orders)
+        Order.objects.bulk_create(orders)
+        Order.save_error_details(orders)
+
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, product_id=product_id, quantity=quantity)
+            for order, items, _ in built
+            for product_id, quantity in items
+        ])
+        # bulk_create는 시그널이 없으므로 일자별 집계 갱신을 직접 알립니다.
+        DailyOrderStat.orders_changed(orders)
+
+    def _ingest_single(self, order_data: dict, entry: tuple, stats: dict, error_order_nos: set):
+        order, items, error = entry
+        try:
+            with transaction.atomic():
+                # 롤백된 일괄 저장에서 받은 pk와 자동 주문번호는 무효이므로 초기화합니다.
+                order.pk = None
+                order._state.adding = True
+                if not order_data.get('order_no'):
+                    order.order_no = None
+                self._save_built_orders([(order, items, error)], error_order_nos)
+        except Exception as e:
+            # [수정] 주문 생성 중 에러 발생 시에도 DB에 'ERROR' 상태로 저장하여 누락 방지
+            stats['error_count'] += 1
+            err_msg = str(e)
+            stats['error_messages'].append(f'주문 생성 오류: {err_msg}')
+            logger.error(f"주문 생성 실패 ({self.sales_channel.name}): {err_msg}")
+            if order_data.get('order_no') in error_order_nos:
+                # 기존 오류 주문이 그대로 남아 있으므로 오류 주문을 더 만들지 않습니다.
+                return
+
+            try:
+                # 최소한의 정보로 오류 주문 생성 시도
+                Order(
+                    shipper=self.shipper,
+                    channel=self.sales_channel,
+                    order_no=order_data.get('order_no'),
+                    order_date=order_data.get('order_date', timezone.now()),
+                    recipient_name=order_data.get('recipient_name', '알수없음'),
+                    recipient_phone=order_data.get('recipient_phone', ''),
+                    address=order_data.get('address', ''),
+                ).mark_error([f'시스템 오류: {err_msg}'], [], _serializable(order_data)).save()
+            except Exception as create_err:
+                # 오류 주문 저장조차 실패하면 어쩔 수 없이 로그만 남김 (매우 드문 케이스)
+                logger.critical(f"오류 주문 저장 실패: {str(create_err)}")
+            return
+
+        if error:
+            stats['error_count'] += 1
+            stats['error_messages'].append(error)
+        else:
+            stats['success_count'] += 1
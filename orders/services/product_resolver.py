@@ -0,0 +1,140 @@
+# orders/services/product_resolver.py
+"""
+상품 식별자(채널 상품코드/바코드/상품명) -> 상품 해석기
+
+화주사별로 '(판매 채널, 채널 상품코드) -> 상품 id', '바코드 -> 상품 id', '정규화한 상품명 -> 상품 id 목록'
+색인을 한 번만 만들어 메모리에 두고, 주문 행마다 DB를 조회하지 않고 찾습니다.
+
+해석 규칙 (같은 데이터면 항상 같은 결과)
+1. 판매 채널이 주어지고 확인된 채널 상품코드 매핑(ChannelSkuMapping)이 있으면 그 상품
+2. 바코드가 정확히 일치하면 그 상품 (바코드는 전체 상품에서 유일)
+3. 정규화한 상품명(NFKC, 공백 정리, 대소문자 무시)이 일치하는 상품이 하나면 그 상품
+4. 상품명이 일치하는 상품이 둘 이상이면 '상품이 여러 개 일치함' (임의로 고르지 않음)
+
+무효화
+- Product/ChannelSkuMapping 저장/삭제 시 orders.signals 에서 해당 화주사 색인의 버전을 올립니다.
+- 버전은 core.cache 의 'products' 이름공간에 저장하므로 캐시를 공유하는 다른 프로세스(워커, 스케줄러)도
+  다음 조회 때 다시 만듭니다. products_cache.bump()는 모든 화주사 색인을 한 번에 무효화합니다.
+- 이 프로세스의 색인을 다시 쓰면 'products' 이름공간의 적중, 다시 만들면 실패로 기록합니다.
+- QuerySet.update()처럼 시그널이 발생하지 않는 변경은 PRODUCT_RESOLVER_CACHE_TIMEOUT(초)이 지나면 반영됩니다.
+"""
+import threading
+import time
+import unicodedata
+import uuid
+from collections import defaultdict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+
+from core.cache import products_cache
+from management.models import ChannelSkuMapping, Product
+
+VERSION_KEY = 'resolver_version:{shipper_id}'
+
+NOT_FOUND = '미등록 상품'
+AMBIGUOUS = '상품이 여러 개 일치함'
+
+
+def normalize_name(name: str) -> str:
+    """상품명 비교용 키: 전각/반각 통일, 연속 공백 정리, 대소문자 무시"""
+    return ' '.join(unicodedata.normalize('NFKC', name).split()).casefold()
+
+
+class Resolution(NamedTuple):
+    """해석 결과. product_id가 None이면 error에 사유(NOT_FOUND/AMBIGUOUS)가 들어 있습니다."""
+    product_id: Optional[int]
+    error: Optional[str] = None
+
+
+class ShipperProductIndex:
+    """화주사 한 곳의 상품 색인"""
+
+    def __init__(self, shipper_id: int, version, rows, aliases=()):
+        self.shipper_id = shipper_id
+        self.version = version
+        self.built_at = time.monotonic()
+        self.aliases: Dict[Tuple[int, str], int] = {(channel_id, code): pk for channel_id, code, pk in aliases}
+        self.barcodes: Dict[str, int] = {}
+        names = defaultdict(list)
+        for pk, barcode, name in rows:
+            self.barcodes[barcode] = pk
+            names[normalize_name(name)].append(pk)
+        self.names: Dict[str, Tuple[int, ...]] = {key: tuple(sorted(ids)) for key, ids in names.items()}
+
+    def resolve(self, identifier: Optional[str], channel_id: Optional[int] = None) -> Resolution:
+        if not identifier:
+            return Resolution(None, NOT_FOUND)
+        identifier = str(identifier).strip()
+        product_id = self.aliases.get((channel_id, identifier)) if channel_id else None
+        if product_id is None:
+            product_id = self.barcodes.get(identifier)
+        if product_id is not None:
+            return Resolution(product_id)
+        candidates = self.names.get(normalize_name(identifier), ())
+        if len(candidates) == 1:
+            return Resolution(candidates[0])
+        return Resolution(None, AMBIGUOUS if candidates else NOT_FOUND)
+
+
+class ProductResolver:
+    """
+    화주사별 상품 색인을 캐시하는 해석기 (프로세스에서 하나, 여러 스레드에서 사용 가능)
+
+    사용 예:
+        index = product_resolver.index_for(shipper.pk)   # 배치 시작 시 한 번
+        for row in rows:
+            product_id, error = index.resolve(row['product_identifier'], channel_id)
+    """
+
+    def __init__(self):
+        self._indexes: Dict[int, ShipperProductIndex] = {}
+        self._lock = threading.Lock()
+
+    def index_for(self, shipper_id: int) -> ShipperProductIndex:
+        """화주사의 최신 색인을 반환합니다. (버전이 바뀌었거나 오래됐으면 다시 만듭니다)"""
+        version_key = VERSION_KEY.format(shipper_id=shipper_id)
+        version = products_cache.get(version_key, count=False)
+        if version is None:
+            version = uuid.uuid4().hex
+            # 다른 프로세스가 먼저 정한 버전이 있으면 그것을 따릅니다.
+            if not products_cache.add(version_key, version, None):
+                version = products_cache.get(version_key, version, count=False)
+
+        index = self._indexes.get(shipper_id)
+        if index is not None and index.version == version and not self._expired(index):
+            products_cache.record(True)
+            return index
+        products_cache.record(False)
+
+        rows = Product.objects.filter(shipper_id=shipper_id).values_list('pk', 'barcode', 'name')
+        # 확인 전인 자동 매칭 제안은 적용하지 않습니다.
+        aliases = ChannelSkuMapping.objects.filter(shipper_id=shipper_id, is_confirmed=True).values_list(
+            'channel_id', 'external_code', 'product_id'
+        )
+        index = ShipperProductIndex(shipper_id, version, rows, aliases)
+        with self._lock:
+            self._indexes[shipper_id] = index
+        return index
+
+    def resolve(self, shipper_id: int, identifier: Optional[str], channel_id: Optional[int] = None) -> Resolution:
+        """상품 식별자 하나를 해석합니다. 여러 행을 처리할 때는 index_for()를 한 번 받아 쓰는 편이 빠릅니다."""
+        return self.index_for(shipper_id).resolve(identifier, channel_id)
+
+    def invalidate(self, shipper_id: int):
+        """화주사 색인을 무효화합니다. (상품/채널 상품코드 매핑 추가/수정/삭제 시 호출)"""
+        products_cache.set(VERSION_KEY.format(shipper_id=shipper_id), uuid.uuid4().hex, None)
+        with self._lock:
+            self._indexes.pop(shipper_id, None)
+
+    def clear(self):
+        """이 프로세스의 모든 색인을 비웁니다."""
+        with self._lock:
+            self._indexes.clear()
+
+    @staticmethod
+    def _expired(index: ShipperProductIndex) -> bool:
+        return time.monotonic() - index.built_at > settings.PRODUCT_RESOLVER_CACHE_TIMEOUT
+
+
+product_resolver = ProductResolver()
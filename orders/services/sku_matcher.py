@@ -0,0 +1,191 @@
+# orders/services/sku_matcher.py
+from typing import Dict, List, Optional, Tuple
+
+from django.db import transaction
+
+from management.models import ChannelSkuMapping
+from orders.models import DailyOrderStat, Order, OrderErrorDetail, OrderItem
+from .product_resolver import product_resolver
+
+# 채널 상품코드 -> 상품 id 후보 매핑 키: (화주사 id, 판매채널 id, 채널 상품코드)
+MappingKey = Tuple[int, int, str]
+
+
+class ErrorOrderRematcher:
+    """
+    '미등록 상품' 오류로 남은 주문을 채널 상품코드 매핑으로 일괄 재처리하는 작업
+
+    1. 상품 정보 외의 오류가 없는 ERROR 주문을 id 순서로 BATCH_SIZE씩 읽습니다.
+    2. 모든 상품이 바코드/상품명 또는 확인된 매핑으로 해석되는 주문만 주문 상품을 다시 만들고 PENDING 으로 바꿉니다.
+       같은 화주사/판매채널에 같은 주문번호의 정상 주문이 이미 있으면 오류 주문으로 남깁니다.
+    3. (auto_map) 해석되지 않은 채널 상품코드는 앞의 채널 접두어를 하나씩 떼어 낸 코드
+       (예: GM-PRD-1234 -> PRD-1234)가 바코드/상품명으로 상품 하나에만 일치하면 매핑을 제안합니다.
+       숫자만 남은 코드(1234)는 다른 상품의 바코드와 우연히 같을 수 있으므로 제안하지 않습니다.
+       제안은 확인 전(is_auto=True, is_confirmed=False)으로 저장되어 주문에 적용되지 않으며,
+       관리자 화면에서 확인한 뒤 다시 실행하면 해당 주문이 재처리됩니다.
+    """
+
+    BATCH_SIZE = 500
+    # 매핑으로 해결될 수 있는 오류 코드 (상품 외 오류가 섞인 주문은 MULTIPLE 이므로 제외됨)
+    PRODUCT_ERROR_CODES = ('UNKNOWN_PRODUCT', 'AMBIGUOUS_PRODUCT')
+
+    def __init__(self, auto_map: bool = True, dry_run: bool = False):
+        self.auto_map = auto_map
+        self.dry_run = dry_run
+        self.proposed_mappings: Dict[MappingKey, int] = {}
+
+    def run(self, shipper_id: Optional[int] = None) -> dict:
+        """
+        Returns:
+            {'scanned', 'matched_orders', 'proposed_mappings', 'unresolved_orders', 'conflict_orders', 'skipped_orders'}
+            (proposed_mappings: 새로 제안한 확인 전 매핑, skipped_orders: 상품 외의 오류가 있어 이 작업으로 재처리할 수 없는 주문)
+        """
+        stats = {
+            'scanned': 0, 'matched_orders': 0, 'proposed_mappings': 0,
+            'unresolved_orders': 0, 'conflict_orders': 0, 'skipped_orders': 0,
+        }
+        queryset = Order.objects.filter(
+            order_status='ERROR', shipper__isnull=False, channel__isnull=False,
+            error_detail__error_code__in=self.PRODUCT_ERROR_CODES,
+        ).select_related('error_detail').only(
+            'id', 'shipper_id', 'channel_id', 'order_no', 'order_date', 'error_detail__error_fields', 'error_detail__raw_data'
+        ).order_by('id')
+        if shipper_id:
+            queryset = queryset.filter(shipper_id=shipper_id)
+
+        last_id = 0
+        while True:
+            batch = list(queryset.filter(id__gt=last_id)[:self.BATCH_SIZE])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            stats['scanned'] += len(batch)
+            with transaction.atomic():
+                self._process_batch(batch, stats)
+        return stats
+
+    @staticmethod
+    def parse_items(order: Order) -> Optional[List[Tuple[str, int]]]:
+        """
+        오류 주문의 입력 원본에서 (상품 식별자, 수량) 목록을 꺼냅니다.
+        상품 정보 외의 오류가 있거나 원본 데이터를 읽을 수 없으면 None 을 반환합니다.
+        """
+        detail = order.error_detail
+        if detail.error_fields != ['product_identifier']:
+            return None
+        original = detail.raw_data or {}
+        if 'items' in original:  # 쇼핑몰 API 수집 주문
+            raw_items = [(i.get('product_identifier'), i.get('quantity', 1)) for i in original['items']]
+        else:  # 엑셀 업로드/일괄 재시도 주문
+            raw_items = [(original.get('product_identifier'), original.get('quantity'))]
+
+        items = []
+        for identifier, quantity in raw_items:
+            try:
+                quantity = int(quantity)
+            except (TypeError, ValueError):
+                return None
+            if not identifier or quantity <= 0:
+                return None
+            items.append((str(identifier).strip(), quantity))
+        return items or None
+
+    def _resolve(self, shipper_id: int, channel_id: int, identifier: str) -> Optional[int]:
+        """바코드/상품명 또는 확인된 매핑으로 해석한 상품 id (해석되지 않으면 auto_map일 때 매핑을 제안하고 None)"""
+        index = product_resolver.index_for(shipper_id)
+        product_id, _ = index.resolve(identifier, channel_id)
+        if product_id is None and self.auto_map:
+            self._propose(index, (shipper_id, channel_id, identifier))
+        return product_id
+
+    def _propose(self, index, key: MappingKey):
+        if key in self.proposed_mappings:
+            return
+        # 채널 접두어를 앞에서부터 하나씩 떼어 보고, 상품 하나에만 일치하는 첫 코드를 제안합니다.
+        parts = key[2].split('-')
+        for i in range(1, len(parts)):
+            candidate = '-'.join(parts[i:])
+            if candidate.isdigit():
+                break
+            product_id, _ = index.resolve(candidate)
+            if product_id is not None:
+                self.proposed_mappings[key] = product_id
+                return
+
+    def _process_batch(self, batch: List[Order], stats: dict):
+        proposed_before = len(self.proposed_mappings)
+        matched = []
+        for order in batch:
+            items = self.parse_items(order)
+            if items is None:
+                stats['skipped_orders'] += 1
+                continue
+            resolved = [(self._resolve(order.shipper_id, order.channel_id, identifier), quantity) for identifier, quantity in items]
+            if any(product_id is None for product_id, _ in resolved):
+                stats['unresolved_orders'] += 1
+                continue
+            matched.append((order, resolved))
+        new_proposals = self._exclude_existing_mappings(list(self.proposed_mappings.items())[proposed_before:])
+        stats['proposed_mappings'] += len(new_proposals)
+
+        matched = self._exclude_order_no_conflicts(matched, stats)
+        stats['matched_orders'] += len(matched)
+        if self.dry_run:
+            return
+
+        if new_proposals:
+            # 확인 전 매핑은 상품 색인에 들어가지 않으므로 색인을 무효화할 필요가 없습니다.
+            ChannelSkuMapping.objects.bulk_create([
+                ChannelSkuMapping(shipper_id=shipper_id, channel_id=channel_id, external_code=code, product_id=product_id,
+                                  is_auto=True, is_confirmed=False)
+                for (shipper_id, channel_id, code), product_id in new_proposals
+            ], ignore_conflicts=True)
+
+        if not matched:
+            return
+        orders = [order for order, _ in matched]
+        before = DailyOrderStat.snapshot(orders)
+        # 오류 전까지 저장됐던 일부 주문 상품은 지우고 전체 상품을 다시 만듭니다.
+        OrderItem.objects.filter(order__in=orders).delete()
+        OrderErrorDetail.objects.filter(order__in=orders).delete()
+        OrderItem.objects.bulk_create([
+            OrderItem(order=order, product_id=product_id, quantity=quantity)
+            for order, resolved in matched
+            for product_id, quantity in resolved
+        ])
+        for order in orders:
+            order.order_status = 'PENDING'
+            order.error_message = ''
+        Order.objects.bulk_update(orders, ['order_status', 'error_message'])
+        DailyOrderStat.orders_changed(orders, before=before)
+
+    @staticmethod
+    def _exclude_existing_mappings(proposals: list) -> list:
+        """이미 제안되었거나(확인 전) 등록된 채널 상품코드는 다시 제안하지 않습니다."""
+        if not proposals:
+            return []
+        existing = set(
+            ChannelSkuMapping.objects.filter(external_code__in={code for (_, _, code), _ in proposals})
+            .values_list('shipper_id', 'channel_id', 'external_code')
+        )
+        return [(key, product_id) for key, product_id in proposals if key not in existing]
+
+    @staticmethod
+    def _exclude_order_no_conflicts(matched: list, stats: dict) -> list:
+        """PENDING 으로 바꾸면 주문번호 유니크 제약에 걸리는 주문을 제외합니다."""
+        keys = {(o.shipper_id, o.channel_id, o.order_no) for o, _ in matched if o.order_no}
+        taken = set()
+        if keys:
+            taken = set(
+                Order.objects.filter(order_no__in={k[2] for k in keys}).exclude(order_status='ERROR')
+                .values_list('shipper_id', 'channel_id', 'order_no')
+            )
+        result = []
+        for order, resolved in matched:
+            key = (order.shipper_id, order.channel_id, order.order_no)
+            if order.order_no and key in taken:
+                stats['conflict_orders'] += 1
+                continue
+            taken.add(key)
+            result.append((order, resolved))
+        return result
@@ -0,0 +1,12 @@
+# orders/services/utils.py
+from itertools import islice
+
+
+def chunked(values, size: int):
+    """
+    값들을 size 단위 리스트로 잘라서 반환합니다.
+    [수정] 제너레이터도 받을 수 있도록 전체를 리스트로 만들지 않고 한 청크씩만 읽습니다.
+    """
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
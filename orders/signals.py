@@ -0,0 +1,126 @@
+# orders/signals.py
+"""
+주문 처리에서 쓰는 캐시/집계를 원본 데이터 변경에 맞춰 갱신하는 시그널 (OrdersConfig.ready()에서 등록)
+
+bulk_create/bulk_update/QuerySet.update()는 시그널이 발생하지 않으므로 해당 코드에서 직접
+product_resolver.invalidate() / DailyOrderStat.snapshot()·orders_changed()를 호출합니다.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from management.models import ChannelSkuMapping, Product
+from orders.models import DailyOrderStat, Order, OrderItem
+from orders.services.product_resolver import product_resolver
+
+# 상품 색인에 쓰이는 필드. 이 필드가 바뀌지 않는 저장(예: 재고 수량만 변경)은 무효화하지 않습니다.
+INDEXED_PRODUCT_FIELDS = frozenset({'shipper', 'shipper_id', 'barcode', 'name'})
+
+
+def _invalidate_product_index(shipper_id):
+    # 같은 트랜잭션 안의 조회를 위해 즉시 무효화하고, 커밋 전에 다른 스레드가 옛 데이터로 다시 만든 색인을 버리도록 커밋 후 한 번 더 무효화합니다.
+    product_resolver.invalidate(shipper_id)
+    transaction.on_commit(lambda: product_resolver.invalidate(shipper_id))
+
+
+@receiver(post_init, sender=Product)
+def remember_product_shipper(sender, instance, **kwargs):
+    # 화주사가 바뀌는 경우 이전 화주사의 색인도 무효화해야 하므로 불러온 시점의 값을 기억합니다.
+    instance._loaded_shipper_id = instance.__dict__.get('shipper_id')
+
+
+@receiver(post_save, sender=Product)
+def invalidate_product_index_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not INDEXED_PRODUCT_FIELDS.intersection(update_fields):
+        return
+    shipper_ids = {instance.shipper_id, getattr(instance, '_loaded_shipper_id', None)}
+    for shipper_id in shipper_ids - {None}:
+        _invalidate_product_index(shipper_id)
+    instance._loaded_shipper_id = instance.shipper_id
+
+
+@receiver(post_delete, sender=Product)
+def invalidate_product_index_on_delete(sender, instance, **kwargs):
+    _invalidate_product_index(instance.shipper_id)
+
+
+@receiver(post_init, sender=ChannelSkuMapping)
+def remember_mapping_shipper(sender, instance, **kwargs):
+    instance._loaded_shipper_id = instance.__dict__.get('shipper_id')
+
+
+@receiver(post_save, sender=ChannelSkuMapping)
+def invalidate_product_index_on_mapping_save(sender, instance, **kwargs):
+    for shipper_id in {instance.shipper_id, getattr(instance, '_loaded_shipper_id', None)} - {None}:
+        _invalidate_product_index(shipper_id)
+    instance._loaded_shipper_id = instance.shipper_id
+
+
+@receiver(post_delete, sender=ChannelSkuMapping)
+def invalidate_product_index_on_mapping_delete(sender, instance, **kwargs):
+    _invalidate_product_index(instance.shipper_id)
+
+
+# 주문의 집계 키를 만드는 필드 (모두 불러온 경우에만 불러온 시점의 키를 기억)
+STAT_KEY_FIELDS = ('order_date', 'shipper_id', 'channel_id', 'order_status')
+
+
+def _stored_stat_key(order):
+    """DB에 저장되어 있는 주문의 집계 키 (일부 필드를 불러오지 않은 객체는 한 번 조회)"""
+    if getattr(order, '_stat_key', None) is None:
+        row = Order.objects.filter(pk=order.pk).values_list(*STAT_KEY_FIELDS).first()
+        order._stat_key = (DailyOrderStat.day_of(row[0]), *row[1:]) if row else None
+    return order._stat_key
+
+
+@receiver(post_init, sender=Order)
+def remember_order_stat_key(sender, instance, **kwargs):
+    # 일자/화주사/판매채널/상태가 바뀌면 이전 키의 집계에서 빼야 하므로 불러온 시점의 키를 기억합니다.
+    loaded = instance.pk is not None and all(field in instance.__dict__ for field in STAT_KEY_FIELDS)
+    instance._stat_key = DailyOrderStat.key_of(instance) if loaded else None
+
+
+@receiver(pre_save, sender=Order)
+def load_order_stat_key(sender, instance, **kwargs):
+    if not instance._state.adding:
+        _stored_stat_key(instance)
+
+
+@receiver(post_save, sender=Order)
+def update_daily_stat_on_order_save(sender, instance, created, **kwargs):
+    previous = None if created else instance._stat_key
+    key = DailyOrderStat.key_of(instance)
+    if previous != key:
+        # 새 주문은 주문 상품이 아직 없으므로 주문 수만 더하고, 상품 수량은 주문 상품 저장 시 더합니다.
+        quantity = 0 if created else DailyOrderStat.item_quantities([instance.pk]).get(instance.pk, 0)
+        deltas = {key: (1, quantity)}
+        if previous is not None:
+            deltas[previous] = (-1, -quantity)
+        DailyOrderStat.apply_deltas(deltas)
+    instance._stat_key = key
+
+
+@receiver(pre_delete, sender=Order)
+def update_daily_stat_on_order_delete(sender, instance, **kwargs):
+    # 주문 상품은 주문보다 먼저 지워지므로 삭제 전에 수량을 구합니다.
+    if DailyOrderStat.deleted_in_bulk(instance):
+        return
+    key = _stored_stat_key(instance)
+    if key is not None:
+        quantity = DailyOrderStat.item_quantities([instance.pk]).get(instance.pk, 0)
+        DailyOrderStat.apply_deltas({key: (-1, -quantity)})
+
+
+@receiver(post_init, sender=OrderItem)
+def remember_item_quantity(sender, instance, **kwargs):
+    instance._loaded_quantity = instance.__dict__.get('quantity') if instance.pk is not None else 0
+
+
+@receiver(post_save, sender=OrderItem)
+def update_daily_stat_on_item_save(sender, instance, created, **kwargs):
+    # 주문 상품 수량(관리자 인라인 수정 등)도 집계에 들어가므로 바뀐 수량만큼 주문의 집계 행에 더합니다.
+    # 주문 상품 삭제는 post_delete를 받으면 대량 삭제가 건별 조회로 바뀌므로 주문 쪽 경로(snapshot/orders_changed)에서 처리합니다.
+    previous = 0 if created else instance._loaded_quantity
+    if previous is not None and instance.quantity != previous:
+        DailyOrderStat.apply_deltas({DailyOrderStat.key_of(instance.order): (0, instance.quantity - previous)})
+    instance._loaded_quantity = instance.quantity
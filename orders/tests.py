@@ -0,0 +1,1079 @@
+# orders/tests.py
+import io
+import json
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openpyxl
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, connection, transaction
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from management.models import Center, Shipper, SalesChannel, Product, ShipperApiInfo, ShipperApiToken, ChannelSkuMapping
+from stock.models import StockBalance, StockMovement
+from users.models import User
+from .api_clients import BaseApiClient, HttpTransport, NaverClient, OrderPage, TransportError
+from .api_clients.token_cache import TokenCache, token_cache
+from .api_clients.transport import TokenBucket
+from .models import DailyOrderStat, Order, OrderErrorDetail, OrderImportJob, OrderItem, OrderNumberSequence
+from .services import CollectedOrderIngestor, ErrorOrderRematcher, OrderCollectorService, OrderExcelImporter, ProductResolver
+from .services.import_jobs import claim_next_job, enqueue_import, run_job
+from .services.order_collector import ChannelOrderStore
+from .views import EXPORT_HEADERS, _order_date_range, order_invoice_view
+
+
+class OrderQueryPlanTests(TestCase):
+    """
+    주문 대시보드/목록에서 자주 쓰는 조회가 인덱스를 사용하는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='테스트센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='테스트화주')
+        cls.channel = SalesChannel.objects.create(name='테스트채널')
+        cls.product = Product.objects.create(shipper=cls.shipper, name='상품A', barcode='A1')
+        cls.user = User.objects.create_superuser('tester', 'tester@example.com', 'pw')
+
+    def _create_orders(self, count):
+        order_date = timezone.make_aware(datetime.combine(date.today(), datetime.min.time())) + timedelta(hours=12)
+        start = Order.objects.count()
+        for i in range(start, start + count):
+            order = Order.objects.create(
+                shipper=self.shipper, channel=self.channel, order_no=f'T-{i}',
+                order_date=order_date, recipient_name=f'수취인{i}', address='주소', recipient_phone='010'
+            )
+            OrderItem.objects.create(order=order, product=self.product, quantity=1)
+
+    def _plan(self, queryset):
+        return queryset.explain()
+
+    @unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite의 EXPLAIN QUERY PLAN 출력 기준')
+    def test_day_range_filters_use_order_date_indexes(self):
+        day_range = _order_date_range(date.today())
+
+        plan = self._plan(Order.objects.filter(**day_range).exclude(order_status='ERROR'))
+        self.assertIn('order_date_idx', plan)
+
+        plan = self._plan(Order.objects.filter(order_status='ERROR', **day_range))
+        self.assertIn('order_status_date_idx', plan)
+
+    @unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite의 EXPLAIN QUERY PLAN 출력 기준')
+    def test_duplicate_and_order_no_lookups_use_indexes(self):
+        plan = self._plan(Order.objects.filter(order_no__in=['A', 'B']))
+        self.assertIn('order_no_idx', plan)
+
+        plan = self._plan(Order.objects.filter(
+            shipper=self.shipper, recipient_name='수취인', address='주소', recipient_phone='010'
+        ))
+        self.assertIn('order_duplicate_key_idx', plan)
+
+    def test_success_list_query_count_does_not_grow_with_orders(self):
+        self.client.force_login(self.user)
+        url = reverse('orders:list_success', args=[date.today().strftime('%Y-%m-%d')])
+
+        self._create_orders(2)
+        self.client.get(url)  # 세션/공통 필터 캐시 준비
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+        self._create_orders(20)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+
+    def test_order_list_api_pages_with_keyset_cursor(self):
+        self.client.force_login(self.user)
+        self._create_orders(25)
+        other = Shipper.objects.create(center=self.shipper.center, name='다른화주')
+        Order.objects.create(shipper=other, channel=self.channel, order_no='OTHER-1', order_date=timezone.now(), recipient_name='다른')
+        params = {'date': date.today().strftime('%Y-%m-%d'), 'list_type': 'success', 'shipper': self.shipper.pk, 'limit': 10}
+
+        first = self.client.get(reverse('orders:order_list_api'), params).json()
+        self.assertEqual(first['counts']['success'], 25)
+        seen, page = [], first
+        while True:
+            seen += [row['order_no'] for row in page['results']]
+            if not page['has_more']:
+                break
+            page = self.client.get(reverse('orders:order_list_api'), {**params, 'cursor': page['next_cursor']}).json()
+            self.assertNotIn('counts', page)
+
+        self.assertEqual(len(seen), 25)
+        self.assertEqual(len(set(seen)), 25)
+        self.assertNotIn('OTHER-1', seen)
+        self.assertEqual(self.client.get(reverse('orders:order_list_api'), {**params, 'cursor': 'bad'}).status_code, 400)
+
+    def test_order_no_is_unique_per_shipper_and_channel_in_excel_import(self):
+        Order.objects.create(
+            shipper=self.shipper, channel=self.channel, order_no='DUP-1',
+            order_date=timezone.now(), recipient_name='기존'
+        )
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['주문번호', '화주사', '판매채널', '수취인', '연락처', '주소', '상품명', '수량'])
+        ws.append(['DUP-1', self.shipper.name, self.channel.name, '신규', '010', '주소1', 'A1', 1])
+        ws.append(['NEW-1', self.shipper.name, self.channel.name, '신규2', '010', '주소2', 'A1', 1])
+        ws.append(['NEW-1', self.shipper.name, self.channel.name, '신규3', '010', '주소3', 'A1', 1])
+        buf = io.BytesIO()
+        wb.save(buf)
+        buf.seek(0)
+
+        stats = OrderExcelImporter(handle_duplicates=True).import_file(buf)
+
+        self.assertEqual(stats['success_count'], 1)
+        self.assertEqual(stats['error_count'], 2)
+        self.assertEqual(Order.objects.filter(order_no='NEW-1').exclude(order_status='ERROR').count(), 1)
+        self.assertEqual(Order.objects.filter(order_no='DUP-1', order_status='ERROR').count(), 1)
+
+    def test_excel_import_streams_rows_in_chunks_and_resumes(self):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['주문번호', '화주사', '판매채널', '수취인', '연락처', '주소', '상품명', '수량'])
+        for i in range(5):
+            ws.append([f'CHUNK-{i}', self.shipper.name, self.channel.name, f'청크{i}', '010', f'주소{i}', 'A1', 1])
+        buf = io.BytesIO()
+        wb.save(buf)
+
+        # 시트 전체를 리스트로 만들지 않고 두 번 순회하며 청크마다 진행 상황을 알립니다.
+        progress = []
+        with mock.patch.object(OrderExcelImporter, 'CHUNK_SIZE', 2), \
+                mock.patch.object(OrderExcelImporter, 'read_rows', wraps=OrderExcelImporter.read_rows) as read_rows:
+            stats = OrderExcelImporter().import_file(
+                buf, progress_callback=lambda done, total, _: progress.append((done, total)), start_row=1,
+                stats={'success_count': 1, 'error_count': 0, 'skipped_count': 0},
+            )
+
+        self.assertEqual(read_rows.call_count, 2)
+        self.assertEqual(progress, [(3, 5), (5, 5)])
+        self.assertEqual(stats, {'success_count': 5, 'error_count': 0, 'skipped_count': 0})
+        self.assertEqual(
+            sorted(Order.objects.filter(order_no__startswith='CHUNK-').values_list('order_no', flat=True)),
+            [f'CHUNK-{i}' for i in range(1, 5)],
+        )
+
+    def test_collected_order_no_is_duplicate_only_within_shipper_and_channel(self):
+        other_shipper = Shipper.objects.create(center=self.shipper.center, name='다른화주')
+        Product.objects.create(shipper=other_shipper, name='상품B', barcode='B1')
+        CollectedOrderIngestor(self.shipper, self.channel).ingest([
+            {'order_no': 'C-1', 'recipient_name': '수취인', 'items': [{'product_identifier': 'A1', 'quantity': 1}]},
+            {'order_no': 'C-2', 'recipient_name': '수취인', 'items': [{'product_identifier': 'UNKNOWN', 'quantity': 1}]},
+        ])
+
+        # 다른 화주사의 같은 주문번호는 새 주문입니다.
+        other = CollectedOrderIngestor(other_shipper, self.channel).ingest([
+            {'order_no': 'C-1', 'recipient_name': '수취인', 'items': [{'product_identifier': 'B1', 'quantity': 1}]},
+        ])
+        # 상품을 아직 찾지 못한 오류 주문은 다시 수집해도 오류 주문이 늘어나지 않습니다.
+        still_unknown = CollectedOrderIngestor(self.shipper, self.channel).ingest([
+            {'order_no': 'C-2', 'recipient_name': '수취인', 'items': [{'product_identifier': 'UNKNOWN', 'quantity': 1}]},
+        ])
+        # 상품을 찾게 되면 오류 주문이 정상 주문으로 교체됩니다.
+        again = CollectedOrderIngestor(self.shipper, self.channel).ingest([
+            {'order_no': 'C-1', 'recipient_name': '수취인', 'items': [{'product_identifier': 'A1', 'quantity': 1}]},
+            {'order_no': 'C-2', 'recipient_name': '수취인', 'items': [{'product_identifier': 'A1', 'quantity': 1}]},
+        ])
+
+        self.assertEqual((other['success_count'], other['duplicate_count']), (1, 0))
+        self.assertEqual((still_unknown['error_count'], still_unknown['duplicate_count']), (0, 1))
+        self.assertEqual((again['success_count'], again['duplicate_count']), (1, 1))
+        rows = Order.objects.filter(shipper=self.shipper, channel=self.channel).values_list('order_no', 'order_status')
+        self.assertEqual(sorted(rows), [('C-1', 'PENDING'), ('C-2', 'PENDING')])
+        self.assertFalse(OrderErrorDetail.objects.exists())
+
+
+class _StubMarketplaceHandler(BaseHTTPRequestHandler):
+    """
+    쇼핑몰 API 흉내를 내는 로컬 스텁 서버
+    /flaky/<n>   : 처음 n번은 503, 이후 200
+    /throttle/<n>: 처음 n번은 429 (Retry-After: 0), 이후 200
+    /orders      : 항상 200
+    """
+    protocol_version = 'HTTP/1.1'
+    hits = {}
+    client_ports = set()
+
+    def do_GET(self):
+        cls = type(self)
+        cls.client_ports.add(self.client_address[1])
+        path = self.path.split('?')[0]
+        cls.hits[path] = cls.hits.get(path, 0) + 1
+
+        status, headers = 200, {}
+        parts = path.strip('/').split('/')
+        if parts[0] in ('flaky', 'throttle') and cls.hits[path] <= int(parts[1]):
+            status = 503 if parts[0] == 'flaky' else 429
+            if parts[0] == 'throttle':
+                headers['Retry-After'] = '0'
+
+        body = json.dumps({'path': self.path, 'hit': cls.hits[path]}).encode('utf-8')
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _StubClient(BaseApiClient):
+    CREDENTIAL_RATE_LIMIT = 20
+
+    def fetch_orders(self, start_date, end_date):
+        return self.request('GET', '/orders', params={'from': start_date.isoformat()}).json()
+
+
+class HttpTransportTests(SimpleTestCase):
+    """
+    쇼핑몰 API 공용 전송 계층(연결 재사용, 재시도, 속도 제한)을 로컬 스텁 서버로 확인합니다.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubMarketplaceHandler)
+        cls.base_url = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        _StubMarketplaceHandler.hits = {}
+        _StubMarketplaceHandler.client_ports = set()
+        self.transport = HttpTransport(max_retries=3, backoff_base=0.01, backoff_max=0.05)
+
+    def tearDown(self):
+        self.transport.pool.close_all()
+
+    def test_keep_alive_connection_is_reused(self):
+        for _ in range(5):
+            response = self.transport.request('GET', f'{self.base_url}/orders')
+            self.assertEqual(response.status, 200)
+        self.assertEqual(len(_StubMarketplaceHandler.client_ports), 1)
+
+    def test_retries_5xx_and_429_until_success(self):
+        response = self.transport.request('GET', f'{self.base_url}/flaky/2')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.json()['hit'], 3)
+
+        response = self.transport.request('GET', f'{self.base_url}/throttle/1')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(_StubMarketplaceHandler.hits['/throttle/1'], 2)
+
+    def test_gives_up_after_max_retries(self):
+        with self.assertRaises(TransportError) as ctx:
+            self.transport.request('GET', f'{self.base_url}/flaky/10')
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertEqual(_StubMarketplaceHandler.hits['/flaky/10'], 4)
+
+    def test_token_bucket_limits_request_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_client_requests_share_transport_and_rate_limit(self):
+        client = _StubClient('key', 'secret', transport=self.transport)
+        client.BASE_URL = self.base_url
+        started = time.monotonic()
+        for _ in range(3):
+            client.fetch_orders(datetime(2024, 1, 1), datetime(2024, 1, 2))
+        # 초당 20회 제한, 버킷 용량 20 -> 처음 요청들은 바로 나감
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertIn('credential:_StubClient:key', self.transport._buckets)
+        self.assertEqual(_StubMarketplaceHandler.hits['/orders'], 3)
+
+
+class TokenCacheTests(TestCase):
+    """
+    쇼핑몰 인증 토큰 캐시: 만료 전 재사용, 재시작 후 DB에서 복원, 동시 요청 시 한 번만 발급
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='토큰센터', address='주소')
+        shipper = Shipper.objects.create(center=center, name='토큰화주')
+        cls.api_info = ShipperApiInfo.objects.create(shipper=shipper, channel_type='NAVER', access_key='id', secret_key='secret')
+
+    def _issuer(self, expires_in=3600):
+        calls = []
+
+        def issue():
+            calls.append(1)
+            time.sleep(0.05)
+            return f'token-{len(calls)}', expires_in
+        return issue, calls
+
+    def test_token_is_reused_until_expiry_and_survives_restart(self):
+        issue, calls = self._issuer()
+        cache = TokenCache()
+        self.assertEqual(cache.get(issue, api_info_id=self.api_info.pk), 'token-1')
+        self.assertEqual(cache.get(issue, api_info_id=self.api_info.pk), 'token-1')
+
+        restarted = TokenCache()
+        self.assertEqual(restarted.get(issue, api_info_id=self.api_info.pk), 'token-1')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(ShipperApiToken.objects.get(api_info=self.api_info).access_token, 'token-1')
+
+    def test_token_close_to_expiry_is_refreshed(self):
+        issue, calls = self._issuer(expires_in=10)  # ORDER_API_TOKEN_REFRESH_SKEW(300초)보다 짧음
+        cache = TokenCache()
+        cache.get(issue, api_info_id=self.api_info.pk)
+        cache.get(issue, api_info_id=self.api_info.pk)
+        self.assertEqual(len(calls), 2)
+
+    def test_concurrent_requests_issue_token_once(self):
+        issue, calls = self._issuer()
+        cache = TokenCache()
+        tokens = []
+        threads = [threading.Thread(target=lambda: tokens.append(cache.get(issue, key='shared'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(set(tokens), {'token-1'})
+
+    def test_rotated_credentials_get_a_new_token(self):
+        issue, calls = self._issuer()
+
+        class TokenClient(BaseApiClient):
+            requires_token = True
+
+            def issue_token(self):
+                return issue()
+
+            def fetch_orders(self, start_date, end_date):
+                return []
+
+        def client():
+            api_info = ShipperApiInfo.objects.get(pk=self.api_info.pk)
+            return TokenClient(api_info.access_key, api_info.secret_key, api_info=api_info)
+
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.assertEqual(client().get_access_token(), 'token-1')
+        ShipperApiInfo.objects.filter(pk=self.api_info.pk).update(secret_key='rotated')
+
+        # 같은 프로세스의 메모리 캐시와 재시작 후 DB에 저장된 토큰 모두 이전 키의 토큰을 쓰지 않습니다.
+        self.assertEqual(client().get_access_token(), 'token-2')
+        token_cache.clear()
+        self.assertEqual(client().get_access_token(), 'token-2')
+        self.assertEqual(len(calls), 2)
+
+
+class ProductResolverTests(TestCase):
+    """
+    화주사별 상품 색인: 바코드 우선, 정규화한 상품명, 중복 상품명 감지, 상품 변경 시 무효화
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='해석센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='해석화주')
+        cls.other = Shipper.objects.create(center=center, name='다른화주')
+        cls.tshirt = Product.objects.create(shipper=cls.shipper, name='반팔 티셔츠  White', barcode='TS-1')
+        cls.mug_a = Product.objects.create(shipper=cls.shipper, name='머그컵', barcode='MUG-A')
+        cls.mug_b = Product.objects.create(shipper=cls.shipper, name='머그컵', barcode='MUG-B')
+        Product.objects.create(shipper=cls.other, name='TS-1 스티커', barcode='OTHER-1')
+
+    def setUp(self):
+        self.resolver = ProductResolver()
+
+    def test_resolves_barcode_and_normalized_name(self):
+        index = self.resolver.index_for(self.shipper.pk)
+        self.assertEqual(index.resolve('TS-1'), (self.tshirt.pk, None))
+        self.assertEqual(index.resolve(' 반팔 티셔츠 white '), (self.tshirt.pk, None))
+        self.assertEqual(index.resolve('MUG-B'), (self.mug_b.pk, None))
+        self.assertEqual(index.resolve('머그컵'), (None, '상품이 여러 개 일치함'))
+        self.assertEqual(index.resolve('OTHER-1'), (None, '미등록 상품'))
+
+    def test_lookups_after_first_build_do_not_query(self):
+        self.resolver.index_for(self.shipper.pk)
+        with self.assertNumQueries(0):
+            for _ in range(100):
+                self.resolver.resolve(self.shipper.pk, 'TS-1')
+
+    def test_product_changes_invalidate_index(self):
+        self.assertEqual(self.resolver.resolve(self.shipper.pk, '텀블러').error, '미등록 상품')
+        tumbler = Product.objects.create(shipper=self.shipper, name='텀블러', barcode='TB-1')
+        self.assertEqual(self.resolver.resolve(self.shipper.pk, '텀블러').product_id, tumbler.pk)
+
+        tumbler.shipper = self.other
+        tumbler.save()
+        self.assertEqual(self.resolver.resolve(self.shipper.pk, 'TB-1').error, '미등록 상품')
+        self.assertEqual(self.resolver.resolve(self.other.pk, 'TB-1').product_id, tumbler.pk)
+
+        self.mug_b.delete()
+        self.assertEqual(self.resolver.resolve(self.shipper.pk, '머그컵').product_id, self.mug_a.pk)
+
+    def test_stock_quantity_updates_keep_index(self):
+        index = self.resolver.index_for(self.shipper.pk)
+        self.tshirt.quantity = 10
+        self.tshirt.save(update_fields=['quantity'])
+        self.assertIs(self.resolver.index_for(self.shipper.pk), index)
+
+
+class ChannelSkuMappingTests(TestCase):
+    """
+    채널 상품코드 매핑: 수집 시 매핑 적용, 과거 '미등록 상품' 오류 주문 일괄 재처리
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='매핑센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='매핑화주')
+        cls.gmarket = SalesChannel.objects.create(name='G마켓 (Gmarket)')
+        cls.naver = SalesChannel.objects.create(name='네이버 스마트스토어 (Naver SmartStore)')
+        cls.socks = Product.objects.create(shipper=cls.shipper, name='양말', barcode='PRD-1234')
+        cls.cap = Product.objects.create(shipper=cls.shipper, name='모자', barcode='CAP-01')
+
+    def _collect(self, channel, *codes):
+        start = Order.objects.count()
+        orders = [
+            {'order_no': f'ORD-{start + i}', 'recipient_name': '수취인', 'items': [{'product_identifier': code, 'quantity': 2}]}
+            for i, code in enumerate(codes)
+        ]
+        return CollectedOrderIngestor(self.shipper, channel).ingest(orders)
+
+    def test_mapping_is_applied_per_channel(self):
+        ChannelSkuMapping.objects.create(channel=self.naver, shipper=self.shipper, external_code='NAVER-77', product=self.cap)
+
+        self.assertEqual(self._collect(self.naver, 'NAVER-77')['success_count'], 1)
+        self.assertEqual(self._collect(self.gmarket, 'NAVER-77')['error_count'], 1)
+        self.assertEqual(OrderItem.objects.get(order__channel=self.naver).product, self.cap)
+
+    def test_rematcher_restores_only_confirmed_matches_and_proposes_the_rest(self):
+        Product.objects.create(shipper=self.shipper, name='숫자상품', barcode='9999')
+        self._collect(self.gmarket, 'GM-PRD-1234', 'GM-PRD-1234', 'GM-PRD-9999')
+        self._collect(self.naver, 'NAVER-CAP')
+        self.assertEqual(Order.objects.filter(order_status='ERROR').count(), 4)
+        ChannelSkuMapping.objects.create(channel=self.naver, shipper=self.shipper, external_code='NAVER-CAP', product=self.cap)
+
+        preview = ErrorOrderRematcher(dry_run=True).run()
+        self.assertEqual((preview['matched_orders'], preview['proposed_mappings']), (1, 1))
+        self.assertFalse(ChannelSkuMapping.objects.filter(is_auto=True).exists())
+
+        # 제안된 매핑은 확인 전이므로 해당 주문은 오류로 남고, 숫자만 남은 코드(9999)는 제안하지 않습니다.
+        stats = ErrorOrderRematcher().run()
+        self.assertEqual((stats['matched_orders'], stats['proposed_mappings'], stats['unresolved_orders']), (1, 1, 3))
+        proposal = ChannelSkuMapping.objects.get(is_auto=True)
+        self.assertEqual((proposal.external_code, proposal.product, proposal.is_confirmed), ('GM-PRD-1234', self.socks, False))
+        self.assertEqual(Order.objects.filter(order_status='ERROR').count(), 3)
+        self.assertEqual(self._collect(self.gmarket, 'GM-PRD-1234')['error_count'], 1)
+        self.assertEqual(ErrorOrderRematcher().run()['proposed_mappings'], 0)
+
+        # 확인한 뒤 다시 실행하면 재처리되고, 이후 수집되는 주문에도 적용됩니다.
+        proposal.is_confirmed = True
+        proposal.save()
+        stats = ErrorOrderRematcher().run()
+        self.assertEqual((stats['matched_orders'], stats['unresolved_orders']), (3, 1))
+        self.assertEqual(OrderItem.objects.filter(product=self.socks, quantity=2).count(), 3)
+        self.assertEqual(self._collect(self.gmarket, 'GM-PRD-1234')['success_count'], 1)
+
+    def test_error_detail_is_queryable_and_drives_error_list(self):
+        self._collect(self.gmarket, 'GM-PRD-5555')
+        detail = OrderErrorDetail.objects.get(product_identifier='GM-PRD-5555', error_code='UNKNOWN_PRODUCT')
+        self.assertEqual(detail.error_fields, ['product_identifier'])
+        self.assertEqual(detail.raw_data['items'][0]['product_identifier'], 'GM-PRD-5555')
+
+        self.client.force_login(User.objects.create_superuser('detail', 'detail@example.com', 'pw'))
+        response = self.client.get(reverse('orders:list_error', args=[date.today().strftime('%Y-%m-%d')]))
+        row = response.context['initial_page']['results'][0]
+        self.assertEqual((row['product_identifier'], row['error_message']), ('GM-PRD-5555', '미등록 상품: GM-PRD-5555'))
+
+
+class BatchRetryErrorApiTests(TestCase):
+    """
+    오류 주문 일괄 재시도: 행 수와 관계없이 일정한 쿼리 수, 입력 순서대로 같은 형태의 결과
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='재시도센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='재시도화주')
+        cls.channel = SalesChannel.objects.create(name='재시도채널')
+        cls.product = Product.objects.create(shipper=cls.shipper, name='재시도상품', barcode='RT-1')
+        cls.user = User.objects.create_superuser('retry', 'retry@example.com', 'pw')
+        Order.objects.create(shipper=cls.shipper, channel=cls.channel, order_no='TAKEN', order_date=timezone.now())
+
+    def _updates(self, count, **overrides):
+        updates = []
+        for i in range(count):
+            error_order = Order.objects.create(
+                shipper=self.shipper, channel=self.channel, order_status='ERROR',
+                order_date=timezone.now(), error_message='{}', recipient_name=f'오류{i}'
+            )
+            data = {
+                'order_no': '', 'shipper_name': self.shipper.name, 'channel_name': self.channel.name,
+                'recipient_name': f'수정{i}', 'recipient_phone': '010', 'address': '주소',
+                'product_identifier': 'RT-1', 'quantity': '2',
+            }
+            data.update(overrides)
+            updates.append({'unique_id': f'db-{error_order.pk}', 'data': data})
+        return updates
+
+    def _post(self, updates):
+        return self.client.post(
+            reverse('orders:batch_correct_errors'), json.dumps({'updates': updates}), content_type='application/json'
+        ).json()['results']
+
+    def test_results_keep_input_order_and_shape(self):
+        updates = self._updates(1) + self._updates(1, product_identifier='없는상품') + self._updates(1, order_no='TAKEN')
+        updates.append({'data': {}})
+        self.client.force_login(self.user)
+
+        results = self._post(updates)
+
+        self.assertEqual(results[0], {'unique_id': updates[0]['unique_id'], 'status': 'success'})
+        self.assertEqual(results[1]['error_message'], '미등록 상품')
+        self.assertEqual(results[1]['error_fields'], ['product_identifier'])
+        self.assertEqual((results[2]['error_message'], results[2]['error_fields']), ('주문번호 중복', ['order_no']))
+        self.assertEqual(results[3], {'unique_id': 'unknown', 'status': 'error', 'error_message': 'ID 누락'})
+
+        self.assertFalse(Order.objects.filter(pk=updates[0]['unique_id'][3:]).exists())
+        self.assertEqual(OrderItem.objects.get(order__recipient_name='수정0').quantity, 2)
+        failed = Order.objects.get(pk=updates[1]['unique_id'][3:])
+        self.assertEqual((failed.order_status, failed.recipient_name), ('ERROR', '수정0'))
+        self.assertEqual((failed.error_detail.error_code, failed.error_detail.product_identifier), ('UNKNOWN_PRODUCT', '없는상품'))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.client.force_login(self.user)
+        self._post(self._updates(1))  # 세션/상품 색인 준비
+        few_updates, many_updates = self._updates(2), self._updates(40)
+        with CaptureQueriesContext(connection) as few:
+            self._post(few_updates)
+        with CaptureQueriesContext(connection) as many:
+            results = self._post(many_updates)
+
+        self.assertTrue(all(r['status'] == 'success' for r in results))
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+
+
+class DailyOrderStatTests(TestCase):
+    """
+    일자별 주문 집계: 주문 저장 경로에서 커밋 후 갱신되고, 재작성 결과와 같으며, 대시보드가 집계만 읽는지 확인합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='집계센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='집계화주')
+        cls.channel = SalesChannel.objects.create(name='집계채널')
+        cls.product = Product.objects.create(shipper=cls.shipper, name='집계상품', barcode='STAT-1')
+        cls.user = User.objects.create_superuser('stat', 'stat@example.com', 'pw')
+
+    def _collect(self, count, quantity=3):
+        orders = [
+            {'order_no': f'STAT-{i}', 'recipient_name': '수취인', 'items': [{'product_identifier': code, 'quantity': quantity}]}
+            for i, code in enumerate(['STAT-1'] * count + ['UNKNOWN'])
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            CollectedOrderIngestor(self.shipper, self.channel).ingest(orders)
+
+    def _stats(self):
+        return {
+            status: (count, quantity)
+            for status, count, quantity in DailyOrderStat.objects.filter(date=date.today()).values_list(
+                'order_status', 'order_count', 'item_quantity'
+            )
+        }
+
+    def test_stats_follow_order_changes_and_match_rebuild(self):
+        self._collect(4)
+        self.assertEqual(self._stats(), {'PENDING': (4, 12), 'ERROR': (1, 0)})
+
+        order = Order.objects.filter(order_status='PENDING').first()
+        with self.captureOnCommitCallbacks(execute=True):
+            order.order_status = 'CANCELED'
+            order.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            Order.objects.filter(order_status='ERROR').delete()
+        self.assertEqual(self._stats(), {'PENDING': (3, 9), 'CANCELED': (1, 3)})
+
+        incremental = self._stats()
+        DailyOrderStat.rebuild()
+        self.assertEqual(self._stats(), incremental)
+
+    def test_order_changes_apply_deltas_without_rescanning_the_day(self):
+        self._collect(3)
+        order = Order.objects.filter(order_status='PENDING').first()
+        with CaptureQueriesContext(connection) as queries:
+            order.order_status = 'CANCELED'
+            order.save()
+            item = order.items.get()
+            item.quantity = 5
+            item.save()
+
+        self.assertEqual(self._stats(), {'PENDING': (2, 6), 'CANCELED': (1, 5), 'ERROR': (1, 0)})
+        reads = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertFalse([sql for sql in reads if 'FROM "orders_order"' in sql and 'order_date' in sql.split('WHERE')[-1]])
+        incremental = self._stats()
+        DailyOrderStat.rebuild()
+        self.assertEqual(self._stats(), incremental)
+
+    def test_dashboards_read_stats_without_scanning_orders(self):
+        self._collect(2)
+        self.client.force_login(self.user)
+        today = date.today().strftime('%Y-%m-%d')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('orders:manage'), {'date': today})
+            chart = self.client.get(reverse('orders:chart_data'), {'start': today, 'end': today}).json()
+            channels = self.client.get(reverse('orders:channel_chart_data'), {'date': today}).json()
+
+        self.assertEqual(response.context['daily_stats']['success_count'], 2)
+        self.assertEqual(response.context['daily_stats']['error_count'], 1)
+        self.assertEqual({d['label']: d['data'] for d in chart['datasets']}, {'주문접수': [2], '오류': [1]})
+        self.assertEqual(channels, {'labels': ['집계채널'], 'data': [3]})
+        self.assertFalse([q for q in queries.captured_queries if 'FROM "orders_order"' in q['sql']])
+
+    def test_dashboard_cache_is_invalidated_when_stats_change(self):
+        self.client.force_login(self.user)
+        today = date.today().strftime('%Y-%m-%d')
+        url = reverse('orders:channel_chart_data')
+
+        self._collect(1)
+        self.assertEqual(self.client.get(url, {'date': today}).json()['data'], [2])
+        with CaptureQueriesContext(connection) as cached:
+            self.client.get(url, {'date': today})
+        self.assertFalse([q for q in cached.captured_queries if 'orders_dailyorderstat' in q['sql']])
+
+        # STAT-0은 중복, 오류로 남아 있던 STAT-1은 정상 주문으로 교체되고 STAT-2~3 두 건이 추가됩니다.
+        self._collect(3)
+        self.assertEqual(self.client.get(url, {'date': today}).json()['data'], [4])
+
+    def test_repeated_refresh_of_a_day_does_not_duplicate_rows(self):
+        self._collect(2)
+        DailyOrderStat.refresh_days([date.today()])
+        DailyOrderStat.refresh_days([date.today(), date.today()])
+        self.assertEqual(self._stats(), {'PENDING': (2, 6), 'ERROR': (1, 0)})
+        self.assertEqual(DailyOrderStat.objects.filter(date=date.today()).count(), 2)
+
+        # 동시에 커밋된 두 갱신이 같은 행을 넣으려 하면 유니크 제약이 막습니다.
+        stat = DailyOrderStat.objects.get(date=date.today(), order_status='PENDING')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            DailyOrderStat.objects.create(date=stat.date, shipper=stat.shipper, channel=stat.channel,
+                                          order_status='PENDING', order_count=2)
+
+
+class OrderImportJobTests(TestCase):
+    """
+    백그라운드 엑셀 업로드 작업: 선점은 한 워커만 하고, 중단된 작업은 저장된 행 다음부터 이어서 처리합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='업로드센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='업로드화주')
+        cls.channel = SalesChannel.objects.create(name='업로드채널')
+        Product.objects.create(shipper=cls.shipper, name='업로드상품', barcode='UP-1')
+        cls.user = User.objects.create_superuser('upload', 'upload@example.com', 'pw')
+
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        media_override = override_settings(MEDIA_ROOT=media.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def _workbook(self, rows):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(['주문번호', '화주사', '판매채널', '수취인', '연락처', '주소', '상품명', '수량'])
+        for i in range(rows):
+            ws.append([f'UP-{i}', self.shipper.name, self.channel.name, f'수취인{i}', '010', f'주소{i}', 'UP-1', 1])
+        buf = io.BytesIO()
+        wb.save(buf)
+        return ContentFile(buf.getvalue(), name='orders.xlsx')
+
+    def _enqueue(self, rows=3):
+        return enqueue_import(self._workbook(rows), total_rows=rows)
+
+    def test_upload_is_queued_only_from_threshold_rows(self):
+        self.client.force_login(self.user)
+        url = reverse('orders:process_excel_api')
+        with override_settings(ORDER_IMPORT_ASYNC_THRESHOLD_ROWS=3):
+            small = self.client.post(url, {'excel_file': self._workbook(2)}).json()
+            self.assertEqual(small['status'], 'success')
+            self.assertEqual(Order.objects.count(), 2)
+            self.assertFalse(OrderImportJob.objects.exists())
+
+            large = self.client.post(url, {'excel_file': self._workbook(3)}).json()
+        job = OrderImportJob.objects.get()
+        self.assertEqual((large['status'], large['job_id'], job.status, job.total_rows), ('queued', job.pk, 'QUEUED', 3))
+        self.assertEqual(large['progress_url'], reverse('orders:import_job_progress', args=[job.pk]))
+        self.assertEqual(Order.objects.count(), 2)  # 큐에 넣은 파일은 요청 안에서 저장하지 않음
+
+    def test_job_is_claimed_only_once(self):
+        job = self._enqueue()
+        self.assertEqual(claim_next_job(), job)
+        self.assertIsNone(claim_next_job())
+
+    def test_stale_running_job_resumes_after_saved_rows(self):
+        job = self._enqueue()
+        original_import_chunk = OrderExcelImporter._import_chunk
+
+        def die_on_second_chunk(importer, chunk, *args):
+            if chunk[0]['order_no'] == 'UP-1':
+                raise KeyboardInterrupt  # 워커 프로세스가 강제 종료된 상황
+            return original_import_chunk(importer, chunk, *args)
+
+        with mock.patch.object(OrderExcelImporter, 'CHUNK_SIZE', 1):
+            with mock.patch.object(OrderExcelImporter, '_import_chunk', die_on_second_chunk), \
+                    self.assertRaises(KeyboardInterrupt):
+                run_job(claim_next_job())
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.processed_rows, job.success_count), ('RUNNING', 1, 1))
+            self.assertIsNone(claim_next_job())  # 처리 신호가 아직 최근이면 이어받지 않음
+
+            OrderImportJob.objects.filter(pk=job.pk).update(
+                heartbeat_at=timezone.now() - timedelta(seconds=settings.ORDER_IMPORT_STALE_TIMEOUT + 1)
+            )
+            job = run_job(claim_next_job())
+
+        self.assertEqual((job.status, job.processed_rows, job.success_count), ('DONE', 3, 3))
+        self.assertEqual(sorted(Order.objects.values_list('order_no', flat=True)), ['UP-0', 'UP-1', 'UP-2'])
+
+    def test_progress_api_adds_result_message_once(self):
+        job = self._enqueue()
+        run_job(claim_next_job())
+        self.client.force_login(self.user)
+        url = reverse('orders:import_job_progress', args=[job.pk])
+        for _ in range(3):
+            self.assertEqual(self.client.get(url).json()['status'], 'DONE')
+
+        response = self.client.get(reverse('orders:manage'), {'date': date.today().strftime('%Y-%m-%d')})
+        self.assertEqual(len(list(response.context['messages'])), 1)
+
+
+class OrderCollectorCursorTests(TestCase):
+    """
+    주문 수집 커서: 저장이 커밋된 뒤에만 이동하고, 구간 중간에서 멈춘 수집은 저장된 페이지 토큰부터 이어서 조회합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='수집센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='수집화주')
+        Product.objects.create(shipper=cls.shipper, name='수집상품', barcode='NV-1')
+        cls.started = timezone.now() - timedelta(minutes=10)
+        cls.api_info = ShipperApiInfo.objects.create(
+            shipper=cls.shipper, channel_type='NAVER', access_key='nv', secret_key='secret', last_collected_at=cls.started
+        )
+
+    def _paged_client(self, fail_once_at):
+        """처음 수집한 구간을 세 페이지로 돌려주고, fail_once_at 페이지는 처음 한 번 실패하는 네이버 클라이언트"""
+        pages = {None: ('NV-A', 'p2'), 'p2': ('NV-B', 'p3'), 'p3': ('NV-C', None)}
+        requested, failures = [], {fail_once_at}
+        started = self.started
+
+        class PagedNaverClient(NaverClient):
+            def _request_page(self, start_date, end_date, more_sequence=None):
+                requested.append(more_sequence)
+                if start_date != started:
+                    return [], None  # 이후 구간에는 주문 없음
+                if more_sequence in failures:
+                    failures.discard(more_sequence)
+                    raise TransportError('일시적 오류', status=503)
+                order_no, next_token = pages[more_sequence]
+                orders = [{'order_no': order_no, 'recipient_name': '수취인', 'items': [{'product_identifier': 'NV-1', 'quantity': 1}]}]
+                return orders, next_token
+
+        return PagedNaverClient, requested
+
+    def test_naver_mock_returns_more_than_one_page(self):
+        client = NaverClient('naver-key', 'naver-secret')
+        with mock.patch('builtins.print'):
+            pages = list(client.fetch_order_pages(self.started, self.started + timedelta(hours=1)))
+            resumed = list(client.fetch_order_pages(self.started, self.started + timedelta(hours=1), page_token='1'))
+
+        self.assertEqual([page.next_token for page in pages], ['1', None])
+        self.assertEqual([page.next_token for page in resumed], [None])
+
+    def test_cursor_moves_after_commit_and_resumes_from_page_token(self):
+        client_class, requested = self._paged_client(fail_once_at='p3')
+        with mock.patch.dict(OrderCollectorService.CLIENT_MAP, {'NAVER': client_class}):
+            with self.captureOnCommitCallbacks() as callbacks:
+                first = OrderCollectorService.collect_orders_for_shipper(self.shipper.pk)
+            # 커밋 전에는 커서가 그대로입니다.
+            self.assertEqual(ShipperApiInfo.objects.get(pk=self.api_info.pk).cursor_token, '')
+            for callback in callbacks:
+                callback()
+
+            api_info = ShipperApiInfo.objects.get(pk=self.api_info.pk)
+            self.assertEqual(first['results'][0]['success_count'], 2)
+            self.assertEqual((api_info.cursor_token, api_info.last_collected_at), ('p3', self.started))
+            self.assertIsNotNone(api_info.cursor_window_end)
+
+            requested.clear()
+            with self.captureOnCommitCallbacks(execute=True):
+                second = OrderCollectorService.collect_orders_for_shipper(self.shipper.pk)
+
+        api_info = ShipperApiInfo.objects.get(pk=self.api_info.pk)
+        self.assertEqual(second['results'][0]['success_count'], 1)
+        self.assertEqual(requested[0], 'p3')  # 실패한 페이지부터 이어서 조회
+        self.assertEqual((api_info.cursor_token, api_info.cursor_window_end), ('', None))
+        self.assertGreater(api_info.last_collected_at, self.started)
+        self.assertEqual(sorted(Order.objects.values_list('order_no', flat=True)), ['NV-A', 'NV-B', 'NV-C'])
+
+    def test_store_moves_cursor_forward_only_after_commit(self):
+        def new_store():
+            return ChannelOrderStore(ShipperApiInfo.objects.get(pk=self.api_info.pk))
+
+        window_end = self.started + timedelta(minutes=5)
+        page = OrderPage([{'order_no': 'NV-S', 'items': [{'product_identifier': 'NV-1', 'quantity': 1}]}], 'next')
+
+        # 저장이 롤백되면 커서도 움직이지 않습니다.
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(RuntimeError), transaction.atomic():
+            new_store().add_page(page, window_end)
+            raise RuntimeError('저장 실패')
+        self.assertEqual(ShipperApiInfo.objects.get(pk=self.api_info.pk).cursor_token, '')
+
+        store = new_store()
+        with self.captureOnCommitCallbacks(execute=True):
+            store.add_page(page, window_end)
+        self.assertEqual(ShipperApiInfo.objects.get(pk=self.api_info.pk).cursor_token, 'next')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            store.complete_window(window_end)
+        with self.captureOnCommitCallbacks(execute=True):
+            store.complete_window(self.started)  # 더 이른 구간이 늦게 끝나도 커서는 뒤로 가지 않음
+        api_info = ShipperApiInfo.objects.get(pk=self.api_info.pk)
+        self.assertEqual((api_info.last_collected_at, api_info.cursor_token), (window_end, ''))
+
+
+class ConcurrentChannelFetchTests(TestCase):
+    """
+    여러 채널의 주문 조회는 동시에 진행되고, 한 채널의 실패는 다른 채널의 수집에 영향을 주지 않습니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='동시센터', address='주소')
+        cls.started = timezone.now() - timedelta(minutes=10)
+        for key in ('ok-1', 'ok-2', 'down'):
+            shipper = Shipper.objects.create(center=center, name=f'동시화주-{key}')
+            Product.objects.create(shipper=shipper, name=f'동시상품-{key}', barcode=f'CC-{key}')
+            ShipperApiInfo.objects.create(
+                shipper=shipper, channel_type='NAVER', access_key=key, secret_key='secret', last_collected_at=cls.started
+            )
+
+    @override_settings(ORDER_COLLECTOR_MAX_WORKERS=3)
+    def test_channels_are_fetched_in_parallel_and_fail_independently(self):
+        # 정상 채널 두 곳이 서로를 기다려야 첫 페이지를 돌려주므로, 차례로 조회하면 시간 초과로 실패합니다.
+        both_fetching = threading.Barrier(2, timeout=5)
+        started = self.started
+
+        class ParallelNaverClient(NaverClient):
+            def _request_page(self, start_date, end_date, more_sequence=None):
+                if self.access_key == 'down':
+                    raise TransportError('점검 중', status=503)
+                if start_date != started:
+                    return [], None
+                both_fetching.wait()
+                orders = [{'order_no': f'CC-{self.access_key}', 'recipient_name': '수취인',
+                           'items': [{'product_identifier': f'CC-{self.access_key}', 'quantity': 1}]}]
+                return orders, None
+
+        with mock.patch.dict(OrderCollectorService.CLIENT_MAP, {'NAVER': ParallelNaverClient}):
+            result = OrderCollectorService.collect_all_active_orders()
+
+        by_shipper = {r['shipper']: r for r in result['results']}
+        self.assertEqual(by_shipper['동시화주-ok-1']['success_count'], 1)
+        self.assertEqual(by_shipper['동시화주-ok-2']['success_count'], 1)
+        self.assertEqual(by_shipper['동시화주-down']['status'], 'error')
+        self.assertEqual(sorted(Order.objects.values_list('order_no', flat=True)), ['CC-ok-1', 'CC-ok-2'])
+
+
+class OrderNumberSequenceTests(TestCase):
+    """
+    자동 주문번호: 일자별 카운터에서 블록 단위로 예약하며, 기존 번호 다음부터 겹치지 않게 이어집니다.
+    """
+
+    def test_reserved_numbers_never_repeat(self):
+        day = date(2026, 1, 5)
+        Order.objects.create(order_no='20260105-0007', order_date=timezone.now(), recipient_name='기존')
+
+        first = OrderNumberSequence.reserve(3, day=day)
+        second = OrderNumberSequence.reserve(1, day=day)
+        other_day = OrderNumberSequence.reserve(2, day=day + timedelta(days=1))
+
+        self.assertEqual(first, ['20260105-0008', '20260105-0009', '20260105-0010'])
+        self.assertEqual(second, ['20260105-0011'])
+        self.assertEqual(other_day, ['20260106-0001', '20260106-0002'])
+
+    def test_saved_and_bulk_numbered_orders_share_the_counter(self):
+        single = Order.objects.create(order_date=timezone.now(), recipient_name='단건')
+        batch = Order.assign_order_numbers([Order(recipient_name=f'일괄{i}') for i in range(5)])
+        another = Order.objects.create(order_date=timezone.now(), recipient_name='단건2')
+
+        numbers = [single.order_no] + [order.order_no for order in batch] + [another.order_no]
+        self.assertEqual(len(set(numbers)), 7)
+        self.assertEqual([int(number.split('-')[1]) for number in numbers], list(range(1, 8)))
+
+
+class InvoiceStockOutTests(TestCase):
+    """
+    송장 출력 출고: 상품 재고와 현재고(StockBalance)를 출고 기록(StockMovement) 원장과 같은 수량만큼 차감합니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='출고센터', address='주소')
+        cls.shipper = Shipper.objects.create(center=center, name='출고화주')
+        cls.user = User.objects.create_superuser('invoice', 'invoice@example.com', 'pw')
+        cls.products = [
+            Product.objects.create(shipper=cls.shipper, name=f'출고상품{i}', barcode=f'INV-{i}', quantity=10)
+            for i in range(2)
+        ]
+        for product in cls.products:
+            StockMovement.objects.create(product=product, movement_type='IN', quantity=10, memo='초기 입고')
+
+    def _order(self, *quantities):
+        order = Order.objects.create(shipper=self.shipper, order_date=timezone.now(), recipient_name='수취인')
+        for product, quantity in zip(self.products, quantities):
+            if quantity:
+                OrderItem.objects.create(order=order, product=product, quantity=quantity)
+        return order
+
+    def _post_invoice(self, orders):
+        request = RequestFactory().post('/orders/invoice/', {'order_ids': ','.join(str(o.pk) for o in orders)})
+        request.user = self.user
+        request.session = {}
+        request._messages = FallbackStorage(request)
+        return order_invoice_view(request)
+
+    def _balances(self):
+        return dict(StockBalance.objects.values_list('product_id', 'quantity'))
+
+    def test_invoice_decrements_balance_to_match_ledger(self):
+        orders = [self._order(2, 1), self._order(3, 0), self._order(0, 4)]
+        response = self._post_invoice(orders)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([Product.objects.get(pk=p.pk).quantity for p in self.products], [5, 5])
+        self.assertEqual(self._balances(), {self.products[0].pk: 5, self.products[1].pk: 5})
+        self.assertEqual(StockBalance.ledger_totals(), {(p.pk, None, 1): 5 for p in self.products})
+        self.assertEqual(set(Order.objects.values_list('order_status', flat=True)), {'SHIPPED'})
+        self.assertEqual(DailyOrderStat.status_counts(date.today()), {'SHIPPED': 3})
+        self.assertEqual(response.content.decode().count('class="invoice-box"'), 3)
+
+    def test_shortage_ships_nothing(self):
+        orders = [self._order(6, 0), self._order(6, 1)]
+        response = self._post_invoice(orders)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self._balances(), {self.products[0].pk: 10, self.products[1].pk: 10})
+        self.assertFalse(StockMovement.objects.filter(movement_type='OUT').exists())
+        self.assertEqual(set(Order.objects.values_list('order_status', flat=True)), {'PENDING'})
+
+
+class OrderExportTests(TestCase):
+    """
+    주문 내보내기: 선택한 날짜의 주문을 상품 단위 한 행으로 CSV(BOM 포함) 또는 xlsx로 내려받습니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='내보내기센터', address='주소')
+        shipper = Shipper.objects.create(center=center, name='내보내기화주')
+        channel = SalesChannel.objects.create(name='내보내기채널')
+        cls.user = User.objects.create_superuser('exporter', 'exporter@example.com', 'pw')
+        products = [
+            Product.objects.create(shipper=shipper, name=f'한글상품{i}', barcode=f'EXP-{i}', quantity=10)
+            for i in range(2)
+        ]
+        cls.day = timezone.localdate()
+        order_date = timezone.make_aware(datetime.combine(cls.day, datetime.min.time())) + timedelta(hours=9)
+        cls.order = Order.objects.create(
+            shipper=shipper, channel=channel, order_date=order_date,
+            recipient_name='홍길동', recipient_phone='010-1234-5678', address='서울시 중구', delivery_memo='문 앞',
+        )
+        for product in products:
+            OrderItem.objects.create(order=cls.order, product=product, quantity=2)
+        # 다른 날짜의 주문은 내보내지 않습니다.
+        other = Order.objects.create(shipper=shipper, order_date=order_date - timedelta(days=1), recipient_name='어제')
+        OrderItem.objects.create(order=other, product=products[0], quantity=1)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def _export(self, **params):
+        response = self.client.get(reverse('orders:export_excel'), {'date': self.day.isoformat(), **params})
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_csv_is_streamed_with_bom_and_korean_rows(self):
+        import csv
+
+        response = self._export(format='csv')
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn(f'orders_{self.day:%Y%m%d}.csv', response['Content-Disposition'])
+
+        content = b''.join(response.streaming_content)
+        self.assertTrue(content.startswith('﻿'.encode('utf-8')))
+        rows = list(csv.reader(io.StringIO(content.decode('utf-8-sig'))))
+        self.assertEqual(rows[0], EXPORT_HEADERS)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row[8] for row in rows[1:]], ['한글상품0', '한글상품1'])
+        self.assertTrue(rows[1][1].startswith(f'{self.day:%Y-%m-%d} '))
+        self.assertEqual(rows[1][:1] + rows[1][2:8], [
+            self.order.order_no, '내보내기화주', '내보내기채널',
+            self.order.get_order_status_display(), '홍길동', '010-1234-5678', '서울시 중구',
+        ])
+        self.assertEqual(rows[1][10:], ['2', '문 앞'])
+
+    def test_xlsx_rows_match_and_tempfile_is_closed(self):
+        opened = []
+        real_temporary_file = tempfile.TemporaryFile
+
+        def temporary_file(*args, **kwargs):
+            opened.append(real_temporary_file(*args, **kwargs))
+            return opened[-1]
+
+        with mock.patch('tempfile.TemporaryFile', side_effect=temporary_file):
+            response = self._export()
+        self.assertIn(f'orders_{self.day:%Y%m%d}.xlsx', response['Content-Disposition'])
+
+        content = b''.join(response.streaming_content)
+        # 전송이 끝나면 응답이 닫히면서 임시 파일도 닫히고 지워집니다.
+        self.assertEqual(len(opened), 1)
+        self.assertTrue(opened[0].closed)
+
+        ws = openpyxl.load_workbook(io.BytesIO(content), read_only=True).active
+        self.assertEqual(ws.title, f'주문목록_{self.day:%Y%m%d}')
+        rows = [list(row) for row in ws.iter_rows(values_only=True)]
+        self.assertEqual(rows[0], EXPORT_HEADERS)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row[8] for row in rows[1:]], ['한글상품0', '한글상품1'])
+        self.assertEqual((rows[1][0], rows[1][5], rows[1][10]), (self.order.order_no, '홍길동', 2))
+
+    def test_xlsx_without_orders_has_placeholder_row(self):
+        response = self._export(date=(self.day + timedelta(days=1)).isoformat())
+        ws = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)), read_only=True).active
+        self.assertEqual(
+            [list(row) for row in ws.iter_rows(values_only=True)],
+            [EXPORT_HEADERS, ['데이터가 없습니다.']],
+        )
@@ -11,6 +11,7 @@ urlpatterns = [
     # 주문 목록 (성공/오류)
     path('list/success/<str:date_str>/', views.order_list_success_view, name='list_success'),
     path('list/error/<str:date_str>/', views.order_list_error_view, name='list_error'),
+    path('api/orders/', views.order_list_api, name='order_list_api'),
     
     # 오류 주문 수정 및 송장 출력
     path('<int:order_pk>/update/', views.order_update_view, name='update'),
@@ -20,6 +21,7 @@ urlpatterns = [
     # --- API URLS ---
     # 엑셀 처리 관련
     path('api/process_excel/', views.process_orders_api, name='process_excel_api'),
+    path('api/import-jobs/<int:job_id>/', views.import_job_progress_api, name='import_job_progress'),
     path('api/batch_retry/', views.batch_retry_error_api, name='batch_correct_errors'),
     path('api/delete_error_item/', views.delete_error_item_api, name='delete_error_item'),
     path('download/sample/', views.download_sample_excel_view, name='download_sample'),
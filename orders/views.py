@@ -1,21 +1,40 @@
 # orders/views.py
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
-from django.http import JsonResponse, HttpResponseBadRequest, HttpResponse
-from django.db.models import Count, Q, F # [수정] F객체 추가
-from datetime import datetime, date, timedelta
-from django.db.models.functions import TruncDate
-from django.db import transaction
+from django.http import JsonResponse, HttpResponseBadRequest, HttpResponse, StreamingHttpResponse, FileResponse
+from django.db.models import Count, Sum, Q, F, Case, When, Value, IntegerField # [수정] F객체 추가
+from datetime import datetime, date, timedelta, timezone as dt_timezone
+from collections import defaultdict
+from django.db import transaction, IntegrityError
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_POST
+from django.utils import timezone
 import openpyxl
 import json
 
 from management.models import Shipper, Product, SalesChannel
-from stock.models import StockMovement # [추가] StockMovement 모델 import
-from .models import Order, OrderItem
+from stock.models import StockMovement, StockBalance # [추가] StockMovement 모델 import
+from .models import Order, OrderItem, OrderImportJob, OrderErrorDetail, DailyOrderStat
 from .forms import OrderUpdateForm
+from .services import OrderExcelImporter, ErrorOrderRetrier, enqueue_import
+from core.cache import dashboards_cache
+
+# 송장 출력 시 재고 차감 UPDATE 한 번에 묶을 상품 수
+INVOICE_UPDATE_BATCH_SIZE = 200
+
+
+def _order_date_range(start_date, end_date=None):
+    """
+    [추가] 날짜(현재 시간대 기준) 구간을 order_date 범위 조건으로 바꿉니다.
+    order_date__date 처럼 컬럼을 함수로 감싸면 인덱스를 쓸 수 없으므로
+    order_date >= 시작일 00:00 AND order_date < (종료일+1) 00:00 형태로 조회합니다.
+    """
+    end_date = end_date or start_date
+    start = timezone.make_aware(datetime.combine(start_date, datetime.min.time()))
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+    return {'order_date__gte': start, 'order_date__lt': end}
 
 # ... (order_manage_view, order_list_success_view 등 다른 뷰는 그대로 유지) ...
 @login_required
@@ -23,23 +42,13 @@ def order_manage_view(request):
     """
     일자별 주문 관리 대시보드 뷰
     """
-    from django.utils import timezone
-    
     date_str = request.GET.get('date')
     selected_date = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else date.today()
     
-    # 선택된 날짜의 00:00:00부터 23:59:59까지 (현재 시간대 기준)
-    start_datetime = timezone.make_aware(datetime.combine(selected_date, datetime.min.time()))
-    end_datetime = timezone.make_aware(datetime.combine(selected_date, datetime.max.time()))
-    
-    # order_date가 해당 날짜 범위에 속하는 주문 필터링
-    orders_for_date = Order.objects.filter(
-        order_date__gte=start_datetime,
-        order_date__lte=end_datetime
-    )
-    
-    success_count = orders_for_date.exclude(order_status='ERROR').count()
-    error_count = orders_for_date.filter(order_status='ERROR').count()
+    # [수정] 주문 테이블 대신 일자별 집계(DailyOrderStat)의 해당 날짜 행만 합산
+    counts_by_status = DailyOrderStat.status_counts(selected_date)
+    error_count = counts_by_status.pop('ERROR', 0)
+    success_count = sum(counts_by_status.values())
     
     # [삭제] 세션의 temp_errors 카운트 제거 (모든 오류가 DB에 저장됨)
     
@@ -60,71 +69,193 @@ def order_manage_view(request):
     }
     return render(request, 'orders/order_manage.html', context)
 
-@login_required
-def order_list_success_view(request, date_str):
+
+# [추가] 성공 목록에서 고를 수 있는 주문 상태 (오류 제외)
+SUCCESS_LIST_STATUSES = [(value, label) for value, label in Order.ORDER_STATUS_CHOICES if value != 'ERROR']
+
+
+def _encode_list_cursor(order):
+    """[추가] 목록 정렬 키 (order_date, id)를 URL에 쓸 수 있는 커서 문자열로 만듭니다."""
+    micros = (order.order_date - datetime(1970, 1, 1, tzinfo=dt_timezone.utc)) // timedelta(microseconds=1)
+    return f"{micros}-{order.pk}"
+
+
+def _decode_list_cursor(cursor):
+    try:
+        micros, pk = (int(value) for value in cursor.split('-'))
+    except (AttributeError, ValueError):
+        return None
+    return datetime(1970, 1, 1, tzinfo=dt_timezone.utc) + timedelta(microseconds=micros), pk
+
+
+def _order_list_filters(request):
+    """[추가] 목록 필터(화주사/판매채널/상태)를 GET 파라미터에서 읽습니다."""
+    shipper_id = request.GET.get('shipper', '')
+    channel_id = request.GET.get('channel', '')
+    status = request.GET.get('status', '')
+    return {
+        'shipper': int(shipper_id) if shipper_id.isdigit() else None,
+        'channel': int(channel_id) if channel_id.isdigit() else None,
+        'status': status if status in dict(SUCCESS_LIST_STATUSES) else '',
+    }
+
+
+def _orders_for_day(target_date, filters):
+    """[추가] 날짜와 화주사/판매채널 필터가 적용된 주문 조회"""
+    orders = Order.objects.filter(**_order_date_range(target_date))
+    if filters['shipper']:
+        orders = orders.filter(shipper_id=filters['shipper'])
+    if filters['channel']:
+        orders = orders.filter(channel_id=filters['channel'])
+    return orders
+
+
+def _order_list_queryset(list_type, target_date, filters):
+    """[추가] 목록 종류까지 적용된 주문 조회 (상태 필터는 성공 목록에만 적용)"""
+    orders = _orders_for_day(target_date, filters)
+    if list_type == 'error':
+        return orders.filter(order_status='ERROR')
+    if filters['status']:
+        return orders.filter(order_status=filters['status'])
+    return orders.exclude(order_status='ERROR')
+
+
+def _order_list_counts(target_date, filters):
     """
-    선택한 날짜의 '성공' 주문 목록을 보여주는 뷰
+    [추가] 목록 상단 건수: 상태별 GROUP BY 집계 한 번으로 성공/오류/상태별 건수를 구합니다.
     """
+    orders = _orders_for_day(target_date, filters)
+    by_status = dict(orders.order_by().values_list('order_status').annotate(count=Count('id')))
+    error_count = by_status.pop('ERROR', 0)
+    return {'success': sum(by_status.values()), 'error': error_count, 'by_status': by_status}
+
+
+def _success_row(order):
+    return {
+        'id': order.id,
+        'order_no': order.order_no,
+        'shipper_name': order.shipper.name if order.shipper else '',
+        'recipient_name': order.recipient_name,
+        'order_status': order.order_status,
+        'order_status_display': order.get_order_status_display(),
+        'items': [{'product_name': item.product.name, 'quantity': item.quantity} for item in order.items.all()],
+    }
+
+
+def _error_row(order):
+    # 오류 내용은 OrderErrorDetail 컬럼에서 바로 읽습니다. (입력 원본 raw_data는 읽지 않음)
+    detail = getattr(order, 'error_detail', None) or OrderErrorDetail(error_message=order.error_message or '')
+    return {
+        'unique_id': f"db-{order.id}",
+        'id': order.id,
+        'order_no': order.order_no,
+        'recipient_name': order.recipient_name,
+        'shipper_name': order.shipper.name if order.shipper else detail.shipper_name,
+        'product_identifier': detail.product_identifier,
+        'channel_name': order.channel.name if order.channel else detail.channel_name,
+        'quantity': detail.quantity if detail.quantity is not None else '',
+        'recipient_phone': order.recipient_phone,
+        'address': order.address,
+        'error_message': detail.error_message or '알 수 없는 오류',
+        'error_fields': detail.error_fields,
+    }
+
+
+def _order_list_page(list_type, target_date, filters, cursor=None, limit=None):
+    """
+    [추가] 주문 목록 한 페이지 (키셋 페이지네이션)
+
+    (order_date, id) 순서로 정렬하고, 다음 페이지는 OFFSET 없이 '마지막 행보다 뒤' 조건으로 찾으므로
+    하루 주문 수가 많아도 페이지마다 인덱스에서 limit건만 읽습니다.
+
+    Returns:
+        {'results': [...], 'next_cursor': 다음 페이지 커서 또는 None, 'has_more': bool}
+    """
+    limit = min(limit or settings.ORDER_LIST_PAGE_SIZE, settings.ORDER_LIST_MAX_PAGE_SIZE)
+    orders = _order_list_queryset(list_type, target_date, filters).order_by('order_date', 'id')
+    position = _decode_list_cursor(cursor) if cursor else None
+    if position:
+        last_date, last_id = position
+        orders = orders.filter(Q(order_date__gt=last_date) | Q(order_date=last_date, id__gt=last_id))
+
+    if list_type == 'error':
+        orders = orders.select_related('shipper', 'channel', 'error_detail').defer('error_detail__raw_data')
+        to_row = _error_row
+    else:
+        orders = orders.select_related('shipper').prefetch_related('items__product')
+        to_row = _success_row
+
+    page = list(orders[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    return {
+        'results': [to_row(order) for order in page],
+        'next_cursor': _encode_list_cursor(page[-1]) if has_more else None,
+        'has_more': has_more,
+    }
+
+
+def _order_list_view(request, date_str, list_type):
+    """[수정] 성공/오류 목록 화면: 첫 페이지와 건수만 내려주고 이후 페이지는 order_list_api로 불러옵니다."""
     target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-    print(f"DEBUG: Success View Called using TEMPLATE: orders/order_list_result_new.html")
-    orders = Order.objects.filter(order_date__date=target_date).exclude(order_status='ERROR').prefetch_related('items__product')
-    
-    orders_json = []
-    for order in orders:
-        items = [{'product_name': item.product.name, 'quantity': item.quantity} for item in order.items.all()]
-        orders_json.append({'id': order.id, 'items': items})
-        
+    filters = _order_list_filters(request)
     context = {
-        'page_title': f'{date_str} 성공 주문 목록',
-        'orders': orders,
-        'list_type': 'success',
-        'orders_json': orders_json,
+        'page_title': f"{date_str} {'성공' if list_type == 'success' else '오류'} 주문 목록",
+        'list_type': list_type,
+        'date_str': date_str,
+        'filters': filters,
+        'counts': _order_list_counts(target_date, filters),
+        'initial_page': _order_list_page(list_type, target_date, filters),
+        'filter_shippers': Shipper.objects.order_by('name').values('id', 'name'),
+        'filter_channels': SalesChannel.objects.order_by('name').values('id', 'name'),
+        'status_choices': SUCCESS_LIST_STATUSES,
     }
     return render(request, 'orders/order_list_final.html', context)
 
+
+@login_required
+def order_list_success_view(request, date_str):
+    """
+    선택한 날짜의 '성공' 주문 목록을 보여주는 뷰
+    """
+    return _order_list_view(request, date_str, 'success')
+
+
 @login_required
 def order_list_error_view(request, date_str):
     """
     선택한 날짜의 '오류' 주문 목록을 보여주는 뷰
     """
-    target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-    print(f"DEBUG: Error View Called using TEMPLATE: orders/order_list_result_new.html")
-    processed_errors = []
-
-    # [수정] DB에서만 오류 조회 (세션 로직 제거)
-    db_error_orders = Order.objects.filter(order_date__date=target_date, order_status='ERROR')
-    for order in db_error_orders:
-        error_details = {}
-        try:
-            error_details = json.loads(order.error_message)
-        except (json.JSONDecodeError, TypeError):
-            pass
-        
-        original_data = error_details.get('original_data', {})
-        processed_errors.append({
-            'is_db': True,
-            'unique_id': f"db-{order.id}",
-            'id': order.id,
-            'order_no': order.order_no,
-            'recipient_name': order.recipient_name,
-            'shipper_name': order.shipper.name if order.shipper else original_data.get('shipper_name', ''),
-            'product_identifier': original_data.get('product_identifier', ''),
-            'channel_name': order.channel.name if order.channel else original_data.get('channel_name', ''),
-            'quantity': original_data.get('quantity', ''),
-            'recipient_phone': order.recipient_phone,
-            'address': order.address,
-            'error_message': error_details.get('error_message', order.error_message or '알 수 없는 오류'),
-            'error_fields': error_details.get('error_fields', []),
-        })
+    return _order_list_view(request, date_str, 'error')
 
-    # [삭제] 세션 오류 조회 로직 제거
 
-    context = {
-        'page_title': f'{date_str} 오류 주문 목록', 
-        'orders': processed_errors,
-        'list_type': 'error',
-    }
-    return render(request, 'orders/order_list_final.html', context)
+@login_required
+def order_list_api(request):
+    """
+    [신규] 주문 목록 무한 스크롤 API
+
+    GET 파라미터:
+        date: 조회 날짜 (YYYY-MM-DD), list_type: success | error
+        shipper, channel: 화주사/판매채널 id, status: 주문 상태 (성공 목록만)
+        cursor: 이전 응답의 next_cursor, limit: 페이지 크기 (최대 ORDER_LIST_MAX_PAGE_SIZE)
+    """
+    try:
+        target_date = datetime.strptime(request.GET.get('date', ''), '%Y-%m-%d').date()
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': '날짜 형식이 올바르지 않습니다.'}, status=400)
+    cursor = request.GET.get('cursor')
+    if cursor and _decode_list_cursor(cursor) is None:
+        return JsonResponse({'status': 'error', 'message': '잘못된 커서입니다.'}, status=400)
+    list_type = 'error' if request.GET.get('list_type') == 'error' else 'success'
+    filters = _order_list_filters(request)
+    limit = request.GET.get('limit', '')
+
+    data = _order_list_page(list_type, target_date, filters, cursor=cursor, limit=int(limit) if limit.isdigit() else None)
+    if not cursor:
+        # 필터를 바꿔 처음부터 다시 불러올 때만 건수를 함께 보냅니다.
+        data['counts'] = _order_list_counts(target_date, filters)
+    return JsonResponse(data)
+
 
 @login_required
 def order_update_view(request, order_pk):
@@ -138,17 +269,25 @@ def order_update_view(request, order_pk):
             updated_order = form.save(commit=False)
             updated_order.error_message = ""
             updated_order.order_status = 'PENDING'
-            updated_order.save()
-            messages.success(request, f"주문({order.order_no})이 성공적으로 수정되었습니다.")
-            date_str = order.order_date.strftime('%Y-%m-%d')
-            return redirect('orders:list_error', date_str=date_str)
+            try:
+                with transaction.atomic():
+                    updated_order.save()
+                    OrderErrorDetail.objects.filter(order=updated_order).delete()
+            except IntegrityError:
+                # [추가] 같은 화주사/판매채널에 이미 같은 주문번호의 정상 주문이 있는 경우
+                updated_order.order_status = 'ERROR'
+                messages.error(request, f"주문번호({updated_order.order_no})가 이미 등록되어 있어 수정할 수 없습니다.")
+            else:
+                messages.success(request, f"주문({order.order_no})이 성공적으로 수정되었습니다.")
+                date_str = order.order_date.strftime('%Y-%m-%d')
+                return redirect('orders:list_error', date_str=date_str)
     else:
-        try:
-            error_details = json.loads(order.error_message)
-            initial_data = error_details.get('original_data', {})
+        detail = OrderErrorDetail.objects.filter(order=order).first()
+        if detail is not None:
+            initial_data = dict(detail.raw_data)
             initial_data.update({ 'recipient_name': order.recipient_name, 'recipient_phone': order.recipient_phone, 'address': order.address })
             form = OrderUpdateForm(initial=initial_data)
-        except (json.JSONDecodeError, TypeError):
+        else:
             form = OrderUpdateForm(instance=order)
             
     context = { 'page_title': '오류 주문 수정', 'form': form, 'order': order }
@@ -177,135 +316,124 @@ def order_invoice_view(request):
         return HttpResponse("출력할 주문이 없거나 이미 처리된 주문입니다.", status=404)
         
     # --- [신규] 자동 출고 처리 로직 ---
+    # 1. 선택된 주문 전체의 상품별 필요 수량 합산
+    required_quantities = defaultdict(int)
     for order in orders:
         for item in order.items.all():
-            product = item.product
-            # 1. 재고 수량 확인
-            if product.quantity < item.quantity:
-                messages.error(request, f"재고 부족: '{product.name}'의 출고를 처리할 수 없습니다. (현재 재고: {product.quantity})")
-                # 트랜잭션을 롤백하고 함수를 종료
-                transaction.set_rollback(True)
-                # 이전 페이지로 리디렉션
-                return redirect(request.META.get('HTTP_REFERER', 'orders:manage'))
-
-            # 2. 재고 수량 차감
-            product.quantity = F('quantity') - item.quantity
-            product.save()
+            required_quantities[item.product_id] += item.quantity
+
+    # 2. 대상 상품의 재고 행을 잠그고 한 번에 조회하여 부족한 상품을 모두 확인
+    products = Product.objects.select_for_update().filter(pk__in=required_quantities).order_by('pk')
+    shortages = [
+        f"'{product.name}' (필요: {required_quantities[product.pk]}, 현재 재고: {product.quantity})"
+        for product in products
+        if product.quantity < required_quantities[product.pk]
+    ]
+    if shortages:
+        messages.error(request, f"재고 부족으로 출고를 처리할 수 없습니다: {', '.join(shortages)}")
+        # 트랜잭션을 롤백하고 함수를 종료
+        transaction.set_rollback(True)
+        # 이전 페이지로 리디렉션
+        return redirect(request.META.get('HTTP_REFERER', 'orders:manage'))
 
-            # 3. 출고 기록(StockMovement) 생성
-            StockMovement.objects.create(
-                product=product,
-                movement_type='OUT',
-                quantity=item.quantity,
-                memo=f'주문 출고 ({order.order_no})'
+    # 3. 재고 수량 차감 (상품 묶음마다 UPDATE 한 번)
+    product_ids = list(required_quantities)
+    for i in range(0, len(product_ids), INVOICE_UPDATE_BATCH_SIZE):
+        batch = product_ids[i:i + INVOICE_UPDATE_BATCH_SIZE]
+        Product.objects.filter(pk__in=batch).update(
+            quantity=F('quantity') - Case(
+                *[When(pk=product_id, then=Value(required_quantities[product_id])) for product_id in batch],
+                output_field=IntegerField()
             )
+        )
+
+    # 4. 출고 기록(StockMovement) 일괄 생성 및 현재고 반영
+    movements = [
+        StockMovement(
+            product_id=item.product_id,
+            movement_type='OUT',
+            quantity=item.quantity,
+            memo=f'주문 출고 ({order.order_no})'
+        )
+        for order in orders
+        for item in order.items.all()
+    ]
+    StockMovement.objects.bulk_create(movements, batch_size=500)
+    StockBalance.apply_movements(movements)
     # ------------------------------------
 
     # 송장 출력 시 주문 상태를 '출고완료'로 변경
+    # update()는 조회 결과를 비우므로 출고한 주문 목록을 먼저 받아 둡니다.
+    shipped_orders = list(orders)
+    before = DailyOrderStat.snapshot(shipped_orders)
     orders.update(order_status='SHIPPED')
+    for order in shipped_orders:
+        order.order_status = 'SHIPPED'
+    DailyOrderStat.orders_changed(shipped_orders, before=before)
     
-    context = {'orders': orders}
+    context = {'orders': shipped_orders}
     return render(request, 'orders/invoice_template.html', context)
 
 # ... (이하 API 뷰들은 그대로 유지) ...
 @login_required
 @require_POST
-@transaction.atomic
 def process_orders_api(request):
     """
     업로드된 엑셀 파일을 처리하여 주문을 생성하는 API
+    행 수가 ORDER_IMPORT_ASYNC_THRESHOLD_ROWS 이상이면 백그라운드 작업으로 등록하고 진행 상황 조회 URL을 반환합니다.
     """
     excel_file = request.FILES.get('excel_file')
     handle_duplicates = request.POST.get('handle_duplicates')
     if not excel_file:
         return JsonResponse({'status': 'error', 'message': '엑셀 파일이 없습니다.'}, status=400)
 
-    wb = openpyxl.load_workbook(excel_file, data_only=True)
-    sheet = wb.active
-    
-    success_orders, error_orders = [], []
-    processed_in_this_file = set()
-
-    for row_idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-        if not any(row): continue
-        order_data = {
-            'order_no': str(row[0]).strip() if row[0] else None, 'shipper_name': str(row[1]).strip() if row[1] else None,
-            'channel_name': str(row[2]).strip() if row[2] else None, 'recipient_name': str(row[3]).strip() if row[3] else None,
-            'recipient_phone': str(row[4]).strip() if row[4] else '', 'address': str(row[5]).strip() if row[5] else '',
-            'product_identifier': str(row[6]).strip() if row[6] else None, 'quantity': int(row[7]) if row[7] and str(row[7]).isdigit() else 0,
-        }
-        
-        errors, error_fields = [], []
-        shipper = None
-
-        try:
-            if not order_data['shipper_name']: errors.append("화주사 정보 누락"); error_fields.append('shipper_name')
-            else:
-                try: shipper = Shipper.objects.get(name=order_data['shipper_name'])
-                except Shipper.DoesNotExist: errors.append("미등록 화주사"); error_fields.append('shipper_name')
+    # [추가] 대용량 파일은 요청 안에서 처리하지 않고 작업 큐에 등록
+    total_rows = OrderExcelImporter.count_rows(excel_file)
+    if total_rows >= settings.ORDER_IMPORT_ASYNC_THRESHOLD_ROWS:
+        job = enqueue_import(excel_file, handle_duplicates=(handle_duplicates == 'yes'), user=request.user, total_rows=total_rows)
+        return JsonResponse({
+            'status': 'queued',
+            'job_id': job.pk,
+            'progress_url': reverse('orders:import_job_progress', args=[job.pk]),
+            'message': f'{total_rows}행의 대용량 파일은 백그라운드에서 처리됩니다.',
+        })
 
-            if not order_data['product_identifier']: errors.append("상품 정보 누락"); error_fields.append('product_identifier')
-            elif shipper and not Product.objects.filter(Q(barcode=order_data['product_identifier']) | Q(name=order_data['product_identifier']), shipper=shipper).exists():
-                errors.append("미등록 상품"); error_fields.append('product_identifier')
-            
-            if not order_data['quantity'] or order_data['quantity'] <= 0: errors.append("수량 오류"); error_fields.append('quantity')
-            if not order_data['channel_name']: errors.append("판매채널 누락"); error_fields.append('channel_name')
-            if errors: raise ValueError(", ".join(sorted(list(set(errors)))))
-
-            if handle_duplicates != 'yes':
-                if Order.objects.filter(shipper=shipper, recipient_name=order_data['recipient_name'], address=order_data['address'], recipient_phone=order_data['recipient_phone']).exists(): continue
-                file_dup_key = (order_data['shipper_name'], order_data['recipient_name'], order_data['address'], order_data['recipient_phone'])
-                if file_dup_key in processed_in_this_file: continue
-                processed_in_this_file.add(file_dup_key)
-
-            channel, _ = SalesChannel.objects.get_or_create(name=order_data['channel_name'])
-            product = Product.objects.get(Q(barcode=order_data['product_identifier']) | Q(name=order_data['product_identifier']), shipper=shipper)
-            
-            order = Order.objects.create(
-                order_no=order_data['order_no'], shipper=shipper, channel=channel,
-                recipient_name=order_data['recipient_name'], recipient_phone=order_data['recipient_phone'],
-                address=order_data['address'], order_date=datetime.now(), order_status='PENDING'
-            )
-            OrderItem.objects.create(order=order, product=product, quantity=order_data['quantity'])
-            success_orders.append(order)
-
-        except Exception as e:
-            # [수정] 오류를 세션 대신 DB에 저장
-            # channel 정보 처리
-            channel = None
-            if order_data.get('channel_name'):
-                channel, _ = SalesChannel.objects.get_or_create(name=order_data['channel_name'])
-            
-            # DB에 오류 주문 생성
-            error_order = Order.objects.create(
-                order_no=order_data.get('order_no'),
-                shipper=shipper,  # shipper가 없는 경우 None
-                channel=channel,  # channel이 없는 경우 None
-                recipient_name=order_data.get('recipient_name', ''),
-                recipient_phone=order_data.get('recipient_phone', ''),
-                address=order_data.get('address', ''),
-                order_date=datetime.now(),
-                order_status='ERROR',
-                error_message=json.dumps({
-                    'error_message': str(e),
-                    'error_fields': sorted(list(set(error_fields))),
-                    'original_data': order_data
-                }, ensure_ascii=False)
-            )
-            error_orders.append(error_order)
+    # 읽기 전용 스트리밍으로 시트를 읽고, 참조 데이터는 집합 쿼리로 미리 조회한 뒤 일괄 저장합니다.
+    with transaction.atomic():
+        stats = OrderExcelImporter(handle_duplicates=(handle_duplicates == 'yes')).import_file(excel_file)
 
-    messages.success(request, f"엑셀 처리가 완료되었습니다. 성공: {len(success_orders)}건, 실패: {len(error_orders)}건")
+    messages.success(request, f"엑셀 처리가 완료되었습니다. 성공: {stats['success_count']}건, 실패: {stats['error_count']}건")
     # [삭제] 세션에 오류 저장하는 로직 제거
     # request.session['temp_errors'] = error_orders
     today_str = date.today().strftime('%Y-%m-%d')
     return JsonResponse({'status': 'success', 'redirect_url': reverse('orders:manage') + f'?date={today_str}'})
 
+@login_required
+def import_job_progress_api(request, job_id):
+    """
+    [신규] 백그라운드 주문 업로드 작업의 진행 상황을 반환하는 API
+    완료되면 결과 메시지를 남기고 주문 관리 페이지로 이동할 URL을 함께 반환합니다.
+    """
+    job = get_object_or_404(OrderImportJob, pk=job_id)
+    data = job.to_progress_dict()
+    # [수정] 완료 후에도 여러 번(여러 탭) 조회될 수 있으므로 결과 메시지는 처음 조회한 요청에서 한 번만 남깁니다.
+    if job.status in ('DONE', 'FAILED') and OrderImportJob.objects.filter(pk=job.pk, result_notified=False).update(result_notified=True):
+        if job.status == 'DONE':
+            messages.success(request, job.message)
+        else:
+            messages.error(request, job.message)
+    if job.status in ('DONE', 'FAILED'):
+        today_str = date.today().strftime('%Y-%m-%d')
+        data['redirect_url'] = reverse('orders:manage') + f'?date={today_str}'
+    return JsonResponse(data)
+
 @login_required
 @require_POST
 @transaction.atomic
 def batch_retry_error_api(request):
     """
     오류 목록 페이지에서 인라인 수정 후 일괄 재시도하는 API
+    [수정] 행마다 조회/저장하지 않고 ErrorOrderRetrier로 전체 행을 집합 단위로 처리합니다.
     """
     data = json.loads(request.body)
     
@@ -314,78 +442,8 @@ def batch_retry_error_api(request):
         all_items_data = data.get('updates', [])
     else:
         all_items_data = data
-        
-    results = []
-    
-    for item_data in all_items_data:
-        order_data = item_data.get('data', {})
-        unique_id = item_data.get('unique_id')
-        
-        # [수정] unique_id가 없거나 형식이 잘못된 경우 방어
-        if not unique_id:
-             results.append({'unique_id': 'unknown', 'status': 'error', 'error_message': 'ID 누락'})
-             continue
-
-        errors, error_fields = [], []; shipper = None
-        try:
-            if not order_data.get('shipper_name'): errors.append("화주사 정보 누락"); error_fields.append('shipper_name')
-            else:
-                try: shipper = Shipper.objects.get(name=order_data['shipper_name'])
-                except Shipper.DoesNotExist: errors.append("미등록 화주사"); error_fields.append('shipper_name')
-            
-            if not order_data.get('product_identifier'): errors.append("상품 정보 누락"); error_fields.append('product_identifier')
-            elif shipper and not Product.objects.filter(Q(barcode=order_data['product_identifier']) | Q(name=order_data['product_identifier']), shipper=shipper).exists():
-                errors.append("미등록 상품"); error_fields.append('product_identifier')
-
-            if not order_data.get('quantity') or int(order_data.get('quantity', 0)) <= 0: errors.append("수량 오류"); error_fields.append('quantity')
-            if errors: raise ValueError(", ".join(sorted(list(set(errors)))))
-            
-            channel, _ = SalesChannel.objects.get_or_create(name=order_data['channel_name'])
-            product = Product.objects.get(Q(barcode=order_data['product_identifier']) | Q(name=order_data['product_identifier']), shipper=shipper)
-            
-            new_order = Order.objects.create(
-                order_no=order_data.get('order_no') or None, shipper=shipper, channel=channel,
-                recipient_name=order_data['recipient_name'], recipient_phone=order_data['recipient_phone'],
-                address=order_data['address'], order_date=datetime.now(), order_status='PENDING'
-            )
-            OrderItem.objects.create(order=new_order, product=product, quantity=order_data['quantity'])
-            
-            # 성공 시 원본 오류 삭제
-            try:
-                id_type, id_value = unique_id.split('-')
-                if id_type == 'db': 
-                    Order.objects.filter(id=id_value).delete()
-            except ValueError:
-                pass # ID 형식이 다르더라도 새로운 주문은 생성되었으므로 진행
-            
-            results.append({'unique_id': unique_id, 'status': 'success'})
 
-        except Exception as e:
-            # [수정] 실패 시 DB의 오류 Order를 업데이트
-            error_message = str(e)
-            results.append({ 'unique_id': unique_id, 'status': 'error', 'error_message': error_message, 'error_fields': sorted(list(set(error_fields))) })
-            
-            # DB 오류 업데이트
-            try:
-                id_type, id_value = unique_id.split('-')
-                if id_type == 'db':
-                    error_order = Order.objects.get(id=id_value, order_status='ERROR')
-                    # 오류 정보 업데이트
-                    error_order.error_message = json.dumps({
-                        'error_message': error_message,
-                        'error_fields': sorted(list(set(error_fields))),
-                        'original_data': order_data
-                    }, ensure_ascii=False)
-                    # 날짜를 현재 날짜로 업데이트
-                    error_order.order_date = datetime.now()
-                    # 수정된 수취인 정보 업데이트
-                    error_order.recipient_name = order_data.get('recipient_name', '')
-                    error_order.recipient_phone = order_data.get('recipient_phone', '')
-                    error_order.address = order_data.get('address', '')
-                    error_order.save()
-            except (Order.DoesNotExist, ValueError):
-                pass  # 이미 삭제된 경우거나 ID 형식이 잘못된 경우 무시
-            
+    results = ErrorOrderRetrier().retry(all_items_data)
     return JsonResponse({'results': results})
 
 @login_required
@@ -410,12 +468,15 @@ def order_chart_data_api(request):
     labels = [(start_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end_date - start_date).days + 1)]
     status_map = { 'PENDING': '주문접수', 'PROCESSING': '처리중', 'ERROR': '오류' }
     
-    orders = Order.objects.filter(order_date__date__range=[start_date, end_date], order_status__in=status_map.keys()).annotate(date=TruncDate('order_date')).values('date', 'order_status').annotate(count=Count('id')).order_by('date')
+    # [수정] 기간의 일자별 집계 행만 읽어 날짜/상태별로 합산 (집계가 바뀔 때까지 'dashboards' 캐시 사용)
+    stats = dashboards_cache.get_or_set(f"order_chart:{start_date}:{end_date}", lambda: list(
+        DailyOrderStat.objects.filter(order_status__in=status_map.keys(), date__range=(start_date, end_date)).values('date', 'order_status').annotate(count=Sum('order_count')).order_by('date')
+    ))
     
     daily_counts = {label: {status: 0 for status in status_map} for label in labels}
-    for order in orders:
-        date_str = order['date'].strftime('%Y-%m-%d')
-        if date_str in daily_counts: daily_counts[date_str][order['order_status']] = order['count']
+    for stat in stats:
+        date_str = stat['date'].strftime('%Y-%m-%d')
+        if date_str in daily_counts: daily_counts[date_str][stat['order_status']] = stat['count']
             
     colors = { 'PENDING': 'rgba(54, 162, 235, 0.7)', 'PROCESSING': 'rgba(255, 159, 64, 0.7)', 'ERROR': 'rgba(255, 99, 132, 0.7)' }
     datasets = []
@@ -434,8 +495,12 @@ def channel_order_chart_data_api(request):
     date_str = request.GET.get('date')
     target_date = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else date.today()
     
-    orders_for_date = Order.objects.filter(order_date__date=target_date)
-    channel_counts = SalesChannel.objects.filter(order__in=orders_for_date).annotate(order_count=Count('order')).values('name', 'order_count')
+    # [수정] 해당 일자의 집계 행만 읽어 채널별로 합산 (집계가 바뀔 때까지 'dashboards' 캐시 사용)
+    channel_counts = dashboards_cache.get_or_set(f"channel_chart:{target_date}", lambda: list(
+        DailyOrderStat.objects.filter(date=target_date, channel__isnull=False).values(
+            name=F('channel__name')
+        ).annotate(order_count=Sum('order_count')).order_by('name')
+    ))
     
     labels = [data['name'] for data in channel_counts]
     data = [data['order_count'] for data in channel_counts]
@@ -497,122 +562,174 @@ def order_cancel_view(request, order_pk):
 
 # --- 주문 엑셀 내보내기 ---
 
+EXPORT_HEADERS = [
+    '주문번호', '주문일시', '화주사', '판매채널', '주문상태',
+    '수취인', '연락처', '주소', '상품명', '바코드', '수량', '배송메모'
+]
+
+# 열 너비 (주문번호, 주문일시, 화주사, 판매채널, 주문상태, 수취인, 연락처, 주소, 상품명, 바코드, 수량, 배송메모)
+EXPORT_COLUMN_WIDTHS = [15, 17, 15, 15, 12, 12, 15, 40, 30, 15, 8, 30]
+
+# 주문 상태별 행 스타일 이름 (없으면 기본 스타일)
+EXPORT_ROW_STYLES = {
+    'CANCELED': 'export_canceled',
+    'ERROR': 'export_error',
+    'DELIVERED': 'export_delivered',
+}
+
+# 내보내기 시 DB에서 한 번에 읽어올 주문 수
+EXPORT_CHUNK_SIZE = 1000
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 가짜 버퍼 (StreamingHttpResponse용)"""
+    def write(self, value):
+        return value
+
+
+def _iter_export_rows(orders):
+    """주문 쿼리셋을 청크 단위로 읽으며 (주문 상태, 엑셀 한 행) 을 상품 단위로 반환합니다."""
+    for order in orders.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        for item in order.items.all():
+            yield order.order_status, [
+                order.order_no,
+                order.order_date.strftime('%Y-%m-%d %H:%M'),
+                order.shipper.name if order.shipper else '',
+                order.channel.name if order.channel else '',
+                order.get_order_status_display(),
+                order.recipient_name,
+                order.recipient_phone,
+                order.address,
+                item.product.name,
+                item.product.barcode,
+                item.quantity,
+                order.delivery_memo,
+            ]
+
+
+def _register_export_styles(wb):
+    """내보내기에 쓰는 공용 스타일을 이름 있는 스타일로 한 번만 등록합니다."""
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+
+    border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    header = NamedStyle(name='export_header')
+    header.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    header.font = Font(bold=True, color="FFFFFF", size=11)
+    header.alignment = Alignment(horizontal="center", vertical="center")
+    header.border = border
+    wb.add_named_style(header)
+
+    body = NamedStyle(name='export_body')
+    body.border = border
+    wb.add_named_style(body)
+
+    for status_code, color in (('CANCELED', 'FFE6E6'), ('ERROR', 'FFF4E6'), ('DELIVERED', 'E6F7E6')):
+        style = NamedStyle(name=EXPORT_ROW_STYLES[status_code])
+        style.border = border
+        style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        wb.add_named_style(style)
+
+
+def _stream_orders_csv(orders, filename):
+    import csv
+
+    writer = csv.writer(_Echo())
+
+    def rows():
+        # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM을 먼저 보냅니다.
+        yield '\ufeff' + writer.writerow(EXPORT_HEADERS)
+        for _, row in _iter_export_rows(orders):
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
+
+
+def _build_orders_xlsx(orders, filename, sheet_title):
+    """
+    주문 목록을 쓰기 전용 xlsx로 만들어 내려받게 합니다.
+    메모리 사용량은 주문 수와 관계없이 일정하지만 스트리밍은 아닙니다. xlsx는 zip 형식이라
+    마지막 행까지 임시 파일에 쓴 뒤에 전송을 시작하므로, 그동안 요청 스레드를 점유하고 첫 바이트도 늦게 도착합니다.
+    주문이 아주 많으면 바로 전송이 시작되는 CSV(format=csv)를 사용하세요.
+    """
+    import tempfile
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    # 쓰기 전용 워크북은 행을 추가하는 즉시 임시 파일로 내보내므로 주문 수와 관계없이 메모리 사용량이 일정합니다.
+    wb = openpyxl.Workbook(write_only=True)
+    _register_export_styles(wb)
+    ws = wb.create_sheet(title=sheet_title)
+
+    for col_num, width in enumerate(EXPORT_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+    def styled_row(values, style_name):
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style_name
+            cells.append(cell)
+        return cells
+
+    ws.append(styled_row(EXPORT_HEADERS, 'export_header'))
+
+    has_rows = False
+    for order_status, row in _iter_export_rows(orders):
+        ws.append(styled_row(row, EXPORT_ROW_STYLES.get(order_status, 'export_body')))
+        has_rows = True
+
+    # 주문이 없는 경우
+    if not has_rows:
+        ws.append(["데이터가 없습니다."])
+
+    # 완성된 파일을 임시 파일에 저장한 뒤 조금씩 읽어서 전송합니다. (전송이 끝나면 임시 파일은 삭제됨)
+    tmp = tempfile.TemporaryFile(suffix='.xlsx')
+    wb.save(tmp)
+    tmp.seek(0)
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename=filename,
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    )
+
+
 @login_required
 def order_export_excel_view(request):
     """
     주문 목록 엑셀 다운로드
+
+    GET 파라미터:
+    - date: 날짜 (YYYY-MM-DD, 기본: 오늘)
+    - format: 'xlsx'(기본) 또는 'csv'
+    두 형식 모두 주문을 청크 단위로 읽으므로 주문량이 많아도 메모리 사용량이 일정합니다.
+    CSV는 읽는 즉시 스트리밍으로 전송하고, xlsx는 임시 파일을 완성한 뒤에 전송합니다.
     """
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    
     date_str = request.GET.get('date')
     selected_date = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else date.today()
+    export_format = request.GET.get('format', 'xlsx')
     
     # 해당 날짜의 주문 조회
     orders = Order.objects.filter(
-        order_date__date=selected_date
+        **_order_date_range(selected_date)
     ).select_related('shipper', 'channel').prefetch_related('items__product').order_by('id')
     
-    # 엑셀 생성
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = f"주문목록_{selected_date.strftime('%Y%m%d')}"
-    
-    # 스타일 정의
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # 헤더 작성
-    headers = [
-        '주문번호', '주문일시', '화주사', '판매채널', '주문상태',
-        '수취인', '연락처', '주소', '상품명', '바코드', '수량', '배송메모'
-    ]
-    
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-        cell.border = border
-    
-    # 데이터 작성
-    row_num = 2
-    for order in orders:
-        # 주문 상태에 따른 색상
-        if order.order_status == 'CANCELED':
-            row_fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-        elif order.order_status == 'ERROR':
-            row_fill = PatternFill(start_color="FFF4E6", end_color="FFF4E6", fill_type="solid")
-        elif order.order_status == 'DELIVERED':
-            row_fill = PatternFill(start_color="E6F7E6", end_color="E6F7E6", fill_type="solid")
-        else:
-            row_fill = None
-        
-        for item in order.items.all():
-            ws.cell(row=row_num, column=1, value=order.order_no)
-            ws.cell(row=row_num, column=2, value=order.order_date.strftime('%Y-%m-%d %H:%M'))
-            ws.cell(row=row_num, column=3, value=order.shipper.name if order.shipper else '')
-            ws.cell(row=row_num, column=4, value=order.channel.name if order.channel else '')
-            ws.cell(row=row_num, column=5, value=order.get_order_status_display())
-            ws.cell(row=row_num, column=6, value=order.recipient_name)
-            ws.cell(row=row_num, column=7, value=order.recipient_phone)
-            ws.cell(row=row_num, column=8, value=order.address)
-            ws.cell(row=row_num, column=9, value=item.product.name)
-            ws.cell(row=row_num, column=10, value=item.product.barcode)
-            ws.cell(row=row_num, column=11, value=item.quantity)
-            ws.cell(row=row_num, column=12, value=order.delivery_memo)
-            
-            # 테두리 및 색상 적용
-            for col_num in range(1, 13):
-                cell = ws.cell(row=row_num, column=col_num)
-                cell.border = border
-                if row_fill:
-                    cell.fill = row_fill
-            
-            row_num += 1
-    
-    # 주문이 없는 경우
-    if row_num == 2:
-        ws.cell(row=2, column=1, value="데이터가 없습니다.")
-        ws.merge_cells(start_row=2, start_column=1, end_row=2, end_column=12)
-        cell = ws.cell(row=2, column=1)
-        cell.alignment = Alignment(horizontal="center")
-    
-    # 열 너비 자동 조정
-    column_widths = {
-        'A': 15,  # 주문번호
-        'B': 17,  # 주문일시
-        'C': 15,  # 화주사
-        'D': 15,  # 판매채널
-        'E': 12,  # 주문상태
-        'F': 12,  # 수취인
-        'G': 15,  # 연락처
-        'H': 40,  # 주소
-        'I': 30,  # 상품명
-        'J': 15,  # 바코드
-        'K': 8,   # 수량
-        'L': 30,  # 배송메모
-    }
-    
-    for col_letter, width in column_widths.items():
-        ws.column_dimensions[col_letter].width = width
+    if export_format == 'csv':
+        return _stream_orders_csv(orders, f'orders_{selected_date.strftime("%Y%m%d")}.csv')
     
-    # HTTP 응답 생성
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    return _build_orders_xlsx(
+        orders,
+        f'orders_{selected_date.strftime("%Y%m%d")}.xlsx',
+        f"주문목록_{selected_date.strftime('%Y%m%d')}"
     )
-    filename = f'orders_{selected_date.strftime("%Y%m%d")}.xlsx'
-    response['Content-Disposition'] = f'attachment; filename={filename}'
-    
-    wb.save(response)
-    return response
 
 
 # --- 송장 출력 기능 ---
@@ -811,8 +928,8 @@ def cancel_all_errors_api(request):
                 'message': '취소할 오류 주문이 없습니다.'
             })
         
-        # 모든 오류 주문 삭제
-        error_orders.delete()
+        # 모든 오류 주문 삭제 (집계에서도 한 번에 뺌)
+        DailyOrderStat.delete_orders(error_orders)
         
         return JsonResponse({
             'status': 'success',
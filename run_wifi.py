@@ -1,8 +1,16 @@
 import os
 import sys
 import socket
-import threading
-import time
+import subprocess
+import importlib.util
+
+# [수정] 개발 서버(runserver) 대신 여러 요청을 동시에 처리하는 운영용 WSGI 서버로 실행합니다.
+#   Linux/Mac: gunicorn (설정: gunicorn.conf.py)
+#   Windows:   waitress (gunicorn은 Windows를 지원하지 않음)
+#   둘 다 없거나 --dev 옵션: 기존처럼 runserver (코드 수정 시 자동 재시작)
+PORT = os.environ.get('WMS_PORT', '8000')
+WAITRESS_THREADS = int(os.environ.get('WMS_THREADS', '8'))
+
 
 def get_ip_address():
     try:
@@ -15,30 +23,83 @@ def get_ip_address():
     except:
         return "127.0.0.1"
 
+
+def has_package(name):
+    return importlib.util.find_spec(name) is not None
+
+
+def collect_static():
+    # whitenoise는 STATIC_ROOT에 모인 파일만 바로 응답하므로 실행 전에 최신 정적 파일을 모읍니다.
+    subprocess.run([sys.executable, "manage.py", "collectstatic", "--noinput", "-v", "0"], check=True)
+
+
+def run_gunicorn():
+    # 스케줄러는 gunicorn.conf.py의 훅에서 워커 하나에만 시작됩니다.
+    subprocess.run([sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"])
+
+
+def run_waitress():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "wms_project.settings")
+    from waitress import serve
+    from wms_project.wsgi import application
+    from orders.scheduler import start_scheduler, stop_scheduler
+
+    # runserver가 아니면 OrdersConfig.ready()에서 스케줄러를 시작하지 않으므로 여기서 시작합니다.
+    start_scheduler()
+    try:
+        serve(application, host="0.0.0.0", port=int(PORT), threads=WAITRESS_THREADS)
+    finally:
+        stop_scheduler()
+
+
 def run_django():
     # 0.0.0.0으로 실행하여 외부 접속 허용
-    os.system(f"{sys.executable} manage.py runserver 0.0.0.0:8000")
+    os.system(f"{sys.executable} manage.py runserver 0.0.0.0:{PORT}")
+
+
+def choose_server():
+    if "--dev" in sys.argv:
+        return "runserver"
+    if os.name != "nt" and has_package("gunicorn"):
+        return "gunicorn"
+    if has_package("waitress"):
+        return "waitress"
+    return "runserver"
+
 
 if __name__ == "__main__":
     ip = get_ip_address()
     hostname = socket.gethostname()
-    
+    server = choose_server()
+
     print("\n" + "="*60)
     print("📢 WMS 서버를 시작합니다 (WiFi 접속 모드)")
     print("="*60)
     print(f"\n[접속 주소 안내]")
     print(f"1. 컴퓨터(PC)에서 접속할 때:")
-    print(f"   👉 http://localhost:8000")
+    print(f"   👉 http://localhost:{PORT}")
     print(f"\n2. 핸드폰(같은 와이파이)에서 접속할 때:")
-    print(f"   👉 http://{ip}:8000")
-    print(f"   (또는 http://{hostname}:8000 시도)")
-    
+    print(f"   👉 http://{ip}:{PORT}")
+    print(f"   (또는 http://{hostname}:{PORT} 시도)")
+
     print(f"\n[참고] 와이파이 IP({ip})는 바뀔 수 있지만,")
     print(f"       이 파일을 실행하면 항상 현재 IP를 알려드립니다.")
+    print(f"\n[서버] {server}")
+    if server == "runserver" and "--dev" not in sys.argv:
+        print("⚠️  gunicorn(Linux/Mac) 또는 waitress(Windows)가 설치되어 있지 않아 개발 서버로 실행합니다.")
+        print("    여러 사람이 함께 쓸 때는 'pip install gunicorn' 또는 'pip install waitress'를 권장합니다.")
     print("\n" + "="*60 + "\n")
 
     # 서버 실행
     try:
-        run_django()
+        if server == "runserver":
+            run_django()
+        else:
+            if has_package("whitenoise"):
+                collect_static()
+            if server == "gunicorn":
+                run_gunicorn()
+            else:
+                run_waitress()
     except KeyboardInterrupt:
         pass
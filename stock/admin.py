@@ -1,5 +1,29 @@
 # stock/admin.py
 from django.contrib import admin
+from django.db import transaction
 
 # 이 파일은 비워두거나, 아래 모델들을 core/admin.py에 등록하기 위한
-# 기본 설정만 남겨둡니다. WarehouseLayoutAdmin 클래스는 더 이상 필요 없습니다.
\ No newline at end of file
+# 기본 설정만 남겨둡니다. WarehouseLayoutAdmin 클래스는 더 이상 필요 없습니다.
+
+
+class StockMovementAdmin(admin.ModelAdmin):
+    """
+    [추가] 입출고 기록 관리자 설정
+    수량/위치 등 현재고에 영향을 주는 항목은 등록 후 고칠 수 없고(반대 입출고로 정정), 메모/박스 크기만 고칩니다.
+    삭제는 건별로 StockMovement.delete()를 거쳐 현재고(StockBalance)에서도 되돌립니다.
+    """
+    list_display = ('timestamp', 'movement_type', 'product', 'location', 'floor', 'quantity', 'memo')
+    list_filter = ('movement_type',)
+    search_fields = ('product__name', 'product__barcode', 'memo')
+    raw_id_fields = ('product', 'location')
+    list_select_related = ('product', 'location', 'location__center')
+    ledger_fields = ('product', 'location', 'movement_type', 'quantity', 'floor')
+
+    def get_readonly_fields(self, request, obj=None):
+        return self.ledger_fields if obj is not None else ()
+
+    def delete_queryset(self, request, queryset):
+        # 목록의 '선택 삭제'는 QuerySet.delete()를 쓰므로 건별로 삭제하여 현재고를 되돌립니다.
+        with transaction.atomic():
+            for movement in queryset:
+                movement.delete()
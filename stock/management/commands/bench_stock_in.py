@@ -0,0 +1,125 @@
+"""
+Django Management Command: 동시 입고 처리량 벤치마크
+
+사용법:
+    python manage.py bench_stock_in                          # 8개 스레드 x 200건
+    python manage.py bench_stock_in --workers 16 --per-worker 500 --products 3
+    WMS_DB_ENGINE=postgres python manage.py bench_stock_in   # PostgreSQL 설정으로 같은 부하 비교
+
+설명:
+    입고 화면(stock_in_view)과 같은 트랜잭션(현재고 조회 -> 상품 수량 UPDATE -> 입출고 기록/현재고 반영)을
+    여러 스레드에서 동시에 실행하여 초당 처리 건수와 잠금 오류 수를 측정합니다.
+    스레드마다 별도의 DB 연결을 쓰므로 현재 DATABASES 설정(WMS_DB_ENGINE)의 동시 쓰기 성능을 비교할 수 있습니다.
+    벤치마크용 센터/화주사/상품/위치를 만들어 사용하고, 끝나면 모두 삭제합니다. (--keep 으로 남길 수 있음)
+"""
+
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, connections, transaction
+from django.db.models import F, Sum
+
+from management.models import Center, Product, Shipper
+from stock.models import Location, StockBalance, StockMovement
+
+
+class Command(BaseCommand):
+    help = '여러 스레드에서 동시에 입고를 처리하여 현재 DB 설정의 쓰기 처리량을 측정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='동시에 입고를 처리할 스레드 수 (기본 8)')
+        parser.add_argument('--per-worker', type=int, default=200, help='스레드마다 처리할 입고 건수 (기본 200)')
+        parser.add_argument('--products', type=int, default=5, help='입고할 상품 수. 적을수록 같은 행을 두고 경합합니다. (기본 5)')
+        parser.add_argument('--keep', action='store_true', help='벤치마크 데이터를 삭제하지 않고 남깁니다.')
+
+    def handle(self, *args, **options):
+        self._describe_database()
+        tag = uuid.uuid4().hex[:8]
+        center = Center.objects.create(name=f'BENCH-{tag}', address='벤치마크')
+        try:
+            shipper = Shipper.objects.create(center=center, name=f'BENCH-{tag}')
+            products = [
+                Product.objects.create(shipper=shipper, name=f'벤치상품{i}', barcode=f'BENCH-{tag}-{i}')
+                for i in range(options['products'])
+            ]
+            location = Location.objects.create(center=center, zone='BENCH', name=f'BENCH-{tag}', max_floor=3)
+            self._run(products, location, options)
+        finally:
+            if not options['keep']:
+                center.delete()  # 화주사/상품/위치/입출고 기록/현재고는 함께 삭제됩니다.
+
+    def _describe_database(self):
+        vendor = connection.vendor
+        detail = ''
+        if vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode')
+                journal_mode = cursor.fetchone()[0]
+                cursor.execute('PRAGMA synchronous')
+                synchronous = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}.get(cursor.fetchone()[0])
+            options = connection.settings_dict.get('OPTIONS', {})
+            detail = (f"journal_mode={journal_mode}, synchronous={synchronous}, "
+                      f"transaction_mode={options.get('transaction_mode', 'DEFERRED')}, timeout={options.get('timeout', 5)}초")
+        elif vendor == 'postgresql':
+            detail = f"CONN_MAX_AGE={connection.settings_dict.get('CONN_MAX_AGE')}"
+        self.stdout.write(f"DB: {vendor} ({detail})")
+
+    def _run(self, products, location, options):
+        workers, per_worker = options['workers'], options['per_worker']
+        results = [None] * workers
+        start_barrier = threading.Barrier(workers)
+
+        def worker(index):
+            done, errors = 0, 0
+            start_barrier.wait()
+            try:
+                for i in range(per_worker):
+                    product = products[(index + i) % len(products)]
+                    try:
+                        self._stock_in(product, location, floor=i % location.max_floor + 1)
+                        done += 1
+                    except OperationalError:
+                        # SQLite 'database is locked' 등 잠금 대기 시간 초과
+                        errors += 1
+            finally:
+                connections.close_all()
+                results[index] = (done, errors)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        done = sum(r[0] for r in results)
+        errors = sum(r[1] for r in results)
+        # 성공한 입고는 상품 수량/입출고 기록/현재고에 모두 같은 수량으로 반영되어야 합니다.
+        product_total = Product.objects.filter(pk__in=[p.pk for p in products]).aggregate(total=Sum('quantity'))['total'] or 0
+        balance_total = StockBalance.objects.filter(location=location).aggregate(total=Sum('quantity'))['total'] or 0
+        movement_count = StockMovement.objects.filter(location=location).count()
+        consistent = product_total == balance_total == movement_count == done
+
+        self.stdout.write(
+            f"스레드 {workers}개 x {per_worker}건: 성공 {done}건, 잠금 오류 {errors}건, "
+            f"{elapsed:.2f}초 ({done / elapsed:.1f}건/초)"
+        )
+        if consistent:
+            self.stdout.write(self.style.SUCCESS(f'✅ 상품 수량/현재고/입출고 기록이 성공 건수({done})와 일치합니다.'))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'✋ 불일치: 상품 수량 {product_total}, 현재고 {balance_total}, 입출고 기록 {movement_count}, 성공 {done}'
+            ))
+
+    @staticmethod
+    @transaction.atomic
+    def _stock_in(product, location, floor):
+        """입고 화면과 같은 순서: 위치 현재고 조회 후 상품 수량 증가, 입출고 기록(현재고 반영) 생성"""
+        list(StockBalance.objects.filter(location=location, quantity__gt=0).values_list('product_id', 'quantity'))
+        Product.objects.filter(pk=product.pk).update(quantity=F('quantity') + 1)
+        StockMovement.objects.create(
+            product=product, location=location, movement_type='IN', quantity=1, floor=floor, memo='벤치마크 입고'
+        )
@@ -0,0 +1,58 @@
+"""
+Django Management Command: 위치별 현재고(StockBalance) 재계산 / 검증
+
+사용법:
+    python manage.py rebuild_stock_balance           # 원장을 다시 합산하여 현재고 테이블 재작성
+    python manage.py rebuild_stock_balance --verify  # 재작성하지 않고 불일치만 보고
+
+설명:
+    StockMovement 원장 전체를 (입고 - 출고)로 다시 합산하여 StockBalance와 비교합니다.
+    관리자 페이지에서 입출고 기록을 직접 수정/삭제했거나 위치를 삭제한 경우 이 명령으로 맞춰줍니다.
+"""
+
+from django.core.management.base import BaseCommand
+
+from stock.models import StockBalance
+
+
+class Command(BaseCommand):
+    help = '입출고 원장을 다시 합산하여 위치별 현재고(StockBalance)를 재작성하거나 검증합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='현재고 테이블을 수정하지 않고 원장과 다른 항목만 출력합니다.',
+        )
+
+    def handle(self, *args, **options):
+        if not options['verify']:
+            count = StockBalance.rebuild()
+            self.stdout.write(self.style.SUCCESS(f'✅ 현재고 재작성 완료: {count}개 (상품/위치/층) 항목'))
+            return
+
+        expected = {key: qty for key, qty in StockBalance.ledger_totals().items() if qty}
+        actual = {
+            (product_id, location_id, floor): quantity
+            for product_id, location_id, floor, quantity in StockBalance.objects.exclude(quantity=0).values_list(
+                'product_id', 'location_id', 'floor', 'quantity'
+            )
+        }
+
+        mismatches = sorted(
+            ((key, expected.get(key, 0), actual.get(key, 0))
+             for key in expected.keys() | actual.keys()
+             if expected.get(key, 0) != actual.get(key, 0)),
+            key=lambda mismatch: (mismatch[0][0], mismatch[0][1] or 0, mismatch[0][2])
+        )
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS(f'✅ 현재고가 원장과 일치합니다. ({len(expected)}개 항목)'))
+            return
+
+        for (product_id, location_id, floor), ledger_qty, balance_qty in mismatches:
+            self.stdout.write(
+                f'상품 {product_id} / 위치 {location_id or "-"} / {floor}층: 원장 {ledger_qty}개, 현재고 {balance_qty}개'
+            )
+        self.stdout.write(self.style.WARNING(
+            f'✋ 불일치 {len(mismatches)}건. `python manage.py rebuild_stock_balance`로 재작성하세요.'
+        ))
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Case, F, IntegerField, Sum, When
+
+
+def populate_stock_balance(apps, schema_editor):
+    """기존 입출고 원장을 합산하여 위치별 현재고를 채웁니다."""
+    StockMovement = apps.get_model('stock', 'StockMovement')
+    StockBalance = apps.get_model('stock', 'StockBalance')
+
+    rows = StockMovement.objects.values('product_id', 'location_id', 'floor').annotate(
+        total_quantity=Sum(
+            Case(
+                When(movement_type='IN', then=F('quantity')),
+                When(movement_type='OUT', then=-F('quantity')),
+                default=0,
+                output_field=IntegerField()
+            )
+        )
+    ).order_by()
+    StockBalance.objects.bulk_create([
+        StockBalance(
+            product_id=row['product_id'],
+            location_id=row['location_id'],
+            floor=row['floor'],
+            quantity=row['total_quantity'],
+        )
+        for row in rows
+        if row['total_quantity']
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('management', '0005_expand_shopping_mall_channels'),
+        ('stock', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('floor', models.PositiveIntegerField(default=1, verbose_name='층')),
+                ('quantity', models.IntegerField(default=0, verbose_name='현재고')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('location', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='stock_balances', to='stock.location', verbose_name='위치')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_balances', to='management.product', verbose_name='상품')),
+            ],
+            options={
+                'verbose_name': '위치별 현재고',
+                'verbose_name_plural': '위치별 현재고',
+                'constraints': [models.UniqueConstraint(fields=('product', 'location', 'floor'), name='unique_stock_balance'), models.UniqueConstraint(condition=models.Q(('location__isnull', True)), fields=('product', 'floor'), name='unique_stock_balance_without_location')],
+            },
+        ),
+        migrations.RunPython(populate_stock_balance, migrations.RunPython.noop),
+    ]
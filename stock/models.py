@@ -1,5 +1,8 @@
 # stock/models.py
-from django.db import models
+from collections import defaultdict
+from django.db import models, transaction, IntegrityError
+from django.db.models import F, Q, Sum, Case, When, IntegerField
+from core.cache import bump_on_commit, stock_cache
 from management.models import Center
 
 # [삭제] 기존 WarehouseLayout 모델은 더 이상 사용하지 않으므로 삭제합니다.
@@ -61,4 +64,145 @@ class StockMovement(models.Model):
         verbose_name_plural = '재고 이동 기록'
         
     def __str__(self):
-        return f'[{self.get_movement_type_display()}] {self.product.name} - {self.quantity}개 ({self.timestamp})'
\ No newline at end of file
+        return f'[{self.get_movement_type_display()}] {self.product.name} - {self.quantity}개 ({self.timestamp})'
+
+    def save(self, *args, **kwargs):
+        # 새 입출고 기록은 같은 트랜잭션 안에서 현재고(StockBalance)에도 반영합니다.
+        # [수정] 기존 기록을 고치면(관리자 화면 등) 고치기 전 기록을 되돌리고 새 기록을 반영합니다.
+        with transaction.atomic():
+            previous = None
+            if not self._state.adding:
+                previous = StockMovement.objects.select_for_update().filter(pk=self.pk).first()
+            super().save(*args, **kwargs)
+            StockBalance.apply_movements([self], reversed_movements=[previous] if previous else [])
+
+    def delete(self, *args, **kwargs):
+        # [추가] 기록을 삭제하면 현재고에서도 되돌립니다. (QuerySet.delete()는 이 메서드를 거치지 않음)
+        with transaction.atomic():
+            StockBalance.apply_movements([], reversed_movements=[self])
+            return super().delete(*args, **kwargs)
+
+
+class InsufficientStockError(Exception):
+    """
+    위치별 현재고보다 많은 수량을 출고하려 할 때 발생하는 예외
+    """
+    def __init__(self, available, requested):
+        self.available = available
+        self.requested = requested
+        super().__init__(f"재고 부족! 현재고: {available}개, 요청: {requested}개")
+
+
+class StockBalance(models.Model):
+    """
+    상품/위치/층별 현재고를 미리 계산해 두는 모델
+    StockMovement 원장의 (입고 - 출고) 합계와 항상 같도록 입출고 기록을 저장/수정/삭제할 때 함께 갱신됩니다.
+    (QuerySet.update()/delete()로 원장을 직접 바꾼 경우에는 rebuild_stock_balance 명령으로 다시 맞춥니다.)
+    위치 없이 기록된 입출고(주문 출고, 주문 취소 복구 등)는 location이 비어 있는 행에 합산됩니다.
+    위치가 지정된 출고는 현재고를 넘을 수 없으며, 넘으면 InsufficientStockError가 발생합니다.
+    """
+    product = models.ForeignKey('management.Product', on_delete=models.CASCADE, related_name='stock_balances', verbose_name='상품')
+    location = models.ForeignKey(Location, on_delete=models.CASCADE, null=True, blank=True, related_name='stock_balances', verbose_name='위치')
+    floor = models.PositiveIntegerField(default=1, verbose_name='층')
+    quantity = models.IntegerField(default=0, verbose_name='현재고')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '위치별 현재고'
+        verbose_name_plural = '위치별 현재고'
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'location', 'floor'], name='unique_stock_balance'),
+            # NULL은 서로 다른 값으로 취급되므로 위치가 없는 행은 별도의 조건부 제약으로 중복을 막습니다.
+            models.UniqueConstraint(fields=['product', 'floor'], condition=Q(location__isnull=True), name='unique_stock_balance_without_location'),
+        ]
+
+    def __str__(self):
+        return f'{self.product} @ {self.location or "위치 없음"} {self.floor}층: {self.quantity}개'
+
+    @staticmethod
+    def _key(product_id, location_id, floor):
+        # [수정] 0층도 그대로 구분합니다. (저장 전이라 층이 비어 있을 때만 모델 기본값 1층)
+        return (product_id, location_id, 1 if floor is None else int(floor))
+
+    @classmethod
+    def apply_movements(cls, movements, reversed_movements=()):
+        """
+        입출고 기록들의 수량 변화를 현재고에 반영합니다.
+        같은 (상품, 위치, 층)의 변화량은 합산하여 키마다 UPDATE 한 번으로 처리합니다.
+
+        Args:
+            reversed_movements: [추가] 되돌릴 기록 (수정 전 기록, 삭제한 기록)
+        """
+        deltas = defaultdict(int)
+        for group, direction in ((movements, 1), (reversed_movements, -1)):
+            for movement in group:
+                sign = 1 if movement.movement_type == 'IN' else -1
+                deltas[cls._key(movement.product_id, movement.location_id, movement.floor)] += direction * sign * movement.quantity
+
+        with transaction.atomic():
+            for (product_id, location_id, floor), delta in deltas.items():
+                if delta:
+                    cls._apply_delta(product_id, location_id, floor, delta)
+            # 현재고/입출고로 만든 재고 차트 캐시 무효화
+            bump_on_commit(stock_cache)
+
+    @classmethod
+    def _apply_delta(cls, product_id, location_id, floor, delta):
+        balances = cls.objects.filter(product_id=product_id, location_id=location_id, floor=floor)
+        if delta < 0 and location_id is not None:
+            # 위치가 지정된 출고는 현재고가 충분할 때만 차감합니다.
+            # 조건부 UPDATE 한 문장이라 동시에 출고해도 해당 행만 잠기고 재고가 음수가 되지 않습니다.
+            if not balances.filter(quantity__gte=-delta).update(quantity=F('quantity') + delta):
+                available = balances.values_list('quantity', flat=True).first() or 0
+                raise InsufficientStockError(available=available, requested=-delta)
+            return
+        if balances.update(quantity=F('quantity') + delta):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(product_id=product_id, location_id=location_id, floor=floor, quantity=delta)
+        except IntegrityError:
+            # 다른 요청이 먼저 행을 만든 경우에는 그 행에 반영합니다.
+            balances.update(quantity=F('quantity') + delta)
+
+    @classmethod
+    def ledger_totals(cls, product_ids=None):
+        """
+        StockMovement 원장 전체를 다시 합산하여 {(상품, 위치, 층): 현재고}를 반환합니다.
+        """
+        movements = StockMovement.objects.all()
+        if product_ids is not None:
+            movements = movements.filter(product_id__in=product_ids)
+        rows = movements.values('product_id', 'location_id', 'floor').annotate(
+            total_quantity=Sum(
+                Case(
+                    When(movement_type='IN', then=F('quantity')),
+                    When(movement_type='OUT', then=-F('quantity')),
+                    default=0,
+                    output_field=IntegerField()
+                )
+            )
+        ).order_by()
+        totals = defaultdict(int)
+        for row in rows:
+            totals[cls._key(row['product_id'], row['location_id'], row['floor'])] += row['total_quantity'] or 0
+        return dict(totals)
+
+    @classmethod
+    def rebuild(cls, product_ids=None):
+        """
+        원장을 다시 합산하여 현재고 테이블을 재작성합니다. (product_ids가 있으면 해당 상품만)
+        """
+        totals = cls.ledger_totals(product_ids)
+        with transaction.atomic():
+            balances = cls.objects.all()
+            if product_ids is not None:
+                balances = balances.filter(product_id__in=product_ids)
+            balances.delete()
+            cls.objects.bulk_create([
+                cls(product_id=product_id, location_id=location_id, floor=floor, quantity=quantity)
+                for (product_id, location_id, floor), quantity in totals.items()
+                if quantity
+            ], batch_size=500)
+            bump_on_commit(stock_cache)
+        return len(totals)
\ No newline at end of file
@@ -0,0 +1,144 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from management.models import Center, Shipper, Product
+from users.models import User
+from .models import InsufficientStockError, Location, StockBalance, StockMovement
+
+
+class StockOutGuardTests(TestCase):
+    """
+    위치 출고: 먼저 확인한 재고가 다른 작업자의 출고로 줄었더라도 현재고를 넘겨 출고되지 않습니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='출고센터', address='주소')
+        shipper = Shipper.objects.create(center=center, name='출고화주')
+        cls.user = User.objects.create_superuser('picker', 'picker@example.com', 'pw')
+        cls.location = Location.objects.create(center=center, zone='A구역', name='A-01', max_floor=2)
+        cls.product = Product.objects.create(shipper=shipper, name='출고상품', barcode='OUT-1', quantity=5)
+        StockMovement.objects.create(product=cls.product, location=cls.location, floor=2, movement_type='IN', quantity=5)
+
+    def _balance(self):
+        return StockBalance.objects.get(product=self.product, location=self.location, floor=2).quantity
+
+    def _ship(self, quantity):
+        with transaction.atomic():
+            StockMovement.objects.create(product=self.product, location=self.location, floor=2, movement_type='OUT', quantity=quantity)
+
+    def test_second_picker_cannot_ship_stock_already_taken(self):
+        # 두 작업자 모두 현재고 5개를 보고 3개씩 출고하는 상황
+        self._ship(3)
+        with self.assertRaises(InsufficientStockError):
+            self._ship(3)
+
+        self.assertEqual(self._balance(), 2)
+        self.assertEqual(StockMovement.objects.filter(movement_type='OUT').count(), 1)
+        self.assertEqual(StockBalance.ledger_totals([self.product.pk]), {(self.product.pk, self.location.pk, 2): 2})
+
+    def test_stock_out_view_rejects_quantity_over_balance(self):
+        self.client.force_login(self.user)
+        url = reverse('stock:out_bound')
+        data = {'location': self.location.pk, 'floor': 2, 'product': self.product.pk, 'memo': ''}
+
+        self.assertRedirects(self.client.post(url, {**data, 'quantity': 4}), url, fetch_redirect_response=False)
+        response = self.client.post(url, {**data, 'quantity': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('재고 부족', ' '.join(str(message) for message in response.context['messages']))
+        self.assertEqual(self._balance(), 1)
+        self.assertEqual(Product.objects.get(pk=self.product.pk).quantity, 1)
+
+
+class StockBalanceLedgerTests(TestCase):
+    """
+    입출고 기록을 수정/삭제하거나 위치를 삭제해도 현재고(StockBalance)가 원장 합계와 같게 유지됩니다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        center = Center.objects.create(name='원장센터', address='주소')
+        shipper = Shipper.objects.create(center=center, name='원장화주')
+        cls.user = User.objects.create_superuser('keeper', 'keeper@example.com', 'pw')
+        cls.location = Location.objects.create(center=center, zone='B구역', name='B-01', max_floor=3)
+        cls.other_location = Location.objects.create(center=center, zone='B구역', name='B-02', max_floor=3)
+        cls.product = Product.objects.create(shipper=shipper, name='원장상품', barcode='LEDGER-1', quantity=0)
+
+    def _move(self, movement_type, quantity, location=None, floor=1):
+        return StockMovement.objects.create(
+            product=self.product, location=location or self.location, floor=floor,
+            movement_type=movement_type, quantity=quantity,
+        )
+
+    def _balances(self):
+        return {
+            (product_id, location_id, floor): quantity
+            for product_id, location_id, floor, quantity in StockBalance.objects.exclude(quantity=0).values_list(
+                'product_id', 'location_id', 'floor', 'quantity'
+            )
+        }
+
+    def _ledger(self):
+        return {key: quantity for key, quantity in StockBalance.ledger_totals().items() if quantity}
+
+    def test_edited_and_deleted_movements_keep_balance_in_sync(self):
+        inbound = self._move('IN', 10)
+        outbound = self._move('OUT', 4)
+
+        # 이미 출고된 재고를 다른 층으로 옮기는 수정은 예전 층 현재고가 부족해 거부되고 원장도 그대로입니다.
+        inbound.quantity, inbound.floor = 7, 2
+        with self.assertRaises(InsufficientStockError):
+            inbound.save()
+        self.assertEqual(self._balances(), self._ledger())
+
+        inbound.refresh_from_db()
+        inbound.quantity = 7
+        inbound.save()
+        self.assertEqual(self._balances(), {(self.product.pk, self.location.pk, 1): 3})
+        self.assertEqual(self._balances(), self._ledger())
+
+        outbound.delete()
+        self.assertEqual(self._balances(), {(self.product.pk, self.location.pk, 1): 7})
+        self.assertEqual(self._balances(), self._ledger())
+
+        self._move('IN', 5, location=self.other_location, floor=3).delete()
+        self.assertEqual(self._balances(), self._ledger())
+
+    def test_verify_reports_drift_and_rebuild_fixes_it(self):
+        self._move('IN', 6)
+        self._move('OUT', 2)
+        # QuerySet.update()는 save()를 거치지 않으므로 현재고와 원장이 어긋납니다.
+        StockMovement.objects.filter(movement_type='IN').update(quantity=9)
+
+        out = StringIO()
+        call_command('rebuild_stock_balance', '--verify', stdout=out)
+        self.assertIn('원장 7개, 현재고 4개', out.getvalue())
+        self.assertIn('불일치 1건', out.getvalue())
+        self.assertEqual(self._balances(), {(self.product.pk, self.location.pk, 1): 4})
+
+        call_command('rebuild_stock_balance', stdout=StringIO())
+        self.assertEqual(self._balances(), {(self.product.pk, self.location.pk, 1): 7})
+
+        out = StringIO()
+        call_command('rebuild_stock_balance', '--verify', stdout=out)
+        self.assertIn('현재고가 원장과 일치합니다', out.getvalue())
+
+    def test_location_delete_moves_balance_to_no_location(self):
+        self._move('IN', 5)
+        self._move('IN', 2, location=self.other_location)
+        self._move('OUT', 1)
+
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('stock:location_delete', args=[self.location.pk]))
+
+        self.assertRedirects(response, reverse('stock:location_manage'), fetch_redirect_response=False)
+        self.assertEqual(self._balances(), {
+            (self.product.pk, None, 1): 4,
+            (self.product.pk, self.other_location.pk, 1): 2,
+        })
+        self.assertEqual(self._balances(), self._ledger())
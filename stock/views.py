@@ -1,7 +1,7 @@
 # stock/views.py
 from django.shortcuts import render, redirect, get_object_or_404
 from django.db import transaction
-from django.db.models import F, Sum, Count, Q, Case, When, IntegerField
+from django.db.models import F, Sum
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
@@ -9,10 +9,28 @@ from django.contrib import messages
 from datetime import datetime, date, timedelta
 from collections import defaultdict
 
+from core.cache import stock_cache
 from management.models import Product, Center
-from .models import StockMovement, Location
+from .models import StockMovement, StockBalance, InsufficientStockError, Location
 from .forms import StockInForm, StockUpdateForm, LocationForm
 
+
+def _stocks_by_location(locations):
+    """
+    위치 목록의 현재고를 {위치 id: {층: {상품명: 수량}}} 형태로 반환합니다.
+    """
+    stock_data = StockBalance.objects.filter(
+        location__in=locations,
+        quantity__gt=0
+    ).values_list('location_id', 'floor', 'product__name', 'quantity')
+
+    stocks_by_location = defaultdict(lambda: defaultdict(dict))
+    for location_id, floor, product_name, quantity in stock_data:
+        floor_stock = stocks_by_location[location_id][floor]
+        floor_stock[product_name] = floor_stock.get(product_name, 0) + quantity
+    return stocks_by_location
+
+
 @login_required
 @transaction.atomic
 def stock_in_view(request):
@@ -30,24 +48,7 @@ def stock_in_view(request):
             locations = Location.objects.filter(center=center).order_by('name')
             
             if locations.exists():
-                stock_data = StockMovement.objects.filter(
-                    location__in=locations
-                ).values(
-                    'location_id', 'floor', 'product__name'
-                ).annotate(
-                    total_quantity=Sum(
-                        Case(
-                            When(movement_type='IN', then=F('quantity')),
-                            When(movement_type='OUT', then=-F('quantity')),
-                            default=0,
-                            output_field=IntegerField()
-                        )
-                    )
-                ).filter(total_quantity__gt=0)
-                
-                stocks_by_location = defaultdict(lambda: defaultdict(dict))
-                for stock in stock_data:
-                    stocks_by_location[stock['location_id']][stock['floor']][stock['product__name']] = stock['total_quantity']
+                stocks_by_location = _stocks_by_location(locations)
 
                 for loc in locations:
                     floors_status = []
@@ -133,25 +134,8 @@ def stock_out_view(request):
             locations = Location.objects.filter(center=center).order_by('name')
             
             if locations.exists():
-                # [수정] 현재고(입고-출고) 계산
-                stock_data = StockMovement.objects.filter(
-                    location__in=locations
-                ).values(
-                    'location_id', 'floor', 'product__name'
-                ).annotate(
-                    total_quantity=Sum(
-                        Case(
-                            When(movement_type='IN', then=F('quantity')),
-                            When(movement_type='OUT', then=-F('quantity')),
-                            default=0,
-                            output_field=IntegerField()
-                        )
-                    )
-                ).filter(total_quantity__gt=0)
-                
-                stocks_by_location = defaultdict(lambda: defaultdict(dict))
-                for stock in stock_data:
-                    stocks_by_location[stock['location_id']][stock['floor']][stock['product__name']] = stock['total_quantity']
+                # [수정] 현재고(입고-출고)는 StockBalance에서 바로 조회
+                stocks_by_location = _stocks_by_location(locations)
 
                 for loc in locations:
                     floors_status = []
@@ -188,44 +172,38 @@ def stock_out_view(request):
             try:
                 location_obj = Location.objects.get(pk=location_id)
 
-                # 재고 확인 로직은 복잡하므로 여기서는 단순화하여 전체 수량만 체크하거나
-                # 또는 마이너스 재고 허용 여부에 따라 다름. 일단은 진행.
-                # 실제로는 해당 위치의 해당 상품 재고를 확인해야 함.
-                
-                # [중요] 해당 위치의 해당 상품 재고 확인
-                current_stock_qs = StockMovement.objects.filter(
+                # [중요] 해당 위치의 해당 상품 재고 행을 잠그고 확인
+                # 같은 상품/위치/층을 동시에 출고하는 요청만 순서대로 처리되고, 다른 위치의 작업은 막지 않습니다.
+                # (잠금을 지원하지 않는 SQLite에서도 StockBalance의 조건부 차감이 음수 재고를 막습니다.)
+                current_stock = StockBalance.objects.select_for_update().filter(
                     location=location_obj,
                     floor=floor_num,
                     product=product
-                ).aggregate(
-                    total=Sum(
-                        Case(
-                            When(movement_type='IN', then=F('quantity')),
-                            When(movement_type='OUT', then=-F('quantity')),
-                            default=0,
-                            output_field=IntegerField()
-                        )
-                    )
-                )
-                current_stock = current_stock_qs['total'] or 0
+                ).values_list('quantity', flat=True).first() or 0
                 
                 if current_stock < quantity:
                      messages.error(request, f"재고 부족! 현재고: {current_stock}개, 요청: {quantity}개")
                 else:
-                    product.quantity = F('quantity') - quantity
-                    product.save(update_fields=['quantity'])
-
-                    StockMovement.objects.create(
-                        product=product,
-                        location=location_obj,
-                        movement_type='OUT',
-                        quantity=quantity,
-                        floor=floor_num,
-                        box_size=product.box_size,
-                        memo=memo
-                    )
-                    messages.success(request, f"'{product.name}' {quantity}개 출고 처리 완료.")
-                    return redirect('stock:out_bound')
+                    try:
+                        with transaction.atomic():
+                            StockMovement.objects.create(
+                                product=product,
+                                location=location_obj,
+                                movement_type='OUT',
+                                quantity=quantity,
+                                floor=floor_num,
+                                box_size=product.box_size,
+                                memo=memo
+                            )
+
+                            product.quantity = F('quantity') - quantity
+                            product.save(update_fields=['quantity'])
+                    except InsufficientStockError as e:
+                        # 확인 이후 다른 작업자가 먼저 출고한 경우
+                        messages.error(request, str(e))
+                    else:
+                        messages.success(request, f"'{product.name}' {quantity}개 출고 처리 완료.")
+                        return redirect('stock:out_bound')
             except Location.DoesNotExist:
                 messages.error(request, "선택된 위치 정보를 찾을 수 없습니다.")
         else:
@@ -312,7 +290,12 @@ def location_update_view(request, pk):
 @require_POST
 def location_delete_view(request, pk):
     location = get_object_or_404(Location, pk=pk)
-    location.delete()
+    with transaction.atomic():
+        # 위치가 삭제되면 입출고 기록은 '위치 없음'으로 남으므로 해당 상품의 현재고를 다시 합산합니다.
+        product_ids = list(StockBalance.objects.filter(location=location).values_list('product_id', flat=True).distinct())
+        location.delete()
+        if product_ids:
+            StockBalance.rebuild(product_ids)
     messages.success(request, '재고 위치가 삭제되었습니다.')
     return redirect('stock:location_manage')
 
@@ -357,7 +340,10 @@ def stock_chart_data_api(request):
         end_date = date.today()
         start_date = end_date - timedelta(days=6)
     labels = [(start_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end_date - start_date).days + 1)]
-    movements = StockMovement.objects.filter(timestamp__date__range=[start_date, end_date]).values('timestamp__date', 'movement_type').annotate(total_quantity=Sum('quantity')).order_by('timestamp__date')
+    # [수정] 입출고가 반영될 때까지 'stock' 캐시 사용
+    movements = stock_cache.get_or_set(f"movement_chart:{start_date}:{end_date}", lambda: list(
+        StockMovement.objects.filter(timestamp__date__range=[start_date, end_date]).values('timestamp__date', 'movement_type').annotate(total_quantity=Sum('quantity')).order_by('timestamp__date')
+    ))
     daily_data = {label: {'IN': 0, 'OUT': 0} for label in labels}
     for m in movements:
         date_str = m['timestamp__date'].strftime('%Y-%m-%d')
@@ -388,23 +374,17 @@ def shipper_stock_chart_api(request):
     # 화주사별로 관련된 상품들의 총 입고-출고 합계를 구함
     
     # 1. 모든 화주사 가져오기
-    # 2. 각 화주사의 모든 Product의 StockMovement 합산 (IN - OUT)
-    # 효율성을 위해 StockMovement에서 Group By shipper
+    # 2. 각 화주사의 모든 Product의 현재고(StockBalance) 합산
+    # 효율성을 위해 입출고 원장 대신 위치별 현재고(StockBalance)에서 Group By shipper
     
-    # Note: StockMovement -> Product -> Shipper 관계
+    # Note: StockBalance -> Product -> Shipper 관계
     
-    stock_by_shipper = StockMovement.objects.values(
+    # [수정] 현재고가 바뀔 때까지 'stock' 캐시 사용
+    stock_by_shipper = stock_cache.get_or_set('shipper_stock_chart', lambda: list(StockBalance.objects.values(
         'product__shipper__name'
     ).annotate(
-        total_stock=Sum(
-            Case(
-                When(movement_type='IN', then=F('quantity')),
-                When(movement_type='OUT', then=-F('quantity')),
-                default=0,
-                output_field=IntegerField()
-            )
-        )
-    ).filter(total_stock__gt=0).order_by('-total_stock')
+        total_stock=Sum('quantity')
+    ).filter(total_stock__gt=0).order_by('-total_stock')))
 
     labels = []
     data = []
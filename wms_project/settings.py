@@ -64,12 +64,44 @@ TEMPLATES = [
 WSGI_APPLICATION = 'wms_project.wsgi.application'
 
 # Database
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# [수정] WMS_DB_ENGINE 환경 변수로 데이터베이스를 고릅니다.
+#   sqlite (기본값): WMS_DB_NAME 경로(기본 BASE_DIR/db.sqlite3)의 파일
+#     연결할 때 WAL 저널 모드와 synchronous=NORMAL을 켜고, 쓰기 트랜잭션을 IMMEDIATE로 시작합니다.
+#     긴 쓰기 트랜잭션(엑셀 업로드, 송장 출고) 중에도 읽기는 막히지 않으며,
+#     다른 쓰기는 잠금 오류 대신 최대 WMS_SQLITE_BUSY_TIMEOUT(초)까지 차례를 기다립니다.
+#   postgres: WMS_DB_NAME/USER/PASSWORD/HOST/PORT (psycopg 패키지 필요)
+#     연결을 WMS_DB_CONN_MAX_AGE(초) 동안 재사용하며, 재사용 전에 끊긴 연결인지 확인합니다.
+DB_ENGINE = os.environ.get('WMS_DB_ENGINE', 'sqlite')
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('WMS_DB_NAME', 'wms'),
+            'USER': os.environ.get('WMS_DB_USER', 'wms'),
+            'PASSWORD': os.environ.get('WMS_DB_PASSWORD', ''),
+            'HOST': os.environ.get('WMS_DB_HOST', '127.0.0.1'),
+            'PORT': os.environ.get('WMS_DB_PORT', '5432'),
+            'CONN_MAX_AGE': int(os.environ.get('WMS_DB_CONN_MAX_AGE', '60')),
+            'CONN_HEALTH_CHECKS': True,
+        }
     }
-}
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('WMS_DB_NAME', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # 다른 연결이 쓰는 중이면 이 시간(초)까지 기다립니다. (busy timeout)
+                'timeout': int(os.environ.get('WMS_SQLITE_BUSY_TIMEOUT', '20')),
+                # 읽고 나서 쓰는 트랜잭션이 잠금 승격에 실패하지 않도록 시작할 때 쓰기 잠금을 잡습니다.
+                'transaction_mode': 'IMMEDIATE',
+                'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            },
+        }
+    }
+else:
+    from django.core.exceptions import ImproperlyConfigured
+    raise ImproperlyConfigured(f"WMS_DB_ENGINE은 sqlite, postgres 중 하나여야 합니다: {DB_ENGINE}")
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = []
@@ -85,6 +117,24 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
+# [추가] collectstatic으로 모은 정적 파일 위치 (운영 서버 실행 시 run_wifi.py가 자동으로 모읍니다)
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+# [추가] whitenoise 패키지가 있으면 정적 파일을 Django 뷰를 거치지 않고 미들웨어에서 바로 응답합니다.
+# (압축본 제공 + 캐시 헤더. gunicorn/waitress로 실행할 때 정적 파일 요청이 워커를 오래 잡지 않도록)
+try:
+    import whitenoise  # noqa: F401
+except ImportError:
+    pass
+else:
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+        'whitenoise.middleware.WhiteNoiseMiddleware',
+    )
+    STORAGES = {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage'},
+    }
 
 # Custom User Model 설정
 AUTH_USER_MODEL = 'users.User'
@@ -95,11 +145,41 @@ LOGIN_REDIRECT_URL = 'core:dashboard'
 LOGOUT_REDIRECT_URL = 'users:login'
 
 # 캐시 설정
-CACHES = {
-    'default': {
+# [수정] WMS_CACHE_BACKEND 환경 변수로 저장소를 고릅니다. (WMS_CACHE_LOCATION으로 위치 변경)
+#   locmem: 프로세스마다 따로 (기본값, 개발용)
+#   file:   같은 서버의 모든 워커가 공유 (기본 위치: BASE_DIR/cache)
+#   redis:  여러 서버의 워커가 공유 (Redis 호환 서버, redis 패키지 필요. 기본 위치: redis://127.0.0.1:6379/1)
+CACHE_BACKEND = os.environ.get('WMS_CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND == 'redis':
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('WMS_CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    }
+elif CACHE_BACKEND == 'file':
+    _default_cache = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('WMS_CACHE_LOCATION', os.path.join(BASE_DIR, 'cache')),
+    }
+elif CACHE_BACKEND == 'locmem':
+    _default_cache = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+        'LOCATION': os.environ.get('WMS_CACHE_LOCATION', 'unique-snowflake'),
     }
+else:
+    from django.core.exceptions import ImproperlyConfigured
+    raise ImproperlyConfigured(f"WMS_CACHE_BACKEND는 locmem, file, redis 중 하나여야 합니다: {CACHE_BACKEND}")
+CACHES = {
+    # 같은 캐시 서버를 다른 프로젝트와 함께 써도 키가 겹치지 않도록 접두어를 붙입니다.
+    'default': {**_default_cache, 'KEY_PREFIX': 'wms'},
+}
+
+# 하위 시스템별 캐시 이름공간(core.cache)의 최대 보관 시간(초)
+# 원본이 바뀌면 시그널/저장 코드에서 이름공간 버전을 바꾸므로, 이 시간은 시그널이 없는 일괄 변경이 반영되는 최대 지연입니다.
+CACHE_NAMESPACE_TIMEOUTS = {
+    'filters': 600,     # 상단 센터/화주사 필터 목록
+    'products': 300,    # 상품 해석기 (화주사별 색인 버전 키는 만료 없음, 색인 자체는 PRODUCT_RESOLVER_CACHE_TIMEOUT)
+    'dashboards': 300,  # 주문 대시보드/차트
+    'stock': 300,       # 재고 차트
 }
 
 # --- [신규] 미디어 파일(사용자 업로드 파일) 설정 ---
@@ -107,4 +187,50 @@ CACHES = {
 MEDIA_URL = '/media/'
 
 # 사용자가 업로드한 파일을 실제 서버 컴퓨터의 어느 폴더에 저장할지 경로를 지정
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# --- 쇼핑몰 주문 수집 설정 ---
+# 채널 API를 동시에 호출할 최대 스레드 수
+ORDER_COLLECTOR_MAX_WORKERS = 8
+# 채널 하나의 API 호출이 시작된 뒤 응답을 기다리는 최대 시간(초)
+ORDER_COLLECTOR_FETCH_TIMEOUT = 60
+# 수집 커서가 없는 채널(최초 수집)에서 거슬러 올라가 조회할 시간(분)
+ORDER_COLLECTOR_INITIAL_LOOKBACK_MINUTES = 30
+# 한 번의 API 호출로 조회할 최대 구간(분). 장애로 밀린 구간은 이 크기로 나누어 따라잡습니다.
+ORDER_COLLECTOR_WINDOW_MINUTES = 60
+# 한 수집 사이클에서 채널당 조회할 최대 구간 수 (남은 구간은 다음 사이클에서 이어서 조회)
+ORDER_COLLECTOR_MAX_WINDOWS_PER_RUN = 12
+# 조회 스레드와 저장 단계 사이에 쌓아 둘 수 있는 최대 페이지 수 (대량 조회 시 메모리 상한)
+ORDER_COLLECTOR_PAGE_QUEUE_SIZE = 4
+
+# --- 쇼핑몰 API 전송(HTTP) 설정 ---
+# 호스트별로 유지할 최대 유휴 keep-alive 연결 수
+ORDER_API_POOL_MAX_IDLE_PER_HOST = 4
+# 요청 하나의 소켓 타임아웃(초)
+ORDER_API_TIMEOUT = 30
+# 429/5xx/연결 오류 시 최대 재시도 횟수
+ORDER_API_MAX_RETRIES = 3
+# 재시도 대기 시간: 0 ~ min(최대값, 기본값 * 2^시도) 사이 무작위 (Retry-After 헤더가 있으면 그 이상 대기)
+ORDER_API_RETRY_BACKOFF = 0.5
+ORDER_API_RETRY_BACKOFF_MAX = 30
+# 인증 토큰을 만료 몇 초 전에 미리 갱신할지 (수집 도중 만료되지 않도록 여유를 둠)
+ORDER_API_TOKEN_REFRESH_SKEW = 300
+
+# --- 주문 엑셀 업로드 설정 ---
+# 이 행 수 이상인 파일은 요청 안에서 처리하지 않고 백그라운드 작업(OrderImportJob)으로 등록
+ORDER_IMPORT_ASYNC_THRESHOLD_ROWS = 2000
+# 백그라운드 업로드 작업을 확인하는 주기(초)
+ORDER_IMPORT_POLL_INTERVAL = 10
+# [추가] RUNNING 작업의 처리 신호가 이 시간(초) 동안 없으면 워커가 중단된 것으로 보고 다른 워커가 이어서 처리합니다.
+# (한 청크를 저장하는 시간보다 충분히 길어야 합니다)
+ORDER_IMPORT_STALE_TIMEOUT = 600
+
+# --- 상품 해석기 설정 ---
+# 화주사별 상품 색인(바코드/상품명)의 최대 보관 시간(초). 시그널로 무효화되지 않는 일괄 변경도 이 시간 안에 반영됩니다.
+PRODUCT_RESOLVER_CACHE_TIMEOUT = 300
+
+# --- 주문 목록 설정 ---
+# 성공/오류 주문 목록에서 한 번에 불러오는 주문 수 (스크롤할 때마다 다음 페이지를 불러옴)
+ORDER_LIST_PAGE_SIZE = 100
+# 주문 목록 API에서 limit 파라미터로 요청할 수 있는 최대 주문 수
+ORDER_LIST_MAX_PAGE_SIZE = 500